@@ -0,0 +1,312 @@
+"""
+asyncio 기반 YouTube Data API 클라이언트 (선택사항)
+
+discovery 문서와 httplib2 없이 이 프로젝트가 사용하는 엔드포인트만 직접 호출합니다.
+(playlists.list, playlistItems.list/delete/insert, channels.list, videos.list)
+하나의 keep-alive 연결 풀을 공유하므로 한 프로세스에서 수백 개의 페이지 요청을
+동시에 진행할 수 있습니다. OAuth 인증 정보, 속도 제한기, 할당량 기록, 재시도 정책
+(오류 분류, Retry-After, 공용 차단기)은 YouTubeAPI와 공유합니다.
+
+참고: aiohttp는 HTTP/1.1 keep-alive 연결 풀을 사용합니다. (HTTP/2 미지원)
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+from google.auth.transport.requests import Request
+
+import config
+from page_index import PageIndex
+from quota import QuotaLedger, get_quota_ledger
+from rate_limiter import TokenBucket, get_rate_limiter
+from retry_policy import NETWORK, ErrorClass, RetryPolicy, get_retry_policy
+from youtube_api import YouTubeAPI
+
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+class AsyncHttpError(Exception):
+    """YouTube API가 오류 상태 코드를 반환한 경우"""
+
+    def __init__(self, status: int, reason: str, content: bytes, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.reason = reason
+        self.content = content
+        self.headers = headers or {}
+        super().__init__(f"HTTP {status} {reason}: {content[:200].decode('utf-8', 'replace')}")
+
+
+class AsyncYouTubeAPI:
+    """aiohttp 기반 YouTube Data API v3 클라이언트"""
+
+    def __init__(
+        self,
+        credentials=None,
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        quota_ledger: Optional[QuotaLedger] = None,
+        max_connections: int = 100,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        초기화
+
+        Args:
+            credentials: google.oauth2 Credentials (YouTubeAPI.credentials와 공유 가능)
+            api_key: API 키 (credentials가 없을 때 공개 데이터 조회용)
+            rate_limiter: API 호출 속도 제한기 (기본값: 프로세스 공용 제한기)
+            quota_ledger: 할당량 사용 기록 (기본값: 프로세스 공용 기록)
+            max_connections: 연결 풀 최대 연결 수
+            retry_policy: 요청 재시도 정책 (기본값: 차단기를 공유하는 프로세스 공용 정책)
+        """
+        self.credentials = credentials
+        self.api_key = api_key or config.YOUTUBE_API_KEY
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.quota_ledger = quota_ledger or get_quota_ledger()
+        self.max_connections = max_connections
+        self.retry_policy = retry_policy or get_retry_policy()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refresh_lock = asyncio.Lock()
+
+    @classmethod
+    def from_youtube_api(cls, youtube_api: YouTubeAPI, **kwargs) -> "AsyncYouTubeAPI":
+        """
+        동기 클라이언트의 OAuth 인증 정보, 속도 제한기, 할당량 기록, 재시도 정책을 공유하는 클라이언트 생성
+
+        Args:
+            youtube_api: 인증에 사용할 YouTubeAPI 인스턴스 (필요하면 OAuth 인증 수행)
+
+        Returns:
+            AsyncYouTubeAPI 인스턴스
+        """
+        youtube_api.get_service(require_oauth=True)
+        return cls(
+            credentials=youtube_api.credentials,
+            api_key=youtube_api.api_key,
+            rate_limiter=youtube_api.rate_limiter,
+            quota_ledger=youtube_api.quota_ledger,
+            retry_policy=youtube_api.retry_policy,
+            **kwargs
+        )
+
+    async def __aenter__(self) -> "AsyncYouTubeAPI":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={"Accept-Encoding": "gzip"}
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        if not self.credentials:
+            return {}
+        if not self.credentials.valid:
+            async with self._refresh_lock:
+                if not self.credentials.valid:
+                    # google-auth의 토큰 갱신은 동기 호출이므로 스레드에서 실행
+                    await asyncio.to_thread(self.credentials.refresh, Request())
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+
+    async def _wait_for_breaker(self) -> None:
+        breaker = self.retry_policy.breaker
+        # 차단기 대기는 스레드를 막는 호출이므로 열려 있을 때만 스레드에서 기다림
+        if breaker is not None and breaker.state != "closed":
+            await asyncio.to_thread(self.retry_policy.before_call)
+
+    async def _retry_or_raise(
+        self, error: Exception, error_class: ErrorClass, attempt: int, delay: Optional[float]
+    ) -> float:
+        """재시도할 오류면 정책의 대기 시간만큼 기다린 뒤 그 시간을 반환, 아니면 오류 발생"""
+        self.retry_policy.record(error_class)
+        if not self.retry_policy.should_retry(error_class, attempt):
+            raise error
+        delay = self.retry_policy.next_delay(error_class, delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    async def _request(
+        self,
+        method_name: str,
+        http_method: str,
+        resource: str,
+        params: Dict[str, Any],
+        body: Optional[Dict] = None,
+        etag: Optional[str] = None
+    ) -> Tuple[int, Optional[Dict]]:
+        """
+        속도 제한, 할당량 기록, 재시도 정책(429/5xx/네트워크 오류)을 거쳐 요청 실행
+
+        Returns:
+            (HTTP 상태 코드, 응답 JSON). 304 또는 204 응답이면 JSON은 None
+        """
+        await self.open()
+        query = {key: value for key, value in params.items() if value is not None}
+        if not self.credentials and self.api_key:
+            query["key"] = self.api_key
+
+        delay = None
+        attempt = 1
+        refreshed = False
+        while True:
+            headers = await self._auth_headers()
+            if etag:
+                headers["If-None-Match"] = etag
+
+            self.quota_ledger.check(method_name)
+            await self._wait_for_breaker()
+            await self.rate_limiter.acquire_async()
+            try:
+                async with self._session.request(
+                    http_method,
+                    f"{API_BASE_URL}/{resource}",
+                    params=query,
+                    json=body,
+                    headers=headers
+                ) as response:
+                    content = await response.read()
+                    status = response.status
+                    reason = response.reason or ""
+                    response_headers = dict(response.headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = await self._retry_or_raise(e, ErrorClass(NETWORK, reason=type(e).__name__), attempt, delay)
+                attempt += 1
+                continue
+
+            self.quota_ledger.record(method_name)
+            if status < 400:
+                self.retry_policy.record(None)
+                if status in (204, 304):
+                    return status, None
+                return status, json.loads(content) if content else None
+            if status == 401 and self.credentials and not refreshed:
+                # 만료 직전 토큰이 거부된 경우 한 번 갱신 후 재시도
+                refreshed = True
+                self.credentials.token = None
+                continue
+            error = AsyncHttpError(status, reason, content, response_headers)
+            delay = await self._retry_or_raise(error, self.retry_policy.classify(error), attempt, delay)
+            attempt += 1
+
+    async def list_playlists(self, **params) -> Dict:
+        _, data = await self._request("playlists.list", "GET", "playlists", params)
+        return data or {}
+
+    async def list_playlist_items(self, etag: Optional[str] = None, **params) -> Optional[Dict]:
+        """playlistItems.list 호출 (etag를 지정했고 변경이 없으면 None 반환)"""
+        _, data = await self._request("playlistItems.list", "GET", "playlistItems", params, etag=etag)
+        return data
+
+    async def list_channels(self, **params) -> Dict:
+        _, data = await self._request("channels.list", "GET", "channels", params)
+        return data or {}
+
+    async def list_videos(self, **params) -> Dict:
+        _, data = await self._request("videos.list", "GET", "videos", params)
+        return data or {}
+
+    async def delete_playlist_item(self, playlist_item_id: str) -> None:
+        await self._request("playlistItems.delete", "DELETE", "playlistItems", {"id": playlist_item_id})
+
+    async def insert_playlist_item(self, playlist_id: str, video_id: str, position: Optional[int] = None) -> Dict:
+        snippet: Dict[str, Any] = {
+            "playlistId": playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": video_id}
+        }
+        if position is not None:
+            snippet["position"] = position
+        _, data = await self._request(
+            "playlistItems.insert", "POST", "playlistItems", {"part": "snippet"}, body={"snippet": snippet}
+        )
+        return data or {}
+
+    async def iter_playlist_pages(
+        self,
+        playlist_id: str,
+        cached_pages: Optional[PageIndex] = None,
+        start_page_token: Optional[str] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        재생목록 영상을 페이지 단위로 조회 (YouTubeAPI.iter_playlist_pages와 동일한 페이지 형식)
+
+        Yields:
+            페이지 딕셔너리 (page_token, etag, next_page_token, videos, not_modified)
+        """
+        page_token = start_page_token
+        while True:
+            cached_etag = cached_pages.etag(page_token) if cached_pages is not None else None
+            response = await self.list_playlist_items(
+                etag=cached_etag,
+                part="snippet,contentDetails",
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=page_token
+            )
+            if response is None and cached_etag:
+                page = {**cached_pages.load(page_token), "not_modified": True}
+            else:
+                response = response or {}
+                page = {
+                    "page_token": page_token,
+                    "etag": response.get("etag", ""),
+                    "next_page_token": response.get("nextPageToken"),
+                    "videos": [
+                        video for video in map(YouTubeAPI._parse_playlist_item, response.get("items", []))
+                        if video is not None
+                    ],
+                    "not_modified": False
+                }
+            yield page
+
+            page_token = page.get("next_page_token")
+            if not page_token:
+                break
+
+    async def get_playlist_videos(self, playlist_id: str) -> AsyncIterator[Dict]:
+        """
+        재생목록의 모든 영상 조회 (YouTubeAPI.get_playlist_videos의 비동기 버전)
+
+        Yields:
+            영상 정보 딕셔너리
+        """
+        async for page in self.iter_playlist_pages(playlist_id):
+            for video in page["videos"]:
+                yield video
+
+    async def extract_playlists(
+        self, playlists: List[Dict], concurrency: int = 50
+    ) -> List[Tuple[Dict, Optional[List[Dict]], Optional[Exception]]]:
+        """
+        여러 재생목록을 동시에 추출 (결과는 입력 순서 유지)
+
+        Args:
+            playlists: 재생목록 정보 리스트
+            concurrency: 동시에 페이지네이션할 재생목록 수
+
+        Returns:
+            (재생목록 정보, 영상 리스트, 오류) 튜플 리스트
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def extract(playlist: Dict):
+            async with semaphore:
+                try:
+                    videos = [video async for video in self.get_playlist_videos(playlist["id"])]
+                    return playlist, videos, None
+                except Exception as e:
+                    return playlist, None, e
+
+        return list(await asyncio.gather(*(extract(playlist) for playlist in playlists)))
@@ -0,0 +1,71 @@
+"""
+Startup benchmark for YouTube service construction.
+
+Measures how long it takes to build the YouTube service object:
+- cold: discovery document read from the on-disk cache (new process)
+- warm: document already parsed in this process (worker clones, rebuilds)
+- baseline: googleapiclient.discovery.build(), which re-parses the document
+
+No network access or OAuth credentials are needed; a dummy developer key is used.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config  # noqa: E402
+import youtube_api  # noqa: E402
+from googleapiclient.discovery import build  # noqa: E402
+
+
+def _timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label, samples):
+    print(f"{label:<28} median {statistics.median(samples):8.2f} ms   max {max(samples):8.2f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="YouTube 서비스 객체 생성 시간을 측정합니다.")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수 (기본값: 20)")
+    args = parser.parse_args()
+
+    # 디스크 캐시가 없으면 먼저 만들어 둠
+    youtube_api.load_discovery_document()
+
+    def cold():
+        youtube_api._discovery_documents.clear()
+        youtube_api.build_service(developer_key="benchmark")
+
+    def warm():
+        youtube_api.build_service(developer_key="benchmark")
+
+    def baseline():
+        build(
+            config.YOUTUBE_API_SERVICE_NAME,
+            config.YOUTUBE_API_VERSION,
+            developerKey="benchmark",
+            cache_discovery=False,
+        )
+
+    _report("cold (disk cache)", _timed(cold, args.repeat))
+    youtube_api.load_discovery_document()
+    _report("warm (in-process cache)", _timed(warm, args.repeat))
+    _report("baseline build()", _timed(baseline, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""
+Append-only extraction checkpoint journal.
+
+Each playlist being extracted gets a JSONL journal under
+config.CHECKPOINT_DIR. Every completed playlistItems page is appended as one
+fsync'd line (page token, ETag, next page token and the parsed videos), so a
+crash or SIGINT loses at most the page that was in flight. A `--resume` run
+replays the journal and continues from the last recorded next page token
+without re-fetching finished pages; only the page offsets are kept in memory
+and each recorded page is read back from the journal as it is replayed. A
+torn trailing line from an interrupted write is ignored on load.
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from models import json_default
+from page_index import PageIndex
+
+
+@dataclass
+class ResumeState:
+    playlist_id: str
+    etag: Optional[str]
+    pages: PageIndex
+    complete: bool = False
+    # Byte length of the valid prefix; a torn tail is truncated before appending.
+    valid_size: int = 0
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        return self.pages.next_page_token
+
+    @property
+    def videos(self) -> Iterator[Dict]:
+        for page in self.pages.iter_pages():
+            yield from page["videos"]
+
+    def matches(self, playlist: Dict) -> bool:
+        """A journal is only resumable while the playlist itself is unchanged."""
+        return not self.etag or not playlist.get("etag") or self.etag == playlist.get("etag")
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournalWriter:
+    """Appends fsync'd records to one playlist journal."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _append(self, record: Dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=json_default) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def append_page(self, page: Dict) -> None:
+        self._append(
+            {
+                "type": "page",
+                "page_token": page.get("page_token"),
+                "etag": page.get("etag"),
+                "next_page_token": page.get("next_page_token"),
+                "videos": page.get("videos", []),
+            }
+        )
+
+    def mark_complete(self) -> None:
+        self._append({"type": "complete"})
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class CheckpointJournal:
+    """Per-playlist JSONL journals under `root`."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, playlist_id: str) -> Path:
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", playlist_id)
+        return self.root / f"{safe_id}.jsonl"
+
+    def load(self, playlist_id: str) -> Optional[ResumeState]:
+        path = self._path(playlist_id)
+        if not path.exists():
+            return None
+
+        state: Optional[ResumeState] = None
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash: everything before it is still valid.
+                    break
+                record_type = record.get("type")
+                if record_type == "begin":
+                    if record.get("playlist_id") != playlist_id:
+                        return None
+                    state = ResumeState(playlist_id=playlist_id, etag=record.get("etag"), pages=PageIndex(path))
+                elif state is None:
+                    return None
+                elif record_type == "page":
+                    state.pages.add(record, offset)
+                elif record_type == "complete":
+                    state.complete = True
+                offset += len(line)
+                state.valid_size = offset
+        return state
+
+    def start(self, playlist: Dict, resume_from: Optional[ResumeState] = None) -> JournalWriter:
+        """
+        Open the journal for appending. Without `resume_from` any previous
+        journal is atomically replaced by a fresh one holding only the header.
+        """
+        path = self._path(playlist["id"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_from is None:
+            header = {"type": "begin", "playlist_id": playlist["id"], "etag": playlist.get("etag")}
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(header, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            _fsync_dir(path.parent)
+        else:
+            with open(path, "r+b") as f:
+                f.truncate(resume_from.valid_size)
+        return JournalWriter(path)
+
+    def finalize(self, playlist_id: str) -> None:
+        """Drop the journal once the playlist has been exported (atomic unlink)."""
+        path = self._path(playlist_id)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        _fsync_dir(path.parent)
+
+    def pending_playlist_ids(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        ids = []
+        for path in sorted(self.root.glob("*.jsonl")):
+            with open(path, "r", encoding="utf-8") as f:
+                first_line = f.readline()
+            try:
+                ids.append(json.loads(first_line)["playlist_id"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+        return ids
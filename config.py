@@ -25,6 +25,46 @@ OUTPUT_FORMATS = os.getenv("OUTPUT_FORMAT", "json,markdown,html").split(",")
 
 # API 호출 제한 설정
 API_RATE_LIMIT = int(os.getenv("API_RATE_LIMIT", "10"))  # 초당 요청 수
+API_RATE_BURST = int(os.getenv("API_RATE_BURST", str(API_RATE_LIMIT)))  # 순간 최대 요청 수
+
+# API 요청 재시도 (429/5xx/네트워크 오류만 재시도, quotaExceeded는 재시도하지 않음)
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "5"))  # 첫 요청 포함 최대 시도 횟수
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "30"))  # 재시도 간 최대 대기 시간 (초, Retry-After에도 적용)
+# 연속 실패가 이 횟수에 도달하면 모든 워커가 CIRCUIT_BREAKER_RESET초 동안 요청을 멈춤
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RESET = float(os.getenv("CIRCUIT_BREAKER_RESET", "10"))
+
+# 일일 할당량 예산 (YouTube Data API 기본값: 10,000 units/day)
+QUOTA_DAILY_BUDGET = int(os.getenv("QUOTA_DAILY_BUDGET", "10000"))
+
+# 실행 상태 저장 디렉토리 (할당량 기록, 재생목록 스냅샷 등)
+STATE_DIR = Path(os.getenv("STATE_DIR", str(PROJECT_ROOT / ".state")))
+QUOTA_LEDGER_PATH = STATE_DIR / "quota_ledger.json"
+SNAPSHOT_DIR = STATE_DIR / "snapshots"  # 증분 추출용 재생목록 스냅샷
+CHECKPOINT_DIR = STATE_DIR / "checkpoints"  # 중단된 추출 재개용 페이지 저널
+DISCOVERY_CACHE_DIR = STATE_DIR / "discovery"  # YouTube API discovery 문서 캐시
+METADATA_CACHE_PATH = STATE_DIR / "metadata_cache.sqlite3"  # 영상 메타데이터 캐시
+JINJA_CACHE_DIR = STATE_DIR / "jinja"  # 컴파일된 HTML 템플릿 캐시
+
+# 영상 메타데이터 캐시에 보관할 최대 영상 수 (초과 시 오래 사용되지 않은 영상부터 삭제)
+METADATA_CACHE_MAX_ENTRIES = int(os.getenv("METADATA_CACHE_MAX_ENTRIES", "100000"))
+
+# 재생목록 추출 동시 실행 수 (1이면 기존 순차 처리)
+EXTRACT_CONCURRENCY = int(os.getenv("EXTRACT_CONCURRENCY", "1"))
+
+# 파일 출력 워커 수 (0이면 추출과 같은 스레드에서 저장) 및 실행 방식 (thread 또는 process)
+EXPORT_CONCURRENCY = int(os.getenv("EXPORT_CONCURRENCY", "1"))
+EXPORT_MODE = os.getenv("EXPORT_MODE", "thread")
+# 내용이 바뀌지 않은 출력 파일은 다시 쓰지 않음 (재생목록 폴더의 .export_manifest.json으로 판단)
+EXPORT_SKIP_UNCHANGED = os.getenv("EXPORT_SKIP_UNCHANGED", "true").lower() in ("1", "true", "yes")
+
+# Takeout 영상 CSV 파싱 프로세스 수 (0이면 CPU 수, 1이면 순차 파싱)
+TAKEOUT_PARSE_WORKERS = int(os.getenv("TAKEOUT_PARSE_WORKERS", "0"))
+
+# HTML 출력 방식 (single: 한 파일, paged: 여러 페이지 파일, virtual: 보이는 카드만 렌더링)
+HTML_MODE = os.getenv("HTML_MODE", "single")
+# paged 모드에서 한 페이지에 넣을 영상 수
+HTML_PAGE_SIZE = int(os.getenv("HTML_PAGE_SIZE", "100"))
 
 # YouTube API 엔드포인트
 YOUTUBE_API_SERVICE_NAME = "youtube"
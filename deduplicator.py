@@ -3,19 +3,33 @@ Local playlist duplicate analysis.
 
 This module reads an exported playlist JSON file and prepares a dry-run list of
 playlist item IDs that can be deleted later. It does not call the YouTube API.
+
+Several exports (or a whole output directory) can also be analyzed together to
+find the same video across playlists. One pass over the files builds a
+video ID -> occurrences index, and a keep policy picks the single occurrence
+to keep in each group.
 """
 import argparse
 import json
 import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from utils.json_stream import JSONArrayStream
 
 
 VIDEO_ID_KEYS = ("videoId", "video_id")
 PLAYLIST_ITEM_ID_KEYS = ("playlistItemId", "playlist_item_id")
+PLAYLIST_ID_KEYS = ("playlist_id", "playlistId", "id")
+ADDED_AT_KEYS = ("added_at", "addedAt")
 ITEMS_KEYS = ("items", "videos")
+# priority: keep the copy in the highest-priority playlist
+# oldest / newest: keep the copy added first / last
+KEEP_POLICIES = ("priority", "oldest", "newest")
 
 
 @dataclass
@@ -26,9 +40,19 @@ class DeduplicationResult:
     keep_list: List[str]
     delete_list: List[str]
     duplicate_groups: List[Dict[str, Any]]
+    policy: Optional[str] = None
+    playlists: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class PlaylistOccurrence(NamedTuple):
+    playlist_index: int
+    playlist_item_id: Optional[str]
+    position: int
+    added_at: Optional[float]
+    title: str
 
 
-def _first_value(item: Dict[str, Any], keys: tuple[str, ...]) -> Optional[Any]:
+def _first_value(item: Mapping, keys: tuple[str, ...]) -> Optional[Any]:
     for key in keys:
         value = item.get(key)
         if value not in (None, ""):
@@ -36,15 +60,77 @@ def _first_value(item: Dict[str, Any], keys: tuple[str, ...]) -> Optional[Any]:
     return None
 
 
-def _load_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    for key in ITEMS_KEYS:
-        value = data.get(key)
-        if isinstance(value, list):
-            return value
-    raise ValueError("JSON 파일에서 items 또는 videos 배열을 찾을 수 없습니다.")
+def _collect_occurrences(
+    items: Iterable[Any],
+    playlist_index: int,
+    index: Dict[str, List[PlaylistOccurrence]],
+    seen_item_ids: Set[str],
+) -> int:
+    """
+    Add items (dicts or PlaylistItem) to the video ID -> occurrences index.
+
+    Each item is reduced to a PlaylistOccurrence; the title is only kept for
+    items without a playlist item ID (for the error report), so full items are
+    never retained. An item whose playlist item ID is already in
+    ``seen_item_ids`` is the same entry read again (an export given twice or
+    copied) and is skipped, so one entry can never be both kept and deleted.
+
+    Returns:
+        The number of items read, not counting skipped repeats.
+    """
+    item_count = 0
+    for item_index, item in enumerate(items):
+        if not isinstance(item, Mapping):
+            item_count += 1
+            continue
+
+        playlist_item_id = _first_value(item, PLAYLIST_ITEM_ID_KEYS)
+        if playlist_item_id:
+            playlist_item_id = str(playlist_item_id)
+            if playlist_item_id in seen_item_ids:
+                continue
+            seen_item_ids.add(playlist_item_id)
+        item_count += 1
 
+        video_id = _first_value(item, VIDEO_ID_KEYS)
+        if not video_id:
+            continue
 
-def _position(item: Dict[str, Any], fallback: int) -> int:
+        index[str(video_id)].append(
+            PlaylistOccurrence(
+                playlist_index,
+                playlist_item_id or None,
+                _position(item, item_index),
+                _added_timestamp(item),
+                "" if playlist_item_id else item.get("title", ""),
+            )
+        )
+    return item_count
+
+
+def _read_occurrences(
+    input_path: Path,
+    playlist_index: int,
+    index: Dict[str, List[PlaylistOccurrence]],
+    seen_item_ids: Set[str],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Stream one export file into the video ID -> occurrences index.
+
+    Returns:
+        The export's top-level members other than the items array, and the
+        number of items read.
+    """
+    with open(input_path, "r", encoding="utf-8") as f:
+        stream = JSONArrayStream(f, ITEMS_KEYS)
+        item_count = _collect_occurrences(stream, playlist_index, index, seen_item_ids)
+
+    if stream.array_key is None:
+        raise ValueError("JSON 파일에서 items 또는 videos 배열을 찾을 수 없습니다.")
+    return stream.header, item_count
+
+
+def _position(item: Mapping, fallback: int) -> int:
     value = item.get("position", fallback)
     try:
         return int(value)
@@ -52,6 +138,29 @@ def _position(item: Dict[str, Any], fallback: int) -> int:
         return fallback
 
 
+def _added_timestamp(item: Mapping) -> Optional[float]:
+    value = _first_value(item, ADDED_AT_KEYS)
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace(" UTC", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _raise_missing_ids(missing_keep_ids: List[Dict[str, Any]], missing_delete_ids: List[Dict[str, Any]]) -> None:
+    if missing_keep_ids or missing_delete_ids:
+        sample = {
+            "missing_keep_ids": missing_keep_ids[:5],
+            "missing_delete_ids": missing_delete_ids[:5],
+        }
+        raise ValueError(
+            "중복 그룹 중 playlistItemId/playlist_item_id가 없는 항목이 있습니다. "
+            "실제 삭제에는 playlist item ID가 필요하므로 최신 코드로 재추출한 JSON을 사용하세요. "
+            f"누락 예시: {sample}"
+        )
+
+
 def analyze_playlist_json(input_path: Path) -> DeduplicationResult:
     """
     Analyze duplicate videos in a playlist export JSON file.
@@ -66,26 +175,26 @@ def analyze_playlist_json(input_path: Path) -> DeduplicationResult:
     Raises:
         ValueError: If duplicate entries cannot be mapped to playlist item IDs.
     """
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    grouped: Dict[str, List[PlaylistOccurrence]] = defaultdict(list)
+    _, total_count = _read_occurrences(input_path, 0, grouped, set())
+    return _keep_first_positions(grouped, total_count)
 
-    items = _load_items(data)
-    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
-    for index, item in enumerate(items):
-        if not isinstance(item, dict):
-            continue
+def analyze_playlist_items(items: Iterable[Any]) -> DeduplicationResult:
+    """
+    Analyze duplicate videos in one playlist's in-memory items.
 
-        video_id = _first_value(item, VIDEO_ID_KEYS)
-        if not video_id:
-            continue
+    Accepts the same items the extractor and Takeout parser produce (dicts or
+    models.PlaylistItem) and applies the same rule as analyze_playlist_json.
+    """
+    grouped: Dict[str, List[PlaylistOccurrence]] = defaultdict(list)
+    total_count = _collect_occurrences(items, 0, grouped, set())
+    return _keep_first_positions(grouped, total_count)
 
-        normalized = dict(item)
-        normalized["_position"] = _position(item, index)
-        normalized["_playlist_item_id"] = _first_value(item, PLAYLIST_ITEM_ID_KEYS)
-        normalized["_source_index"] = index
-        grouped[str(video_id)].append(normalized)
 
+def _keep_first_positions(
+    grouped: Dict[str, List[PlaylistOccurrence]], total_count: int
+) -> DeduplicationResult:
     keep_list: List[str] = []
     delete_list: List[str] = []
     duplicate_groups: List[Dict[str, Any]] = []
@@ -93,17 +202,15 @@ def analyze_playlist_json(input_path: Path) -> DeduplicationResult:
     missing_delete_ids: List[Dict[str, Any]] = []
 
     for video_id, group in grouped.items():
-        sorted_group = sorted(
-            group,
-            key=lambda item: (item["_position"], item["_source_index"]),
-        )
+        # The sort is stable, so equal positions keep their order in the file.
+        group.sort(key=lambda occurrence: occurrence.position)
 
-        keep_item = sorted_group[0]
-        keep_id = keep_item.get("_playlist_item_id")
+        keep_item = group[0]
+        keep_id = keep_item.playlist_item_id
         if keep_id:
-            keep_list.append(str(keep_id))
+            keep_list.append(keep_id)
 
-        duplicates = sorted_group[1:]
+        duplicates = group[1:]
         if not duplicates:
             continue
 
@@ -111,70 +218,243 @@ def analyze_playlist_json(input_path: Path) -> DeduplicationResult:
             missing_keep_ids.append(
                 {
                     "videoId": video_id,
-                    "position": keep_item["_position"],
-                    "title": keep_item.get("title", ""),
+                    "position": keep_item.position,
+                    "title": keep_item.title,
                 }
             )
 
         group_delete_ids: List[str] = []
         for duplicate in duplicates:
-            playlist_item_id = duplicate.get("_playlist_item_id")
-            if playlist_item_id:
-                delete_id = str(playlist_item_id)
-                delete_list.append(delete_id)
-                group_delete_ids.append(delete_id)
+            if duplicate.playlist_item_id:
+                delete_list.append(duplicate.playlist_item_id)
+                group_delete_ids.append(duplicate.playlist_item_id)
             else:
                 missing_delete_ids.append(
                     {
                         "videoId": video_id,
-                        "position": duplicate["_position"],
-                        "title": duplicate.get("title", ""),
+                        "position": duplicate.position,
+                        "title": duplicate.title,
                     }
                 )
 
         duplicate_groups.append(
             {
                 "videoId": video_id,
-                "keepPlaylistItemId": str(keep_id) if keep_id else None,
-                "keepPosition": keep_item["_position"],
+                "keepPlaylistItemId": keep_id,
+                "keepPosition": keep_item.position,
                 "deletePlaylistItemIds": group_delete_ids,
                 "duplicateCount": len(duplicates),
             }
         )
 
-    if missing_keep_ids or missing_delete_ids:
-        sample = {
-            "missing_keep_ids": missing_keep_ids[:5],
-            "missing_delete_ids": missing_delete_ids[:5],
+    _raise_missing_ids(missing_keep_ids, missing_delete_ids)
+
+    return DeduplicationResult(
+        total_count=total_count,
+        unique_count=len(grouped),
+        duplicate_count=len(delete_list),
+        keep_list=keep_list,
+        delete_list=delete_list,
+        duplicate_groups=duplicate_groups,
+    )
+
+
+def find_playlist_exports(paths: Iterable[Path]) -> List[Path]:
+    """
+    Expand input paths into playlist export files.
+
+    Files are used as given. A directory is treated as an output directory and
+    contributes every <name>/<name>.json export inside it, in name order.
+    A file reached more than once (repeated or overlapping inputs) is listed
+    only the first time.
+    """
+    exports: List[Path] = []
+    seen: Set[Path] = set()
+
+    def add(path: Path) -> None:
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            exports.append(path)
+
+    for path in paths:
+        if path.is_dir():
+            for playlist_dir in sorted(child for child in path.iterdir() if child.is_dir()):
+                json_path = playlist_dir / f"{playlist_dir.name}.json"
+                if json_path.is_file():
+                    add(json_path)
+        else:
+            add(path)
+    return exports
+
+
+def _keep_key(policy: str, ranks: List[int]):
+    if policy == "priority":
+        return lambda occurrence: (ranks[occurrence.playlist_index], occurrence.position)
+    if policy == "oldest":
+        return lambda occurrence: (
+            occurrence.added_at is None,
+            occurrence.added_at or 0.0,
+            ranks[occurrence.playlist_index],
+            occurrence.position,
+        )
+    if policy == "newest":
+        return lambda occurrence: (
+            occurrence.added_at is None,
+            -(occurrence.added_at or 0.0),
+            ranks[occurrence.playlist_index],
+            occurrence.position,
+        )
+    raise ValueError(f"알 수 없는 보존 정책입니다: {policy} ({', '.join(KEEP_POLICIES)})")
+
+
+def analyze_playlist_exports(
+    input_paths: Iterable[Path],
+    policy: str = "priority",
+    priority: Sequence[str] = (),
+) -> DeduplicationResult:
+    """
+    Analyze duplicate videos across several playlist export JSON files.
+
+    Files are streamed one item at a time; only a compact occurrence tuple per
+    item is kept, so time and memory grow linearly with the number of items.
+
+    Args:
+        input_paths: Playlist export JSON files.
+        policy: Keep policy, one of KEEP_POLICIES. Ties fall back to playlist
+            priority and then to the lowest position.
+        priority: Playlist IDs or titles, highest priority first. Playlists not
+            listed rank after these, in input order.
+
+    Returns:
+        DeduplicationResult whose delete_list can be passed to deleter.py.
+
+    Raises:
+        ValueError: If duplicate entries cannot be mapped to playlist item IDs.
+    """
+    playlists: List[Dict[str, Any]] = []
+    index: Dict[str, List[PlaylistOccurrence]] = defaultdict(list)
+    seen_item_ids: Set[str] = set()
+    total_count = 0
+
+    for input_path in input_paths:
+        header, item_count = _read_occurrences(input_path, len(playlists), index, seen_item_ids)
+        playlist_id = _first_value(header, PLAYLIST_ID_KEYS)
+        playlists.append(
+            {
+                "playlistId": str(playlist_id) if playlist_id else None,
+                "title": header.get("title") or input_path.stem,
+                "sourceFile": str(input_path),
+            }
+        )
+        total_count += item_count
+
+    ranked = {name: rank for rank, name in reversed(list(enumerate(priority)))}
+    ranks = [
+        min(
+            ranked.get(playlist["playlistId"], len(priority) + playlist_index),
+            ranked.get(playlist["title"], len(priority) + playlist_index),
+        )
+        for playlist_index, playlist in enumerate(playlists)
+    ]
+    keep_key = _keep_key(policy, ranks)
+
+    keep_list: List[str] = []
+    delete_list: List[str] = []
+    duplicate_groups: List[Dict[str, Any]] = []
+    missing_keep_ids: List[Dict[str, Any]] = []
+    missing_delete_ids: List[Dict[str, Any]] = []
+
+    def describe(video_id: str, occurrence: PlaylistOccurrence) -> Dict[str, Any]:
+        return {
+            "videoId": video_id,
+            "playlistId": playlists[occurrence.playlist_index]["playlistId"],
+            "position": occurrence.position,
+            "title": occurrence.title,
         }
-        raise ValueError(
-            "중복 그룹 중 playlistItemId/playlist_item_id가 없는 항목이 있습니다. "
-            "실제 삭제에는 playlist item ID가 필요하므로 최신 코드로 재추출한 JSON을 사용하세요. "
-            f"누락 예시: {sample}"
+
+    for video_id, group in index.items():
+        if len(group) == 1:
+            if group[0].playlist_item_id:
+                keep_list.append(group[0].playlist_item_id)
+            continue
+
+        group.sort(key=keep_key)
+        keep_item, duplicates = group[0], group[1:]
+        if keep_item.playlist_item_id:
+            keep_list.append(keep_item.playlist_item_id)
+        else:
+            missing_keep_ids.append(describe(video_id, keep_item))
+
+        group_delete_ids: List[str] = []
+        delete_items: List[Dict[str, Any]] = []
+        for duplicate in duplicates:
+            if duplicate.playlist_item_id:
+                delete_list.append(duplicate.playlist_item_id)
+                group_delete_ids.append(duplicate.playlist_item_id)
+                delete_items.append(
+                    {
+                        "playlistId": playlists[duplicate.playlist_index]["playlistId"],
+                        "playlistItemId": duplicate.playlist_item_id,
+                        "position": duplicate.position,
+                    }
+                )
+            else:
+                missing_delete_ids.append(describe(video_id, duplicate))
+
+        duplicate_groups.append(
+            {
+                "videoId": video_id,
+                "keepPlaylistId": playlists[keep_item.playlist_index]["playlistId"],
+                "keepPlaylistItemId": keep_item.playlist_item_id,
+                "keepPosition": keep_item.position,
+                "deletePlaylistItemIds": group_delete_ids,
+                "deleteItems": delete_items,
+                "duplicateCount": len(duplicates),
+            }
         )
 
+    _raise_missing_ids(missing_keep_ids, missing_delete_ids)
+
     return DeduplicationResult(
-        total_count=len(items),
-        unique_count=len(grouped),
+        total_count=total_count,
+        unique_count=len(index),
         duplicate_count=len(delete_list),
         keep_list=keep_list,
         delete_list=delete_list,
         duplicate_groups=duplicate_groups,
+        policy=policy,
+        playlists=playlists,
     )
 
 
-def write_dry_run_output(result: DeduplicationResult, output_path: Path, input_path: Path) -> None:
-    output = {
-        "source_file": str(input_path),
+def write_dry_run_output(
+    result: DeduplicationResult,
+    output_path: Path,
+    input_path: Union[Path, Sequence[Path]],
+) -> None:
+    if isinstance(input_path, Path):
+        source_file = str(input_path)
+    else:
+        source_file = ", ".join(str(path) for path in input_path)
+    output: Dict[str, Any] = {
+        "source_file": source_file,
         "summary": {
             "total_count": result.total_count,
             "unique_count": result.unique_count,
             "duplicate_count": result.duplicate_count,
         },
-        "keep_list": result.keep_list,
-        "delete_list": result.delete_list,
-        "duplicate_groups": result.duplicate_groups,
     }
+    if result.policy is not None:
+        output["policy"] = result.policy
+        output["playlists"] = result.playlists
+    output.update(
+        {
+            "keep_list": result.keep_list,
+            "delete_list": result.delete_list,
+            "duplicate_groups": result.duplicate_groups,
+        }
+    )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
@@ -183,6 +463,8 @@ def write_dry_run_output(result: DeduplicationResult, output_path: Path, input_p
 
 def print_summary(result: DeduplicationResult, output_path: Path) -> None:
     print("중복 분석 완료")
+    if result.playlists:
+        print(f"- 분석한 재생목록 수: {len(result.playlists)} (보존 정책: {result.policy})")
     print(f"- 총 분석한 영상 수: {result.total_count}")
     print(f"- 고유한 영상 수: {result.unique_count}")
     print(f"- 삭제 예정인 중복 영상 수: {result.duplicate_count}")
@@ -196,7 +478,8 @@ def main() -> int:
     parser.add_argument(
         "input_json",
         type=Path,
-        help="분석할 재생목록 JSON 파일 경로",
+        nargs="+",
+        help="분석할 재생목록 JSON 파일 경로 (여러 파일이나 출력 디렉토리를 지정하면 재생목록 간 중복 분석)",
     )
     parser.add_argument(
         "--output",
@@ -204,12 +487,35 @@ def main() -> int:
         default=Path("target_to_delete.json"),
         help="dry-run 삭제 대상 JSON 출력 경로 (기본값: ./target_to_delete.json)",
     )
+    parser.add_argument(
+        "--policy",
+        choices=KEEP_POLICIES,
+        default="priority",
+        help="재생목록 간 중복 시 보존할 항목 (priority: 우선순위가 가장 높은 재생목록, "
+        "oldest: 가장 먼저 추가된 항목, newest: 가장 나중에 추가된 항목, 기본값: priority)",
+    )
+    parser.add_argument(
+        "--priority",
+        type=str,
+        default="",
+        help="재생목록 우선순위 (쉼표로 구분한 재생목록 ID 또는 제목, 앞쪽이 높음. 나머지는 입력 순서)",
+    )
 
     args = parser.parse_args()
 
     try:
-        result = analyze_playlist_json(args.input_json)
-        write_dry_run_output(result, args.output, args.input_json)
+        inputs = args.input_json
+        if len(inputs) == 1 and not inputs[0].is_dir():
+            result = analyze_playlist_json(inputs[0])
+            source = inputs[0]
+        else:
+            exports = find_playlist_exports(inputs)
+            if not exports:
+                raise ValueError("분석할 재생목록 JSON 파일을 찾을 수 없습니다.")
+            priority = [name.strip() for name in args.priority.split(",") if name.strip()]
+            result = analyze_playlist_exports(exports, policy=args.policy, priority=priority)
+            source = inputs[0] if len(inputs) == 1 else inputs
+        write_dry_run_output(result, args.output, source)
         print_summary(result, args.output)
         return 0
     except Exception as e:
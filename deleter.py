@@ -8,10 +8,17 @@ import argparse
 import json
 import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from deletion_journal import DeletionJournal, load_deleted_ids
+from quota import DELETE_METHOD, QuotaBudgetExceeded, QuotaLedger, QuotaScheduler, format_plan, get_quota_ledger
+from rate_limiter import AdaptiveRate, TokenBucket, configure_rate_limiter, get_rate_limiter
+from retry_policy import THROTTLED, ErrorClass, RetryPolicy, classify_error
 
 try:
     from googleapiclient.errors import HttpError
@@ -23,6 +30,10 @@ except ModuleNotFoundError:
         content = None
 
 
+# 배치 요청 하나에 넣을 수 있는 최대 삭제 요청 수
+MAX_BATCH_SIZE = 50
+
+
 def load_target_file(path: Path) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -35,26 +46,8 @@ def load_target_file(path: Path) -> Dict[str, Any]:
 
 
 def load_successful_playlist_item_ids(log_dir: Path) -> set[str]:
-    successful_ids: set[str] = set()
-
-    for path in sorted(log_dir.glob("deletion_success_*.json")):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                records = json.load(f)
-        except (OSError, json.JSONDecodeError):
-            continue
-
-        if not isinstance(records, list):
-            continue
-
-        for record in records:
-            if not isinstance(record, dict):
-                continue
-            playlist_item_id = record.get("playlistItemId")
-            if playlist_item_id not in (None, ""):
-                successful_ids.add(str(playlist_item_id))
-
-    return successful_ids
+    """삭제 성공 저널과 아직 저널로 옮기지 않은 deletion_success_*.json 로그의 항목 ID"""
+    return load_deleted_ids(log_dir)
 
 
 def pending_targets(delete_list: List[Any], successful_ids: set[str], ignore_success_log: bool) -> List[str]:
@@ -81,6 +74,7 @@ def print_plan(
     successful_count: int,
     pending_count: int,
     ignore_success_log: bool,
+    deferred_count: int = 0,
 ) -> None:
     summary = target_data.get("summary", {})
     source_file = target_data.get("source_file", "N/A")
@@ -95,7 +89,12 @@ def print_plan(
     print(f"- 성공 로그 기반 제외: {'사용 안 함' if ignore_success_log else '사용'}")
     print(f"- 이미 삭제 성공 로그에 있는 개수: {successful_count}")
     print(f"- 이번 실행 가능 잔여 개수: {pending_count}")
-    print(f"- limit 적용 후 실제 요청 개수: {len(targets)}")
+    if deferred_count:
+        print(f"- limit 적용 후 요청 개수: {len(targets) + deferred_count}")
+        print(f"- 할당량 부족으로 다음 실행으로 미룬 개수: {deferred_count}")
+        print(f"- 이번 실행 실제 요청 개수: {len(targets)}")
+    else:
+        print(f"- limit 적용 후 실제 요청 개수: {len(targets)}")
 
 
 def confirm_execution() -> bool:
@@ -151,46 +150,335 @@ def progress_iter(items: List[str]) -> Iterable[str]:
         return items
 
 
-def delete_playlist_items(service, playlist_item_ids: List[str], delay: float) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-    successes: List[Dict[str, Any]] = []
-    failures: List[Dict[str, Any]] = []
-    total = len(playlist_item_ids)
+def progress_bar(total: int):
+    try:
+        from tqdm import tqdm
+
+        return tqdm(total=total, desc="Deleting", unit="item")
+    except ImportError:
+        return None
+
+
+def success_record(playlist_item_id: str, index: int) -> Dict[str, Any]:
+    return {
+        "playlistItemId": playlist_item_id,
+        "status": "deleted",
+        "index": index,
+    }
+
+
+def failure_record(playlist_item_id: str, index: int, error: Exception) -> Dict[str, Any]:
+    if isinstance(error, HttpError):
+        return {
+            "playlistItemId": playlist_item_id,
+            "index": index,
+            **http_error_info(error),
+        }
+    return {
+        "playlistItemId": playlist_item_id,
+        "index": index,
+        "http_status": None,
+        "reason": type(error).__name__,
+        "detail": str(error),
+    }
 
-    for index, playlist_item_id in enumerate(progress_iter(playlist_item_ids), 1):
-        if "tqdm" not in sys.modules:
-            print(f"[{index}/{total}] 삭제 요청: {playlist_item_id}")
+
+class DeletionOutcome(NamedTuple):
+    index: int
+    playlist_item_id: str
+    error: Optional[Exception] = None
+
+
+class _QuotaGate:
+    """
+    삭제 요청의 할당량 확인과 기록
+
+    동시에 보낸 요청은 응답을 받은 뒤에야 기록되므로, 아직 기록되지 않은 요청 수를
+    함께 계산해 워커들이 남은 예산을 중복으로 쓰지 않게 합니다.
+    """
+
+    def __init__(self, ledger: Optional[QuotaLedger]):
+        self.ledger = ledger
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def reserve(self, count: int = 1) -> None:
+        if self.ledger is None:
+            return
+        with self._lock:
+            self.ledger.check(DELETE_METHOD, self._in_flight + count)
+            self._in_flight += count
+
+    def record(self, count: int = 1) -> None:
+        if self.ledger is None:
+            return
+        with self._lock:
+            self.ledger.record(DELETE_METHOD, count)
+            self._in_flight -= count
+
+
+class _DeleteRunner:
+    """삭제 요청 실행 (속도 제한, 할당량, 속도 조절, 재시도 정책 적용)"""
+
+    def __init__(
+        self,
+        limiter: Optional[TokenBucket],
+        quota: _QuotaGate,
+        adaptive: Optional[AdaptiveRate],
+        retry_policy: Optional[RetryPolicy],
+    ):
+        self.limiter = limiter
+        self.quota = quota
+        self.adaptive = adaptive
+        self.retry_policy = retry_policy
+
+    def _report(self, error: Optional[Exception]) -> None:
+        if self.adaptive is None:
+            return
+        if error is None:
+            self.adaptive.on_success()
+        elif classify_error(error).kind == THROTTLED:
+            self.adaptive.on_throttle()
+
+    def _print_retry(self, label: str, attempt: int, delay: float, error_class: ErrorClass) -> None:
+        detail = f"HTTP {error_class.status} {error_class.reason}" if error_class.status else error_class.reason
+        print(f"  재시도 중... ({label}, {attempt}/{self.retry_policy.max_attempts}, {delay:.1f}초 대기, {detail})")
+
+    def delete_one(self, service, index: int, playlist_item_id: str) -> DeletionOutcome:
+        """삭제 요청 1건 실행 (할당량 예산 부족 시 QuotaBudgetExceeded)"""
+        def attempt() -> None:
+            self.quota.reserve()
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                service.playlistItems().delete(id=playlist_item_id).execute()
+            except Exception as e:
+                self._report(e)
+                raise
+            finally:
+                self.quota.record()
+            self._report(None)
 
         try:
-            service.playlistItems().delete(id=playlist_item_id).execute()
-            successes.append(
-                {
-                    "playlistItemId": playlist_item_id,
-                    "status": "deleted",
-                    "index": index,
-                }
-            )
-        except HttpError as e:
-            failures.append(
-                {
-                    "playlistItemId": playlist_item_id,
-                    "index": index,
-                    **http_error_info(e),
-                }
-            )
+            if self.retry_policy is None:
+                attempt()
+            else:
+                self.retry_policy.execute(
+                    attempt,
+                    on_retry=lambda n, delay, error_class, _: self._print_retry(playlist_item_id, n, delay, error_class),
+                )
+        except QuotaBudgetExceeded:
+            raise
         except Exception as e:
-            failures.append(
-                {
-                    "playlistItemId": playlist_item_id,
-                    "index": index,
-                    "http_status": None,
-                    "reason": type(e).__name__,
-                    "detail": str(e),
-                }
-            )
+            return DeletionOutcome(index, playlist_item_id, e)
+        return DeletionOutcome(index, playlist_item_id)
+
+    def _reserve(self, entries: List[Tuple[int, str]]) -> Tuple[List[Tuple[int, str]], Optional[QuotaBudgetExceeded]]:
+        reserved = []
+        for entry in entries:
+            try:
+                self.quota.reserve()
+            except QuotaBudgetExceeded as e:
+                return reserved, e
+            reserved.append(entry)
+        return reserved, None
+
+    def _execute_batch(self, service, entries: List[Tuple[int, str]]) -> Dict[str, Optional[Exception]]:
+        if self.limiter is not None:
+            self.limiter.acquire(len(entries))
+        errors: Dict[str, Optional[Exception]] = {}
+
+        def callback(request_id, response, exception):
+            errors[request_id] = exception
+
+        batch = service.new_batch_http_request(callback=callback)
+        playlist_items = service.playlistItems()
+        for index, playlist_item_id in entries:
+            batch.add(playlist_items.delete(id=playlist_item_id), request_id=str(index))
+        try:
+            batch.execute()
+        except Exception as e:
+            # 배치 요청 자체가 실패하면 결과를 받지 못한 항목은 모두 같은 오류로 실패 처리
+            for index, _ in entries:
+                errors.setdefault(str(index), e)
+        finally:
+            self.quota.record(len(entries))
+        return errors
+
+    def delete_batch(
+        self,
+        service,
+        chunk: List[Tuple[int, str]],
+    ) -> Tuple[List[DeletionOutcome], Optional[QuotaBudgetExceeded]]:
+        """
+        삭제 요청 여러 건을 HTTP 배치 요청 하나로 실행
+
+        재시도할 수 있는 오류(429, 5xx 등)로 실패한 항목만 모아 다음 배치로 다시 보냅니다.
+
+        Returns:
+            (요청한 항목의 결과, 예산 부족으로 일부를 보내지 못했으면 그 예외)
+        """
+        outcomes: List[DeletionOutcome] = []
+        pending, stopped = self._reserve(chunk)
+        attempt = 1
+        delay = None
+        while pending:
+            if self.retry_policy is not None:
+                self.retry_policy.before_call()
+            errors = self._execute_batch(service, pending)
+
+            retry: List[Tuple[int, str]] = []
+            retry_classes: List[ErrorClass] = []
+            for index, playlist_item_id in pending:
+                error = errors.get(str(index))
+                self._report(error)
+                error_class = classify_error(error) if error is not None else None
+                can_retry = self.retry_policy is not None and error_class is not None
+                if can_retry and self.retry_policy.should_retry(error_class, attempt):
+                    retry.append((index, playlist_item_id))
+                    retry_classes.append(error_class)
+                else:
+                    outcomes.append(DeletionOutcome(index, playlist_item_id, error))
+            if self.retry_policy is not None:
+                self.retry_policy.record(retry_classes[0] if retry_classes else None)
+            if not retry:
+                break
+
+            # 서버가 가장 길게 기다리라고 한 시간을 따름
+            error_class = max(retry_classes, key=lambda item: item.retry_after or 0)
+            delay = self.retry_policy.next_delay(error_class, delay)
+            self._print_retry(f"배치 {len(retry)}개", attempt, delay, error_class)
+            self.retry_policy.sleep(delay)
+            attempt += 1
+            pending, retry_stopped = self._reserve(retry)
+            stopped = stopped or retry_stopped
+        return outcomes, stopped
+
+
+def delete_playlist_items(
+    service,
+    playlist_item_ids: List[str],
+    delay: float,
+    limiter: Optional[TokenBucket] = None,
+    ledger: Optional[QuotaLedger] = None,
+    concurrency: int = 1,
+    batch_size: int = 1,
+    adaptive: Optional[AdaptiveRate] = None,
+    service_factory: Optional[Callable[[], Any]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    journal: Optional[DeletionJournal] = None,
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    재생목록 항목 삭제
+
+    batch_size가 2 이상이면 삭제 요청을 HTTP 배치 요청으로 묶고, concurrency가 2 이상이면
+    요청(또는 배치)을 여러 워커 스레드에서 동시에 보냅니다. 어느 방식이든 항목별 성공/실패
+    기록과 로그 형식은 순차 실행과 같으며 기록은 delete_list 순서(index)로 정렬됩니다.
+
+    Args:
+        service: YouTube API 서비스 객체
+        playlist_item_ids: 삭제할 재생목록 항목 ID 리스트
+        delay: 요청(배치) 사이의 추가 고정 대기 시간(초, 워커별)
+        limiter: 요청 속도 제한기 (배치는 포함된 요청 수만큼 토큰 사용)
+        ledger: 할당량 기록 (예산이 부족하면 남은 항목은 요청하지 않고 어느 로그에도 남기지 않음)
+        concurrency: 동시에 요청을 보낼 워커 수
+        batch_size: HTTP 배치 요청 하나에 넣을 삭제 요청 수 (1이면 배치 사용 안 함)
+        adaptive: 속도 제한 응답(429 등)에 따라 limiter 속도를 조절하는 제어기
+        service_factory: 워커별 서비스 생성 함수 (httplib2 연결은 스레드 간 공유 불가, 없으면 service 공유)
+        retry_policy: 429/5xx/네트워크 오류 재시도 정책 (없으면 재시도하지 않고 바로 실패로 기록)
+        journal: 열린 삭제 성공 저널 (성공할 때마다 바로 기록해 중단되어도 진행 상황 유지)
+
+    Returns:
+        (성공 기록 리스트, 실패 기록 리스트)
+    """
+    if batch_size < 1 or batch_size > MAX_BATCH_SIZE:
+        raise ValueError(f"--batch-size 값은 1 이상 {MAX_BATCH_SIZE} 이하여야 합니다.")
+    if concurrency < 1:
+        raise ValueError("--concurrency 값은 1 이상이어야 합니다.")
 
-        if index < total and delay > 0:
+    successes: List[Dict[str, Any]] = []
+    failures: List[Dict[str, Any]] = []
+    total = len(playlist_item_ids)
+    runner = _DeleteRunner(limiter, _QuotaGate(ledger), adaptive, retry_policy)
+
+    def collect(outcome: DeletionOutcome) -> None:
+        if outcome.error is None:
+            record = success_record(outcome.playlist_item_id, outcome.index)
+            if journal is not None:
+                journal.record(record)
+            successes.append(record)
+        else:
+            failures.append(failure_record(outcome.playlist_item_id, outcome.index, outcome.error))
+
+    if concurrency == 1 and batch_size == 1:
+        for index, playlist_item_id in enumerate(progress_iter(playlist_item_ids), 1):
+            if "tqdm" not in sys.modules:
+                print(f"[{index}/{total}] 삭제 요청: {playlist_item_id}")
+
+            try:
+                collect(runner.delete_one(service, index, playlist_item_id))
+            except QuotaBudgetExceeded as e:
+                # 남은 항목은 어느 로그에도 남기지 않아 다음 실행에서 다시 대상이 됨
+                print(f"할당량 예산 부족으로 삭제를 중단합니다: {e}")
+                break
+
+            if index < total and delay > 0:
+                time.sleep(delay)
+
+        return successes, failures
+
+    indexed = list(enumerate(playlist_item_ids, 1))
+    chunks = [indexed[i:i + batch_size] for i in range(0, total, batch_size)]
+    stop = threading.Event()
+    lock = threading.Lock()
+    local = threading.local()
+    progress = progress_bar(total)
+    stop_errors: List[QuotaBudgetExceeded] = []
+
+    def run(chunk: List[Tuple[int, str]]) -> None:
+        if stop.is_set():
+            return
+        worker_service = getattr(local, "service", None)
+        if worker_service is None:
+            worker_service = service_factory() if service_factory is not None else service
+            local.service = worker_service
+        elif delay > 0:
             time.sleep(delay)
+        if progress is None:
+            for index, playlist_item_id in chunk:
+                print(f"[{index}/{total}] 삭제 요청: {playlist_item_id}")
+
+        if batch_size > 1:
+            outcomes, stopped = runner.delete_batch(worker_service, chunk)
+        else:
+            outcomes, stopped = [], None
+            try:
+                outcomes.append(runner.delete_one(worker_service, *chunk[0]))
+            except QuotaBudgetExceeded as e:
+                stopped = e
+
+        with lock:
+            for outcome in outcomes:
+                collect(outcome)
+            if stopped is not None and not stop.is_set():
+                stop.set()
+                stop_errors.append(stopped)
+            if progress is not None:
+                progress.update(len(outcomes))
 
+    try:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks)) or 1, thread_name_prefix="playlist-delete") as executor:
+            for future in [executor.submit(run, chunk) for chunk in chunks]:
+                future.result()
+    finally:
+        if progress is not None:
+            progress.close()
+
+    if stop_errors:
+        # 남은 항목은 어느 로그에도 남기지 않아 다음 실행에서 다시 대상이 됨
+        print(f"할당량 예산 부족으로 삭제를 중단합니다: {stop_errors[0]}")
+    successes.sort(key=lambda record: record["index"])
+    failures.sort(key=lambda record: record["index"])
     return successes, failures
 
 
@@ -216,8 +504,25 @@ def main() -> int:
     parser.add_argument(
         "--delay",
         type=float,
-        default=2.0,
-        help="삭제 요청 사이의 대기 시간(초). 기본값: 2.0",
+        default=0.0,
+        help="삭제 요청 사이의 추가 고정 대기 시간(초). 기본값: 0 (API_RATE_LIMIT 속도 제한만 적용)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="초당 삭제 요청 수. 기본값: .env의 API_RATE_LIMIT (추출과 같은 공용 제한기를 사용)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="동시에 삭제 요청(또는 배치)을 보낼 워커 수. 기본값: 1",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help=f"HTTP 배치 요청 하나에 묶을 삭제 요청 수 (최대 {MAX_BATCH_SIZE}). 기본값: 1 (배치 사용 안 함)",
     )
     parser.add_argument(
         "--log-dir",
@@ -227,7 +532,7 @@ def main() -> int:
     parser.add_argument(
         "--ignore-success-log",
         action="store_true",
-        help="기존 deletion_success_*.json 로그를 무시하고 delete_list를 처음부터 다시 대상으로 삼습니다.",
+        help="삭제 성공 저널(deletion_journal.jsonl)과 기존 deletion_success_*.json 로그를 무시하고 delete_list를 처음부터 다시 대상으로 삼습니다.",
     )
 
     args = parser.parse_args()
@@ -242,16 +547,29 @@ def main() -> int:
             args.ignore_success_log,
         )
         targets = limited_targets(pending, args.limit)
+        if args.concurrency < 1:
+            raise ValueError("--concurrency 값은 1 이상이어야 합니다.")
+        if not 1 <= args.batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"--batch-size 값은 1 이상 {MAX_BATCH_SIZE} 이하여야 합니다.")
+        quota_plan = QuotaScheduler(get_quota_ledger()).plan(delete_count=len(targets))
+        # 남은 예산을 넘는 삭제는 dry-run에서도 이번 실행 대상에서 빼고 보여 줌
+        scheduled = targets[: quota_plan.allowed_deletes]
 
         print_plan(
             target_data,
             args.target_json,
-            targets,
+            scheduled,
             args.execute,
             len(successful_ids),
             len(pending),
             args.ignore_success_log,
+            deferred_count=len(targets) - len(scheduled),
         )
+        targets = scheduled
+
+        print("할당량 예측")
+        for line in format_plan(quota_plan):
+            print(line)
 
         if not targets:
             print("삭제 대상이 없습니다.")
@@ -272,14 +590,37 @@ def main() -> int:
 
         from youtube_api import YouTubeAPI
 
-        youtube_api = YouTubeAPI()
+        limiter = configure_rate_limiter(args.rate) if args.rate is not None else get_rate_limiter()
+        ledger = get_quota_ledger()
+        youtube_api = YouTubeAPI(rate_limiter=limiter, quota_ledger=ledger)
         service = youtube_api.get_service(require_oauth=True)
-        successes, failures = delete_playlist_items(service, targets, args.delay)
-
-        success_path = log_dir / f"deletion_success_{ts}.json"
-        failed_path = log_dir / f"deletion_failed_{ts}.json"
-        write_log(success_path, successes)
-        write_log(failed_path, failures)
+        # 429/rateLimitExceeded 응답이 오면 속도를 줄이고, 성공이 이어지면 설정 속도까지 회복
+        adaptive = AdaptiveRate(limiter)
+        # 성공한 삭제는 바로 저널에 기록되므로 중간에 중단되어도 다음 실행에서 제외됨
+        with DeletionJournal(log_dir) as journal:
+            successes, failures = delete_playlist_items(
+                service,
+                targets,
+                args.delay,
+                limiter=limiter,
+                ledger=ledger,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
+                adaptive=adaptive,
+                service_factory=lambda: youtube_api.clone_for_worker().service,
+                retry_policy=youtube_api.retry_policy,
+                journal=journal,
+            )
+            ledger.flush()
+            if adaptive.throttle_count:
+                print(f"속도 제한 응답 {adaptive.throttle_count}회로 요청 속도를 조절했습니다 (현재 초당 {limiter.rate:g}회).")
+
+            success_path = log_dir / f"deletion_success_{ts}.json"
+            failed_path = log_dir / f"deletion_failed_{ts}.json"
+            write_log(success_path, successes)
+            write_log(failed_path, failures)
+            # 이번 실행의 성공 로그는 이미 저널에 있으므로 다시 읽지 않도록 표시
+            journal.mark_imported(success_path.name)
 
         print("삭제 실행 완료")
         print(f"- 성공: {len(successes)}개 ({success_path})")
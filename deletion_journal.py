@@ -0,0 +1,169 @@
+"""
+Append-only journal of successful playlist item deletions.
+
+The journal is a single JSONL file (deletion_journal.jsonl) in the log
+directory:
+
+- each successful deletion is appended as one line when the API call returns
+  and flushed to the OS; the file is fsync'd every `fsync_every` records and
+  on close;
+- loading reads the file once into a set, so "already deleted?" is a set
+  lookup;
+- deletion_success_*.json logs are imported once, and an "import" line
+  records each imported file name so it is not parsed again.
+
+A torn trailing line from an interrupted write is ignored on load and
+truncated before the next append.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+JOURNAL_NAME = "deletion_journal.jsonl"
+LEGACY_LOG_PATTERN = "deletion_success_*.json"
+
+
+def read_legacy_log(path: Path) -> List[str]:
+    """playlistItemIds of one deletion_success_*.json (unreadable files yield nothing)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    if not isinstance(records, list):
+        return []
+    ids = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        playlist_item_id = record.get("playlistItemId")
+        if playlist_item_id not in (None, ""):
+            ids.append(str(playlist_item_id))
+    return ids
+
+
+class DeletionJournal:
+    """Deleted playlistItemIds of one log directory."""
+
+    def __init__(self, log_dir: Path, fsync_every: int = 20):
+        self.log_dir = Path(log_dir)
+        self.path = self.log_dir / JOURNAL_NAME
+        self.fsync_every = max(1, fsync_every)
+        self.deleted_ids: Set[str] = set()
+        self.imported_logs: Set[str] = set()
+        self._valid_size = 0
+        self._file = None
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, playlist_item_id: object) -> bool:
+        return playlist_item_id in self.deleted_ids
+
+    def __len__(self) -> int:
+        return len(self.deleted_ids)
+
+    def load(self) -> "DeletionJournal":
+        """Read the journal and any legacy logs it has not imported yet (read-only)."""
+        self.deleted_ids.clear()
+        self.imported_logs.clear()
+        self._valid_size = 0
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete line")
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn write from a crash: everything before it is still valid.
+                        break
+                    self._valid_size += len(line)
+                    self._apply(record)
+        for path in self.pending_legacy_logs():
+            self.deleted_ids.update(read_legacy_log(path))
+        return self
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if record.get("type") == "import":
+            self.imported_logs.add(record.get("file", ""))
+            self.deleted_ids.update(record.get("ids") or [])
+        elif record.get("playlistItemId"):
+            self.deleted_ids.add(record["playlistItemId"])
+
+    def pending_legacy_logs(self) -> List[Path]:
+        if not self.log_dir.exists():
+            return []
+        return sorted(
+            path for path in self.log_dir.glob(LEGACY_LOG_PATTERN) if path.name not in self.imported_logs
+        )
+
+    def open(self) -> "DeletionJournal":
+        """
+        Load, then open for appending: a torn tail is truncated and legacy logs
+        are imported into the journal.
+        """
+        self.load()
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size != self._valid_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(self._valid_size)
+        self._file = open(self.path, "a", encoding="utf-8")
+        for path in self.pending_legacy_logs():
+            self.mark_imported(path.name, read_legacy_log(path))
+        self.sync()
+        return self
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            raise RuntimeError("deletion journal is not open")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def record(self, success: Dict[str, Any]) -> None:
+        """Append one success record (playlistItemId, status, index) with its time."""
+        with self._lock:
+            self._append({**success, "deleted_at": datetime.now().isoformat(timespec="seconds")})
+            self.deleted_ids.add(success["playlistItemId"])
+
+    def mark_imported(self, file_name: str, ids: Iterable[str] = ()) -> None:
+        """
+        Record a per-run log as imported. Logs written by deleter.py itself
+        only need the name: their IDs are already in the journal.
+        """
+        ids = list(ids)
+        with self._lock:
+            self._append({"type": "import", "file": file_name, "ids": ids})
+            self.imported_logs.add(file_name)
+            self.deleted_ids.update(ids)
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._file is not None and self._unsynced:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self.sync()
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "DeletionJournal":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def load_deleted_ids(log_dir: Path) -> Set[str]:
+    """Deleted playlistItemIds from the journal and legacy logs, without writing anything."""
+    return DeletionJournal(log_dir).load().deleted_ids
@@ -1,15 +1,84 @@
 """
 출력 모듈 기본 클래스
 """
+import os
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, TextIO
 from pathlib import Path
 import config
+from exporters.manifest import ContentHash, ExportManifest
+
+# 출력 파일 쓰기 버퍼 크기 (영상마다 작은 write가 여러 번 발생하므로 크게 잡음)
+WRITE_BUFFER_SIZE = 256 * 1024
+
+
+class AtomicTextFile:
+    """임시 파일에 기록한 뒤 commit() 시 원래 경로와 교체하는 텍스트 파일"""
+    
+    def __init__(self, filepath: Path, buffer_size: int = WRITE_BUFFER_SIZE):
+        self.filepath = filepath
+        self.tmp_path = filepath.with_name(filepath.name + ".tmp")
+        self.file: TextIO = open(self.tmp_path, 'w', encoding='utf-8', buffering=buffer_size)
+    
+    def commit(self) -> Path:
+        self.file.close()
+        os.replace(self.tmp_path, self.filepath)
+        return self.filepath
+    
+    def discard(self) -> None:
+        self.file.close()
+        try:
+            self.tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ExportSink(ABC):
+    """
+    재생목록 하나를 파일에 기록하는 출력 대상
+    
+    begin() → write_video() (영상마다) → end() 순서로 호출됩니다.
+    """
+    
+    def __init__(self, file: TextIO):
+        self.file = file
+    
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        """
+        재생목록 머리말 기록
+        
+        Args:
+            playlist: 재생목록 정보
+            video_count: 기록할 영상 수
+        """
+    
+    @abstractmethod
+    def write_video(self, index: int, video: Dict) -> None:
+        """
+        영상 하나 기록
+        
+        Args:
+            index: 1부터 시작하는 영상 순번
+            video: 영상 정보
+        """
+    
+    def end(self) -> None:
+        """재생목록 맺음말 기록"""
+    
+    def abort(self) -> None:
+        """기록이 실패했을 때 호출 (출력 대상이 따로 연 파일 정리)"""
+    
+    def extra_files(self) -> List[Path]:
+        """end() 이후 출력 파일 외에 함께 기록된 파일 (매니페스트에서 함께 확인)"""
+        return []
 
 
 class BaseExporter(ABC):
     """출력 모듈 기본 클래스"""
     
+    # True면 export_stream()이 영상 리스트 전체를 메모리에 올리지 않고 기록
+    supports_streaming = False
+    
     def __init__(self, output_dir: Path = None):
         """
         초기화
@@ -19,6 +88,8 @@ class BaseExporter(ABC):
         """
         self.base_output_dir = output_dir or config.OUTPUT_DIR
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
+        # 내용이 이전 실행과 같은 출력 파일은 다시 기록하지 않음 (재생목록 폴더의 매니페스트로 판단)
+        self.skip_unchanged = config.EXPORT_SKIP_UNCHANGED
     
     def get_playlist_dir(self, playlist_title: str) -> Path:
         """
@@ -35,6 +106,19 @@ class BaseExporter(ABC):
         playlist_dir.mkdir(parents=True, exist_ok=True)
         return playlist_dir
     
+    def get_output_path(self, playlist_title: str) -> Path:
+        """
+        재생목록 출력 파일 경로 반환 (디렉토리는 생성하지 않음)
+        
+        Args:
+            playlist_title: 재생목록 제목
+            
+        Returns:
+            출력 파일 경로
+        """
+        filename = self.sanitize_filename(playlist_title)
+        return self.base_output_dir / filename / f"{filename}{self.get_file_extension()}"
+    
     def sanitize_filename(self, filename: str) -> str:
         """
         파일명에서 사용할 수 없는 문자 제거
@@ -57,7 +141,6 @@ class BaseExporter(ABC):
         
         return filename.strip()
     
-    @abstractmethod
     def export(self, playlist_data: Dict) -> Path:
         """
         재생목록 데이터를 파일로 출력
@@ -68,7 +151,119 @@ class BaseExporter(ABC):
         Returns:
             생성된 파일 경로
         """
-        pass
+        # 재생목록별 폴더 생성
+        playlist_dir = self.get_playlist_dir(playlist_data["title"])
+        filename = self.sanitize_filename(playlist_data["title"])
+        filepath = playlist_dir / f"{filename}{self.get_file_extension()}"
+        videos = playlist_data["videos"]
+        return self.write_playlist(filepath, playlist_data, videos, len(videos))
+    
+    def write_playlist(self, filepath: Path, playlist: Dict, videos: Iterable[Dict], video_count: int) -> Path:
+        """
+        출력 대상(sink)을 통해 재생목록을 파일에 기록 (임시 파일에 쓴 뒤 교체)
+        
+        skip_unchanged가 True이고 내용 해시가 매니페스트와 같으면 기존 파일을 그대로
+        둡니다. 영상 리스트는 기록 전에 해시를 계산하므로 렌더링과 기록을 모두 건너뛰지만,
+        한 번만 읽을 수 있는 이터레이터(스트리밍 출력)는 기록하면서 해시를 계산하므로
+        임시 파일 전체를 쓴 뒤 버리고 교체만 건너뜁니다. 스트리밍 출력에서 기록 자체를
+        줄이는 것은 재생목록 etag와 itemCount가 그대로인 재생목록을 추출 전에 건너뛰는
+        스냅샷 저장소(PlaylistExtractor.unchanged_playlists)의 몫입니다.
+        
+        Args:
+            filepath: 출력 파일 경로
+            playlist: 재생목록 정보
+            videos: 영상 정보 이터레이터
+            video_count: 머리말에 기록할 영상 수
+            
+        Returns:
+            생성된 파일 경로
+        """
+        manifest = None
+        content = None
+        content_hash = None
+        if self.skip_unchanged:
+            manifest = ExportManifest(filepath.parent)
+            content = ContentHash(playlist, video_count)
+            if isinstance(videos, (list, tuple)):
+                content_hash = content.add_videos(videos).digest(self.get_output_signature())
+                if manifest.is_current(filepath, content_hash):
+                    return filepath
+            else:
+                videos = content.hashing(videos)
+        
+        output = AtomicTextFile(filepath)
+        sink = None
+        try:
+            sink = self.create_sink(output.file, filepath)
+            if sink is None:
+                raise NotImplementedError(f"{type(self).__name__}는 export() 또는 create_sink()를 구현해야 합니다.")
+            sink.begin(playlist, video_count)
+            for index, video in enumerate(videos, 1):
+                sink.write_video(index, video)
+            if manifest is not None and content_hash is None:
+                content_hash = content.digest(self.get_output_signature())
+                if manifest.is_current(filepath, content_hash):
+                    sink.abort()
+                    output.discard()
+                    return filepath
+            sink.end()
+        except BaseException:
+            if sink is not None:
+                sink.abort()
+            output.discard()
+            raise
+        output.commit()
+        if manifest is not None:
+            manifest.record(filepath, content_hash, sink.extra_files())
+            manifest.save()
+        return filepath
+    
+    def export_stream(self, playlist: Dict, videos: Iterable[Dict]) -> Path:
+        """
+        영상 이터레이터를 받아 재생목록 파일로 출력
+        
+        기본 구현은 영상을 모두 모은 뒤 export()를 호출합니다.
+        supports_streaming이 True인 출력 모듈은 영상을 받는 즉시 기록합니다.
+        
+        Args:
+            playlist: 재생목록 정보 (videos 제외)
+            videos: 영상 정보 이터레이터 (예: YouTubeAPI.get_playlist_videos)
+            
+        Returns:
+            생성된 파일 경로
+        """
+        return self.export({**playlist, "videos": list(videos)})
+    
+    def get_output_signature(self) -> str:
+        """
+        출력 내용에 영향을 주는 형식 설정 (매니페스트 해시에 포함)
+        
+        같은 데이터라도 설정에 따라 출력이 달라지는 모듈은 설정 값을 덧붙입니다.
+        
+        Returns:
+            형식 설정 문자열
+        """
+        return f"{type(self).__name__}{self.get_file_extension()}"
+    
+    def has_sink(self) -> bool:
+        """create_sink()를 구현한 출력 모듈인지 여부"""
+        return type(self).create_sink is not BaseExporter.create_sink
+    
+    def create_sink(self, file: TextIO, filepath: Path) -> Optional[ExportSink]:
+        """
+        이 형식의 출력 대상 생성
+        
+        출력 대상을 제공하지 않는 출력 모듈은 export()를 직접 구현하며,
+        ExportPipeline은 이런 모듈에 대해 export()를 호출합니다.
+        
+        Args:
+            file: 기록할 텍스트 파일 (filepath의 임시 파일)
+            filepath: 최종 출력 파일 경로 (여러 파일로 나눠 쓰는 형식에서 사용)
+            
+        Returns:
+            ExportSink 인스턴스 (지원하지 않으면 None)
+        """
+        return None
     
     @abstractmethod
     def get_file_extension(self) -> str:
@@ -0,0 +1,198 @@
+"""
+추출과 분리된 출력 작업 풀
+
+추출 쪽(생산자)이 완료된 재생목록을 submit()으로 넘기면 출력 워커(소비자)가
+ExportPipeline으로 모든 형식을 기록합니다. 처리 중이거나 대기 중인 재생목록 수가
+상한에 도달하면 submit()이 기다리므로 메모리 사용량이 제한되고, HTML 렌더링과
+디스크 쓰기 시간이 API 응답 대기 시간과 겹쳐서 진행됩니다.
+
+워커는 스레드(기본값) 또는 프로세스로 실행할 수 있습니다. 렌더링이 CPU를 많이 쓰는
+경우 프로세스 모드가 GIL의 영향을 받지 않습니다.
+"""
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional
+
+from exporters.base_exporter import BaseExporter
+from exporters.pipeline import ExportOutcome, ExportPipeline
+
+EXPORT_MODES = ("thread", "process")
+
+
+@dataclass
+class ExportResult:
+    """재생목록 하나의 출력 결과 (영상 리스트는 포함하지 않음)"""
+    playlist: Dict
+    video_count: int
+    outcomes: List[ExportOutcome] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and all(outcome.ok for outcome in self.outcomes)
+
+
+_thread_local = threading.local()
+_process_pipeline: Optional[ExportPipeline] = None
+
+
+def _playlist_info(playlist_data: Dict) -> Dict:
+    return {key: value for key, value in playlist_data.items() if key != "videos"}
+
+
+def _export_in_thread(exporters: List[BaseExporter], playlist_data: Dict) -> List[ExportOutcome]:
+    pipeline = getattr(_thread_local, "pipeline", None)
+    if pipeline is None or pipeline.exporters is not exporters:
+        pipeline = ExportPipeline(exporters)
+        _thread_local.pipeline = pipeline
+    return pipeline.export(playlist_data)
+
+
+def _init_process(exporters: List[BaseExporter]) -> None:
+    global _process_pipeline
+    _process_pipeline = ExportPipeline(exporters)
+
+
+def _export_in_process(playlist_data: Dict) -> List[ExportOutcome]:
+    return _process_pipeline.export(playlist_data)
+
+
+class ExportPool:
+    """완료된 재생목록을 받아 출력 워커에서 기록하는 작업 풀"""
+
+    def __init__(
+        self,
+        exporters: List[BaseExporter],
+        workers: int = 1,
+        mode: str = "thread",
+        queue_size: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            exporters: 출력 모듈 리스트
+            workers: 출력 워커 수 (0이면 submit()을 호출한 스레드에서 바로 기록)
+            mode: 'thread' 또는 'process'
+            queue_size: 워커가 처리 중인 것 외에 대기할 수 있는 재생목록 수
+                       (기본값: 워커 수의 2배)
+        """
+        if mode not in EXPORT_MODES:
+            raise ValueError(f"알 수 없는 출력 모드입니다: {mode} (thread 또는 process)")
+        self.exporters = exporters
+        self.workers = max(0, int(workers))
+        self.mode = mode
+        self.timings: Dict[str, float] = {
+            exporter.get_file_extension(): 0.0 for exporter in exporters
+        }
+        self._pending: Deque = deque()
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        if self.workers > 0:
+            if queue_size is None:
+                queue_size = self.workers * 2
+            self._slots = threading.BoundedSemaphore(self.workers + max(0, queue_size))
+            if mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_process,
+                    initargs=(exporters,)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="playlist-export"
+                )
+
+    def submit(self, playlist_data: Dict) -> None:
+        """
+        재생목록 출력 작업 추가 (대기열이 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            playlist_data: 재생목록 정보와 영상 리스트
+        """
+        info = _playlist_info(playlist_data)
+        video_count = len(playlist_data["videos"])
+        if self._executor is None:
+            result = ExportResult(info, video_count)
+            try:
+                result.outcomes = _export_in_thread(self.exporters, playlist_data)
+            except Exception as e:
+                result.error = e
+            self._pending.append(result)
+            return
+
+        self._slots.acquire()
+        try:
+            if self.mode == "process":
+                future = self._executor.submit(_export_in_process, playlist_data)
+            else:
+                future = self._executor.submit(_export_in_thread, self.exporters, playlist_data)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((info, video_count, future))
+
+    def _collect(self, item) -> ExportResult:
+        if isinstance(item, ExportResult):
+            result = item
+        else:
+            info, video_count, future = item
+            result = ExportResult(info, video_count)
+            try:
+                result.outcomes = future.result()
+            except Exception as e:
+                result.error = e
+        for outcome in result.outcomes:
+            extension = outcome.exporter.get_file_extension()
+            self.timings[extension] = self.timings.get(extension, 0.0) + outcome.seconds
+        return result
+
+    @staticmethod
+    def _is_done(item) -> bool:
+        return isinstance(item, ExportResult) or item[2].done()
+
+    def completed(self) -> Iterator[ExportResult]:
+        """
+        지금까지 끝난 출력 결과를 제출 순서대로 반환 (기다리지 않음)
+
+        Yields:
+            ExportResult
+        """
+        while self._pending and self._is_done(self._pending[0]):
+            yield self._collect(self._pending.popleft())
+
+    def drain(self) -> Iterator[ExportResult]:
+        """
+        남은 출력 작업이 모두 끝날 때까지 기다리며 결과를 제출 순서대로 반환
+
+        Yields:
+            ExportResult
+        """
+        while self._pending:
+            yield self._collect(self._pending.popleft())
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        워커 종료
+
+        Args:
+            cancel: True면 아직 시작하지 않은 출력 작업을 취소
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=cancel)
+            self._executor = None
+
+    def format_timings(self) -> str:
+        """형식별 누적 기록 시간 요약 문자열"""
+        return ", ".join(f"{extension[1:]} {seconds:.2f}초" for extension, seconds in self.timings.items())
+
+    def __enter__(self) -> "ExportPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # 정상 종료가 아니면(중단 등) 대기 중인 작업은 버림
+        self.close(cancel=exc_type is not None)
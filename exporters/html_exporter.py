@@ -1,15 +1,427 @@
 """
 HTML 형식 출력 모듈 (썸네일 포함)
 """
+import glob
+import hashlib
+import json
+import math
+import textwrap
+import threading
 from pathlib import Path
-from typing import Dict
-from jinja2 import Template
-from exporters.base_exporter import BaseExporter
+from typing import Dict, List, Optional, TextIO
+from urllib.parse import quote
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from exporters.base_exporter import AtomicTextFile, BaseExporter, ExportSink
+import config
+
+HEADER_TEMPLATE_NAME = "playlist_header.html"
+VIDEO_TEMPLATE_NAME = "playlist_video.html"
+FOOTER_TEMPLATE_NAME = "playlist_footer.html"
+# external_css=True일 때 출력 루트에 저장하는 공용 스타일시트 파일명
+STYLESHEET_FILENAME = "playlist.css"
+# single: 한 파일에 모든 카드, paged: page_size개씩 여러 파일, virtual: 보이는 카드만 렌더링
+HTML_MODES = ("single", "paged", "virtual")
+
+# virtual 모드에서 화면에 보이는 행(±overscan)의 카드만 그리는 스크립트
+VIRTUAL_SCROLL_SCRIPT = """\
+    <script>
+    (function () {
+        var data = document.getElementById("playlist-data");
+        var videos = JSON.parse(data.textContent);
+        var grid = data.parentNode;
+        var columns = 1, rowHeight = 0, overscan = 3, scheduled = false;
+        grid.removeChild(data);
+
+        function element(tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text) node.textContent = text;
+            return node;
+        }
+
+        function card(video) {
+            var node = element("div", "video-card");
+            var link = element("a");
+            link.href = video[0];
+            link.target = "_blank";
+            var image = element("img", "video-thumbnail");
+            image.src = video[1];
+            image.alt = video[2];
+            image.loading = "lazy";
+            image.onerror = function () {
+                this.onerror = null;
+                this.src = "https://via.placeholder.com/320x180?text=No+Thumbnail";
+            };
+            link.appendChild(image);
+            node.appendChild(link);
+            var info = element("div", "video-info");
+            var title = element("div", "video-title");
+            var titleLink = element("a", "", video[2]);
+            titleLink.href = video[0];
+            titleLink.target = "_blank";
+            title.appendChild(titleLink);
+            info.appendChild(title);
+            if (video[3]) info.appendChild(element("div", "video-meta video-channel", "채널: " + video[3]));
+            if (video[4]) info.appendChild(element("div", "video-meta", "추가일: " + video[4]));
+            node.appendChild(info);
+            return node;
+        }
+
+        function measure() {
+            var style = getComputedStyle(grid);
+            columns = Math.max(1, style.gridTemplateColumns.split(" ").length);
+            if (grid.firstElementChild) {
+                rowHeight = grid.firstElementChild.getBoundingClientRect().height + (parseFloat(style.rowGap) || 0);
+            }
+        }
+
+        function render() {
+            var height = rowHeight || 300;
+            var rows = Math.ceil(videos.length / columns);
+            var top = grid.getBoundingClientRect().top + window.scrollY;
+            var first = Math.max(0, Math.floor((window.scrollY - top) / height) - overscan);
+            var last = Math.min(rows, Math.ceil((window.scrollY + window.innerHeight - top) / height) + overscan);
+            var fragment = document.createDocumentFragment();
+            for (var i = first * columns; i < Math.min(videos.length, last * columns); i++) {
+                fragment.appendChild(card(videos[i]));
+            }
+            grid.style.paddingTop = first * height + "px";
+            grid.style.paddingBottom = Math.max(0, rows - last) * height + "px";
+            grid.replaceChildren(fragment);
+        }
+
+        function schedule() {
+            if (scheduled) return;
+            scheduled = true;
+            window.requestAnimationFrame(function () {
+                scheduled = false;
+                render();
+            });
+        }
+
+        render();
+        measure();
+        render();
+        window.addEventListener("scroll", schedule, { passive: true });
+        window.addEventListener("resize", function () {
+            measure();
+            schedule();
+        });
+    })();
+    </script>"""
+
+_environment: Optional[Environment] = None
+_environment_lock = threading.Lock()
+
+
+def get_environment() -> Environment:
+    """
+    HTML 템플릿을 담은 프로세스 공용 Jinja 환경 반환 (최초 1회 생성)
+    
+    템플릿은 영상 반복 구간을 기준으로 머리말/영상 카드/맺음말로 나눠 등록하고,
+    컴파일된 바이트코드는 config.JINJA_CACHE_DIR에 저장하여 다음 실행에서 재사용합니다.
+    
+    Returns:
+        jinja2 Environment
+    """
+    global _environment
+    with _environment_lock:
+        if _environment is None:
+            header, _, rest = HTMLExporter.HTML_TEMPLATE.partition("{% for video in videos %}")
+            video, _, footer = rest.partition("{% endfor %}")
+            bytecode_cache = None
+            try:
+                config.JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(config.JINJA_CACHE_DIR))
+            except OSError:
+                # 캐시 디렉토리를 만들 수 없으면 메모리에서만 컴파일
+                pass
+            _environment = Environment(
+                loader=DictLoader({
+                    HEADER_TEMPLATE_NAME: header,
+                    VIDEO_TEMPLATE_NAME: video,
+                    FOOTER_TEMPLATE_NAME: footer,
+                }),
+                bytecode_cache=bytecode_cache,
+                auto_reload=False
+            )
+        return _environment
+
+
+class HTMLSink(ExportSink):
+    """영상 카드를 하나씩 렌더링하여 기록 (generate()로 파일 버퍼에 바로 기록)"""
+    
+    def __init__(self, file: TextIO, stylesheet: str):
+        super().__init__(file)
+        self.stylesheet = stylesheet
+        environment = get_environment()
+        self.header_template = environment.get_template(HEADER_TEMPLATE_NAME)
+        self.video_template = environment.get_template(VIDEO_TEMPLATE_NAME)
+        self.footer_template = environment.get_template(FOOTER_TEMPLATE_NAME)
+    
+    def write_header(self, file: TextIO, playlist: Dict, video_count: int, **context) -> None:
+        file.writelines(self.header_template.generate(
+            playlist_title=playlist["title"],
+            playlist_description=playlist.get("description", ""),
+            video_count=video_count,
+            published_at=playlist.get("published_at", ""),
+            stylesheet=self.stylesheet,
+            **context
+        ))
+    
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        self.write_header(self.file, playlist, video_count)
+    
+    def write_video(self, index: int, video: Dict) -> None:
+        self.file.writelines(self.video_template.generate(video=video))
+    
+    def end(self) -> None:
+        self.file.writelines(self.footer_template.generate())
+
+
+class PagedHTMLSink(HTMLSink):
+    """
+    영상 목록을 page_size개씩 여러 HTML 파일로 나눠 기록
+    
+    첫 페이지는 원래 파일명(재생목록.html)을, 나머지는 재생목록_2.html, 재생목록_3.html ...
+    을 사용하며 각 페이지 위아래에 페이지 이동 링크를 넣습니다.
+    """
+    
+    def __init__(self, file: TextIO, filepath: Path, stylesheet: str, page_size: int):
+        super().__init__(file, stylesheet)
+        self.filepath = filepath
+        self.page_size = max(1, page_size)
+        self._extra_pages: List[AtomicTextFile] = []
+        self._current_file = file
+        self._page = 0
+    
+    def page_filename(self, page: int) -> str:
+        if page == 1:
+            return self.filepath.name
+        return f"{self.filepath.stem}_{page}{self.filepath.suffix}"
+    
+    def pagination_markup(self, page: int) -> str:
+        links = []
+        if page > 1:
+            links.append(f'<a href="{quote(self.page_filename(page - 1))}">이전</a>')
+        for number in range(1, self.page_count + 1):
+            if number == page:
+                links.append(f'<span class="current">{number}</span>')
+            else:
+                links.append(f'<a href="{quote(self.page_filename(number))}">{number}</a>')
+        if page < self.page_count:
+            links.append(f'<a href="{quote(self.page_filename(page + 1))}">다음</a>')
+        return '        <nav class="pagination">' + " ".join(links) + "</nav>"
+    
+    def _start_page(self, page: int) -> None:
+        if page > 1:
+            output = AtomicTextFile(self.filepath.with_name(self.page_filename(page)))
+            self._extra_pages.append(output)
+            self._current_file = output.file
+        self._page = page
+        self.write_header(
+            self._current_file, self.playlist, self.video_count,
+            pagination=self.pagination_markup(page)
+        )
+    
+    def _finish_page(self) -> None:
+        self._current_file.writelines(
+            self.footer_template.generate(pagination=self.pagination_markup(self._page))
+        )
+    
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        self.playlist = playlist
+        self.video_count = video_count
+        self.page_count = max(1, math.ceil(video_count / self.page_size))
+        self._start_page(1)
+    
+    def write_video(self, index: int, video: Dict) -> None:
+        page = (index - 1) // self.page_size + 1
+        if page != self._page:
+            self._finish_page()
+            self._start_page(page)
+        self._current_file.writelines(self.video_template.generate(video=video))
+    
+    def end(self) -> None:
+        self._finish_page()
+        for output in self._extra_pages:
+            output.commit()
+        # 재생목록이 줄어 더 이상 쓰이지 않는 이전 페이지 파일 정리
+        prefix = f"{self.filepath.stem}_"
+        for path in self.filepath.parent.glob(f"{glob.escape(prefix)}*{self.filepath.suffix}"):
+            number = path.name[len(prefix):-len(self.filepath.suffix)]
+            if number.isdigit() and int(number) > self.page_count:
+                path.unlink()
+    
+    def abort(self) -> None:
+        for output in self._extra_pages:
+            output.discard()
+    
+    def extra_files(self) -> List[Path]:
+        return [output.filepath for output in self._extra_pages]
+
+
+class VirtualHTMLSink(HTMLSink):
+    """
+    영상 정보를 압축된 JSON으로 넣고 화면에 보이는 카드만 스크립트로 렌더링
+    
+    카드 마크업 대신 영상마다 [URL, 썸네일, 제목, 채널, 추가일] 배열 하나만 기록하므로
+    파일 크기가 작고, 썸네일은 화면에 보이는 카드에서만 지연 로드됩니다.
+    """
+    
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        self.write_header(self.file, playlist, video_count, virtual=True)
+        self.file.write('<script type="application/json" id="playlist-data">[')
+        self._written = 0
+    
+    def write_video(self, index: int, video: Dict) -> None:
+        row = [
+            video.get("url", ""),
+            video.get("thumbnail", ""),
+            video.get("title") or video.get("video_id") or "영상",
+            video.get("channel_title", ""),
+            (video.get("added_at") or "")[:10],
+        ]
+        if self._written:
+            self.file.write(",")
+        # </script>가 데이터 안에서 스크립트를 닫지 않도록 이스케이프
+        self.file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/"))
+        self._written += 1
+    
+    def end(self) -> None:
+        self.file.write("]</script>")
+        self.file.writelines(self.footer_template.generate(scripts=VIRTUAL_SCROLL_SCRIPT))
 
 
 class HTMLExporter(BaseExporter):
     """HTML 형식으로 재생목록 데이터 출력 (썸네일 포함)"""
     
+    # 모든 HTML 파일이 공유하는 스타일 (external_css=True면 출력 루트에 한 번만 저장)
+    HTML_STYLESHEET = """\
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background-color: #f5f5f5;
+    padding: 20px;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    padding: 30px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+h1 {
+    color: #1a1a1a;
+    margin-bottom: 10px;
+    font-size: 2em;
+}
+.playlist-info {
+    color: #666;
+    margin-bottom: 20px;
+    padding-bottom: 20px;
+    border-bottom: 2px solid #eee;
+}
+.playlist-description {
+    margin: 15px 0;
+    color: #555;
+}
+.video-count {
+    font-weight: 600;
+    color: #d32f2f;
+}
+.videos-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 20px;
+    margin-top: 30px;
+}
+.video-card {
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    overflow: hidden;
+    transition: transform 0.2s, box-shadow 0.2s;
+    background: white;
+}
+.video-card:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+}
+.video-thumbnail {
+    width: 100%;
+    height: 180px;
+    object-fit: cover;
+    display: block;
+}
+.video-info {
+    padding: 15px;
+}
+.video-title {
+    font-weight: 600;
+    margin-bottom: 8px;
+    font-size: 0.95em;
+    line-height: 1.4;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+}
+.video-title a {
+    color: #1a1a1a;
+    text-decoration: none;
+}
+.video-title a:hover {
+    color: #d32f2f;
+}
+.video-meta {
+    font-size: 0.85em;
+    color: #666;
+    margin-top: 8px;
+}
+.video-channel {
+    margin-top: 5px;
+}
+.pagination {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 6px;
+    margin: 20px 0;
+    font-size: 0.9em;
+}
+.pagination a,
+.pagination span {
+    padding: 4px 10px;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    color: #1a1a1a;
+    text-decoration: none;
+}
+.pagination .current {
+    background: #d32f2f;
+    border-color: #d32f2f;
+    color: white;
+}
+.videos-grid.virtual .video-info {
+    height: 120px;
+    overflow: hidden;
+}
+@media (max-width: 768px) {
+    .videos-grid {
+        grid-template-columns: 1fr;
+    }
+    .container {
+        padding: 15px;
+    }
+}
+"""
+    
     HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="ko">
@@ -17,106 +429,7 @@ class HTMLExporter(BaseExporter):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ playlist_title }}</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f5f5f5;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #1a1a1a;
-            margin-bottom: 10px;
-            font-size: 2em;
-        }
-        .playlist-info {
-            color: #666;
-            margin-bottom: 20px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #eee;
-        }
-        .playlist-description {
-            margin: 15px 0;
-            color: #555;
-        }
-        .video-count {
-            font-weight: 600;
-            color: #d32f2f;
-        }
-        .videos-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-        .video-card {
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            overflow: hidden;
-            transition: transform 0.2s, box-shadow 0.2s;
-            background: white;
-        }
-        .video-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }
-        .video-thumbnail {
-            width: 100%;
-            height: 180px;
-            object-fit: cover;
-            display: block;
-        }
-        .video-info {
-            padding: 15px;
-        }
-        .video-title {
-            font-weight: 600;
-            margin-bottom: 8px;
-            font-size: 0.95em;
-            line-height: 1.4;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }
-        .video-title a {
-            color: #1a1a1a;
-            text-decoration: none;
-        }
-        .video-title a:hover {
-            color: #d32f2f;
-        }
-        .video-meta {
-            font-size: 0.85em;
-            color: #666;
-            margin-top: 8px;
-        }
-        .video-channel {
-            margin-top: 5px;
-        }
-        @media (max-width: 768px) {
-            .videos-grid {
-                grid-template-columns: 1fr;
-            }
-            .container {
-                padding: 15px;
-            }
-        }
-    </style>
+{{ stylesheet }}
 </head>
 <body>
     <div class="container">
@@ -129,13 +442,14 @@ class HTMLExporter(BaseExporter):
             {% if published_at %}
             <div style="margin-top: 5px; color: #999; font-size: 0.9em;">생성일: {{ published_at }}</div>
             {% endif %}
-        </div>
+        </div>{% if pagination %}
+{{ pagination }}{% endif %}
         
-        <div class="videos-grid">
+        <div class="videos-grid{% if virtual %} virtual{% endif %}">
             {% for video in videos %}
             <div class="video-card">
                 <a href="{{ video.url }}" target="_blank">
-                    <img src="{{ video.thumbnail }}" alt="{{ video.title if video.title else (video.video_id if video.video_id else '영상') }}" class="video-thumbnail" 
+                    <img src="{{ video.thumbnail }}" alt="{{ video.title if video.title else (video.video_id if video.video_id else '영상') }}" class="video-thumbnail" loading="lazy" 
                          onerror="this.src='https://via.placeholder.com/320x180?text=No+Thumbnail'">
                 </a>
                 <div class="video-info">
@@ -151,41 +465,84 @@ class HTMLExporter(BaseExporter):
                 </div>
             </div>
             {% endfor %}
-        </div>
-    </div>
+        </div>{% if pagination %}
+{{ pagination }}{% endif %}
+    </div>{% if scripts %}
+{{ scripts }}{% endif %}
 </body>
 </html>
 """
     
-    def export(self, playlist_data: Dict) -> Path:
+    def __init__(
+        self,
+        output_dir: Path = None,
+        external_css: bool = False,
+        mode: str = "single",
+        page_size: int = 100
+    ):
         """
-        재생목록 데이터를 HTML 파일로 출력
+        초기화
         
         Args:
-            playlist_data: 재생목록 정보와 영상 리스트
-            
-        Returns:
-            생성된 파일 경로
+            output_dir: 출력 디렉토리 경로
+            external_css: True면 스타일을 출력 루트의 playlist.css에 한 번만 저장하고
+                         각 HTML 파일은 이를 참조
+            mode: 'single'(한 파일), 'paged'(page_size개씩 여러 파일), 'virtual'(보이는 카드만 렌더링)
+            page_size: paged 모드에서 한 페이지에 넣을 영상 수
         """
-        # 재생목록별 폴더 생성
-        playlist_dir = self.get_playlist_dir(playlist_data["title"])
-        filename = self.sanitize_filename(playlist_data["title"])
-        filepath = playlist_dir / f"{filename}.html"
-        
-        template = Template(self.HTML_TEMPLATE)
-        html_content = template.render(
-            playlist_title=playlist_data["title"],
-            playlist_description=playlist_data.get("description", ""),
-            video_count=len(playlist_data["videos"]),
-            published_at=playlist_data.get("published_at", ""),
-            videos=playlist_data["videos"]
-        )
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if mode not in HTML_MODES:
+            raise ValueError(f"알 수 없는 HTML 모드입니다: {mode} ({', '.join(HTML_MODES)})")
+        super().__init__(output_dir)
+        self.external_css = external_css
+        self.mode = mode
+        self.page_size = page_size
+        # 템플릿이 바뀌면 이전 출력도 다시 기록하도록 템플릿 내용을 설정에 포함
+        templates = hashlib.blake2b(
+            (self.HTML_TEMPLATE + self.HTML_STYLESHEET + VIRTUAL_SCROLL_SCRIPT).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        self._signature = f"{super().get_output_signature()}:{mode}:{page_size}:{external_css}:{templates}"
+        if external_css:
+            self.write_stylesheet()
+    
+    def get_stylesheet_markup(self) -> str:
+        """<head>에 들어갈 스타일 마크업 (인라인 <style> 또는 외부 스타일시트 링크)"""
+        if self.external_css:
+            # 재생목록 파일은 출력 루트 바로 아래 재생목록 폴더에 저장됨
+            return f'    <link rel="stylesheet" href="../{STYLESHEET_FILENAME}">'
+        return "    <style>\n" + textwrap.indent(self.HTML_STYLESHEET, "        ") + "    </style>"
+    
+    def write_stylesheet(self) -> Path:
+        """
+        출력 루트에 공용 스타일시트 저장
         
-        return filepath
+        Returns:
+            스타일시트 파일 경로
+        """
+        stylesheet_path = self.base_output_dir / STYLESHEET_FILENAME
+        if self.skip_unchanged:
+            try:
+                if stylesheet_path.read_text(encoding="utf-8") == self.HTML_STYLESHEET:
+                    return stylesheet_path
+            except OSError:
+                pass
+        output = AtomicTextFile(stylesheet_path)
+        try:
+            output.file.write(self.HTML_STYLESHEET)
+        except BaseException:
+            output.discard()
+            raise
+        return output.commit()
+    
+    def get_output_signature(self) -> str:
+        return self._signature
+    
+    def create_sink(self, file: TextIO, filepath: Path) -> ExportSink:
+        stylesheet = self.get_stylesheet_markup()
+        if self.mode == "paged":
+            return PagedHTMLSink(file, filepath, stylesheet, self.page_size)
+        if self.mode == "virtual":
+            return VirtualHTMLSink(file, stylesheet)
+        return HTMLSink(file, stylesheet)
     
     def get_file_extension(self) -> str:
         return ".html"
-
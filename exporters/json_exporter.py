@@ -2,44 +2,73 @@
 JSON 형식 출력 모듈
 """
 import json
+import textwrap
 from pathlib import Path
-from typing import Dict
-from exporters.base_exporter import BaseExporter
+from typing import Dict, Iterable, TextIO
+from exporters.base_exporter import BaseExporter, ExportSink
+from models import json_default
+
+
+class JSONSink(ExportSink):
+    """json.dump(indent=2)와 같은 내용을 영상 단위로 기록"""
+    
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        header = {
+            "playlist_id": playlist["id"],
+            "title": playlist["title"],
+            "description": playlist.get("description", ""),
+            "video_count": playlist["video_count"] if "video_count" in playlist else video_count,
+            "published_at": playlist.get("published_at", "")
+        }
+        # 헤더의 닫는 중괄호를 떼고 videos 배열을 이어서 기록
+        self.file.write(json.dumps(header, ensure_ascii=False, indent=2)[:-2])
+        self.file.write(',\n  "videos": [')
+        self._written = 0
+    
+    def write_video(self, index: int, video: Dict) -> None:
+        self.file.write(",\n" if self._written else "\n")
+        self.file.write(textwrap.indent(json.dumps(video, ensure_ascii=False, indent=2, default=json_default), "    "))
+        self._written += 1
+    
+    def end(self) -> None:
+        self.file.write("\n  ]\n}" if self._written else "]\n}")
 
 
 class JSONExporter(BaseExporter):
     """JSON 형식으로 재생목록 데이터 출력"""
     
-    def export(self, playlist_data: Dict) -> Path:
+    supports_streaming = True
+    
+    def export_stream(self, playlist: Dict, videos: Iterable[Dict]) -> Path:
         """
-        재생목록 데이터를 JSON 파일로 출력
+        영상을 받는 즉시 JSON 배열에 기록 (메모리 사용량은 영상 수와 무관)
+        
+        임시 파일에 기록한 뒤 완료되면 원래 파일과 교체하므로, 중간에 실패해도
+        이전 출력 파일은 그대로 남습니다. 결과는 json.dump(indent=2)와 같은 내용입니다.
         
         Args:
-            playlist_data: 재생목록 정보와 영상 리스트
+            playlist: 재생목록 정보 (videos 키는 사용하지 않음)
+            videos: 영상 정보 이터레이터
             
         Returns:
             생성된 파일 경로
         """
         # 재생목록별 폴더 생성
-        playlist_dir = self.get_playlist_dir(playlist_data["title"])
-        filename = self.sanitize_filename(playlist_data["title"])
+        playlist_dir = self.get_playlist_dir(playlist["title"])
+        filename = self.sanitize_filename(playlist["title"])
         filepath = playlist_dir / f"{filename}.json"
         
-        # JSON 직렬화 가능한 형태로 변환
-        output_data = {
-            "playlist_id": playlist_data["id"],
-            "title": playlist_data["title"],
-            "description": playlist_data.get("description", ""),
-            "video_count": playlist_data.get("video_count", len(playlist_data["videos"])),
-            "published_at": playlist_data.get("published_at", ""),
-            "videos": playlist_data["videos"]
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        if "video_count" in playlist:
+            video_count = playlist["video_count"]
+        else:
+            # 영상 수를 미리 알 수 없으면 헤더를 쓰기 전에 모아서 셈
+            videos = list(videos)
+            video_count = len(videos)
         
-        return filepath
+        return self.write_playlist(filepath, playlist, videos, video_count)
+    
+    def create_sink(self, file: TextIO, filepath: Path) -> ExportSink:
+        return JSONSink(file)
     
     def get_file_extension(self) -> str:
         return ".json"
-
@@ -0,0 +1,135 @@
+"""
+출력 파일 변경 여부 매니페스트
+
+재생목록 폴더마다 .export_manifest.json에 출력 파일별 내용 해시와 파일 크기를 기록합니다.
+여러 파일로 나눠 쓰는 형식(페이지별 HTML)은 나머지 파일의 크기도 같은 항목에 기록합니다.
+해시는 재생목록 정보, 영상 목록, 출력 형식 설정(get_output_signature)을 합친 값으로,
+출력 내용은 이 입력만으로 정해지므로(생성 시각 등은 기록하지 않음) 파일을 직렬화하지
+않고도 변경 여부를 알 수 있습니다. 해시와 크기가 그대로면 렌더링과 기록을 모두 건너뛰어
+파일의 수정 시각과 inode가 유지되고, 변경이 없는 실행은 디스크에 거의 쓰지 않습니다.
+단, 영상을 받는 즉시 기록하는 스트리밍 출력은 끝까지 기록한 뒤에야 해시를 알 수 있으므로
+임시 파일은 쓰고 교체만 건너뜁니다.
+
+매니페스트는 파일 교체가 끝난 뒤에만 갱신하므로, 중간에 중단되거나 다른 도구가 파일을
+바꾸면 다음 실행에서 다시 기록합니다.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+from models import PlaylistItem
+
+MANIFEST_FILENAME = ".export_manifest.json"
+# 출력 모듈의 직렬화 방식이 바뀌면 올려서 이전 실행의 해시를 모두 무효화
+MANIFEST_VERSION = 2
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, PlaylistItem):
+        return value.to_dict()
+    return str(value)
+
+
+class ContentHash:
+    """재생목록 정보와 영상 목록의 해시 (영상은 순서대로 하나씩 추가)"""
+
+    def __init__(self, playlist: Dict, video_count: int):
+        """
+        Args:
+            playlist: 재생목록 정보 (videos 키는 사용하지 않음)
+            video_count: 머리말에 기록할 영상 수
+        """
+        self._hash = hashlib.blake2b(digest_size=16)
+        info = {key: value for key, value in playlist.items() if key != "videos"}
+        self._update([MANIFEST_VERSION, video_count, json.dumps(info, sort_keys=True, default=_json_default)])
+
+    def _update(self, value: Any) -> None:
+        encoded = json.dumps(value, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self._hash.update(encoded)
+        self._hash.update(b"\n")
+
+    def add_videos(self, videos: Iterable[Dict]) -> "ContentHash":
+        for video in videos:
+            self._update(video)
+        return self
+
+    def hashing(self, videos: Iterable[Dict]) -> Iterator[Dict]:
+        """영상을 그대로 넘겨주면서 해시에 추가 (스트리밍 출력용)"""
+        for video in videos:
+            self._update(video)
+            yield video
+
+    def digest(self, signature: str) -> str:
+        """
+        출력 형식 설정을 더한 최종 해시
+
+        Args:
+            signature: 출력 모듈의 get_output_signature() 값
+        """
+        result = self._hash.copy()
+        result.update(signature.encode("utf-8"))
+        return result.hexdigest()
+
+
+class ExportManifest:
+    """재생목록 폴더 하나의 출력 파일별 해시 기록"""
+
+    def __init__(self, playlist_dir: Path):
+        self.path = playlist_dir / MANIFEST_FILENAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and isinstance(data.get("files"), dict):
+            self.entries = data["files"]
+
+    def is_current(self, filepath: Path, content_hash: str) -> bool:
+        """기록된 해시가 같고 파일(함께 기록한 파일 포함)도 기록 당시 크기 그대로 남아 있는지 여부"""
+        entry = self.entries.get(filepath.name)
+        if not isinstance(entry, dict) or entry.get("hash") != content_hash:
+            return False
+        extra_files = entry.get("extra_files", {})
+        if not isinstance(extra_files, dict):
+            return False
+        sizes = {filepath.name: entry.get("size"), **extra_files}
+        try:
+            return all((filepath.parent / name).stat().st_size == size for name, size in sizes.items())
+        except OSError:
+            return False
+
+    def record(self, filepath: Path, content_hash: str, extra_files: Iterable[Path] = ()) -> None:
+        """
+        교체가 끝난 출력 파일의 해시 기록 (save() 호출 시 저장)
+
+        Args:
+            filepath: 출력 파일
+            content_hash: ContentHash.digest() 값
+            extra_files: 같은 폴더에 함께 기록한 파일 (예: 2페이지 이후의 HTML)
+        """
+        entry: Dict[str, Any] = {"hash": content_hash, "size": filepath.stat().st_size}
+        extra_sizes = {path.name: path.stat().st_size for path in extra_files}
+        if extra_sizes:
+            entry["extra_files"] = extra_sizes
+        self.entries[filepath.name] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": MANIFEST_VERSION, "files": self.entries},
+                    f, ensure_ascii=False, indent=2, sort_keys=True
+                )
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # 매니페스트를 저장하지 못해도 다음 실행에서 파일을 다시 기록할 뿐임
+            return
+        self._dirty = False
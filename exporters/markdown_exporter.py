@@ -2,55 +2,46 @@
 Markdown 형식 출력 모듈
 """
 from pathlib import Path
-from typing import Dict
-from exporters.base_exporter import BaseExporter
+from typing import Dict, TextIO
+from exporters.base_exporter import BaseExporter, ExportSink
 
 
-class MarkdownExporter(BaseExporter):
-    """Markdown 형식으로 재생목록 데이터 출력"""
+class MarkdownSink(ExportSink):
+    """재생목록을 Markdown 목록으로 기록"""
     
-    def export(self, playlist_data: Dict) -> Path:
-        """
-        재생목록 데이터를 Markdown 파일로 출력
+    def begin(self, playlist: Dict, video_count: int) -> None:
+        f = self.file
+        # 헤더
+        f.write(f"# {playlist['title']}\n\n")
         
-        Args:
-            playlist_data: 재생목록 정보와 영상 리스트
-            
-        Returns:
-            생성된 파일 경로
-        """
-        # 재생목록별 폴더 생성
-        playlist_dir = self.get_playlist_dir(playlist_data["title"])
-        filename = self.sanitize_filename(playlist_data["title"])
-        filepath = playlist_dir / f"{filename}.md"
+        # 재생목록 정보
+        if playlist.get("description"):
+            f.write(f"{playlist['description']}\n\n")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # 헤더
-            f.write(f"# {playlist_data['title']}\n\n")
-            
-            # 재생목록 정보
-            if playlist_data.get("description"):
-                f.write(f"{playlist_data['description']}\n\n")
-            
-            f.write(f"**영상 개수:** {len(playlist_data['videos'])}\n\n")
-            f.write(f"**생성일:** {playlist_data.get('published_at', 'N/A')}\n\n")
-            f.write("---\n\n")
-            
-            # 영상 목록
-            f.write("## 영상 목록\n\n")
-            
-            for idx, video in enumerate(playlist_data["videos"], 1):
-                # 제목이 없으면 영상 ID 사용
-                title = video.get('title') or video.get('video_id') or f"영상 {idx}"
-                f.write(f"{idx}. [{title}]({video['url']})\n")
-                if video.get("channel_title"):
-                    f.write(f"   - 채널: {video['channel_title']}\n")
-                if video.get("added_at"):
-                    f.write(f"   - 추가일: {video['added_at']}\n")
-                f.write("\n")
+        f.write(f"**영상 개수:** {video_count}\n\n")
+        f.write(f"**생성일:** {playlist.get('published_at', 'N/A')}\n\n")
+        f.write("---\n\n")
         
-        return filepath
+        # 영상 목록
+        f.write("## 영상 목록\n\n")
+    
+    def write_video(self, index: int, video: Dict) -> None:
+        f = self.file
+        # 제목이 없으면 영상 ID 사용
+        title = video.get('title') or video.get('video_id') or f"영상 {index}"
+        f.write(f"{index}. [{title}]({video['url']})\n")
+        if video.get("channel_title"):
+            f.write(f"   - 채널: {video['channel_title']}\n")
+        if video.get("added_at"):
+            f.write(f"   - 추가일: {video['added_at']}\n")
+        f.write("\n")
+
+
+class MarkdownExporter(BaseExporter):
+    """Markdown 형식으로 재생목록 데이터 출력"""
+    
+    def create_sink(self, file: TextIO, filepath: Path) -> ExportSink:
+        return MarkdownSink(file)
     
     def get_file_extension(self) -> str:
         return ".md"
-
@@ -0,0 +1,179 @@
+"""
+여러 출력 형식을 한 번에 기록하는 출력 파이프라인
+
+재생목록마다 영상 리스트를 한 번만 순회하면서 등록된 모든 형식의 출력 대상(sink)에
+영상을 전달합니다. 파일명 정리와 디렉토리 생성은 형식과 관계없이 한 번만 수행하고,
+형식별 직렬화 시간을 따로 집계합니다.
+
+내용 해시가 재생목록 폴더의 매니페스트와 같은 형식은 렌더링하지 않고 기존 파일을 그대로
+둡니다 (ExportOutcome.skipped). 해시는 재생목록마다 한 번만 계산합니다.
+"""
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from exporters.base_exporter import AtomicTextFile, BaseExporter, ExportSink
+from exporters.manifest import ContentHash, ExportManifest
+
+
+@dataclass
+class ExportOutcome:
+    """형식 하나의 출력 결과"""
+    exporter: BaseExporter
+    path: Optional[Path] = None
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+    # 내용이 이전 출력과 같아 파일을 다시 쓰지 않았는지 여부
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.path is not None
+
+
+class _ActiveSink:
+    def __init__(
+        self,
+        outcome: ExportOutcome,
+        output: AtomicTextFile,
+        sink: ExportSink,
+        manifest: Optional[ExportManifest],
+        content_hash: Optional[str]
+    ):
+        self.outcome = outcome
+        self.output = output
+        self.sink = sink
+        self.manifest = manifest
+        self.content_hash = content_hash
+
+    def fail(self, error: Exception) -> None:
+        self.outcome.error = error
+        self.sink.abort()
+        self.output.discard()
+
+
+class ExportPipeline:
+    """등록된 출력 모듈들에 재생목록을 한 번의 순회로 기록"""
+
+    def __init__(self, exporters: List[BaseExporter]):
+        """
+        초기화
+
+        Args:
+            exporters: 출력 모듈 리스트 (기록 순서 = 리스트 순서)
+        """
+        self.exporters = exporters
+        # 형식(확장자)별 누적 기록 시간 (초)
+        self.timings: Dict[str, float] = {
+            exporter.get_file_extension(): 0.0 for exporter in exporters
+        }
+
+    def export(self, playlist_data: Dict) -> List[ExportOutcome]:
+        """
+        재생목록 데이터를 모든 형식으로 출력
+
+        한 형식에서 오류가 나도 나머지 형식은 계속 기록하며, 실패한 형식의
+        이전 출력 파일은 그대로 남습니다.
+
+        Args:
+            playlist_data: 재생목록 정보와 영상 리스트
+
+        Returns:
+            출력 모듈 순서대로의 결과 리스트
+        """
+        outcomes = [ExportOutcome(exporter) for exporter in self.exporters]
+        if not self.exporters:
+            return outcomes
+
+        videos = playlist_data["videos"]
+        filename = self.exporters[0].sanitize_filename(playlist_data["title"])
+        created_dirs = set()
+        active: List[_ActiveSink] = []
+        content: Optional[ContentHash] = None
+        manifests: Dict[Path, ExportManifest] = {}
+
+        try:
+            for outcome in outcomes:
+                exporter = outcome.exporter
+                started = time.perf_counter()
+                output = None
+                sink = None
+                try:
+                    if not exporter.has_sink():
+                        # 출력 대상을 제공하지 않는 모듈은 기존 방식으로 기록
+                        outcome.path = exporter.export(playlist_data)
+                    else:
+                        playlist_dir = exporter.base_output_dir / filename
+                        if playlist_dir not in created_dirs:
+                            playlist_dir.mkdir(parents=True, exist_ok=True)
+                            created_dirs.add(playlist_dir)
+                        filepath = playlist_dir / f"{filename}{exporter.get_file_extension()}"
+                        manifest = None
+                        content_hash = None
+                        if exporter.skip_unchanged:
+                            if content is None:
+                                content = ContentHash(playlist_data, len(videos)).add_videos(videos)
+                            content_hash = content.digest(exporter.get_output_signature())
+                            if playlist_dir not in manifests:
+                                manifests[playlist_dir] = ExportManifest(playlist_dir)
+                            manifest = manifests[playlist_dir]
+                            if manifest.is_current(filepath, content_hash):
+                                outcome.path = filepath
+                                outcome.skipped = True
+                        if not outcome.skipped:
+                            output = AtomicTextFile(filepath)
+                            sink = exporter.create_sink(output.file, output.filepath)
+                            sink.begin(playlist_data, len(videos))
+                            active.append(_ActiveSink(outcome, output, sink, manifest, content_hash))
+                except Exception as e:
+                    outcome.error = e
+                    if sink is not None:
+                        sink.abort()
+                    if output is not None:
+                        output.discard()
+                outcome.seconds += time.perf_counter() - started
+
+            for index, video in enumerate(videos, 1):
+                for entry in active:
+                    if entry.outcome.error is not None:
+                        continue
+                    started = time.perf_counter()
+                    try:
+                        entry.sink.write_video(index, video)
+                    except Exception as e:
+                        entry.fail(e)
+                    entry.outcome.seconds += time.perf_counter() - started
+
+            for entry in active:
+                if entry.outcome.error is not None:
+                    continue
+                started = time.perf_counter()
+                try:
+                    entry.sink.end()
+                    entry.outcome.path = entry.output.commit()
+                except Exception as e:
+                    entry.fail(e)
+                else:
+                    if entry.manifest is not None:
+                        entry.manifest.record(entry.outcome.path, entry.content_hash, entry.sink.extra_files())
+                entry.outcome.seconds += time.perf_counter() - started
+        except BaseException:
+            # 중단(KeyboardInterrupt 등) 시 기록 중이던 임시 파일 정리
+            for entry in active:
+                if entry.outcome.path is None and entry.outcome.error is None:
+                    entry.sink.abort()
+                    entry.output.discard()
+            raise
+        finally:
+            # 교체를 마친 파일의 해시만 기록 (중단되어도 완료된 형식은 다음 실행에서 건너뜀)
+            for manifest in manifests.values():
+                manifest.save()
+
+        for outcome in outcomes:
+            self.timings[outcome.exporter.get_file_extension()] += outcome.seconds
+        return outcomes
+
+    def format_timings(self) -> str:
+        """형식별 누적 기록 시간 요약 문자열"""
+        return ", ".join(f"{extension[1:]} {seconds:.2f}초" for extension, seconds in self.timings.items())
@@ -6,18 +6,32 @@ import sys
 from pathlib import Path
 from youtube_api import YouTubeAPI
 from playlist_extractor import PlaylistExtractor
+from quota import QuotaScheduler, format_plan
+from snapshot_store import PlaylistSnapshotStore
+from checkpoint import CheckpointJournal
 from exporters.json_exporter import JSONExporter
 from exporters.markdown_exporter import MarkdownExporter
-from exporters.html_exporter import HTMLExporter
+from exporters.html_exporter import HTML_MODES, HTMLExporter
+from exporters.pipeline import ExportPipeline
+from exporters.export_pool import EXPORT_MODES, ExportPool
+from search_index import build_search_index, print_summary as print_search_summary
 import config
 
 
-def get_exporters(output_formats: list) -> list:
+def get_exporters(
+    output_formats: list,
+    external_css: bool = False,
+    html_mode: str = "single",
+    html_page_size: int = 100
+) -> list:
     """
     출력 형식에 맞는 Exporter 인스턴스 리스트 반환
     
     Args:
         output_formats: 출력 형식 리스트 ('json', 'markdown', 'html')
+        external_css: True면 HTML 스타일을 출력 루트의 공용 스타일시트로 저장
+        html_mode: HTML 출력 방식 ('single', 'paged', 'virtual')
+        html_page_size: paged 모드에서 한 페이지에 넣을 영상 수
         
     Returns:
         Exporter 인스턴스 리스트
@@ -32,13 +46,32 @@ def get_exporters(output_formats: list) -> list:
         elif fmt == 'markdown' or fmt == 'md':
             exporters.append(MarkdownExporter(output_dir))
         elif fmt == 'html':
-            exporters.append(HTMLExporter(output_dir))
+            exporters.append(HTMLExporter(
+                output_dir,
+                external_css=external_css,
+                mode=html_mode,
+                page_size=html_page_size
+            ))
         else:
             print(f"경고: 알 수 없는 출력 형식 '{fmt}'는 무시됩니다.")
     
     return exporters
 
 
+def build_search_page(exporters: list) -> None:
+    """
+    출력 디렉토리의 재생목록 JSON으로 전체 재생목록 검색 색인 생성
+    
+    Args:
+        exporters: 이번 실행의 Exporter 인스턴스 리스트
+    """
+    if not any(isinstance(exporter, JSONExporter) for exporter in exporters):
+        print("⚠️  검색 색인은 JSON 출력 파일로 만들므로 --format에 json을 포함해야 합니다.")
+        return
+    print("\n전체 재생목록 검색 색인 생성 중...")
+    print_search_summary(build_search_index(config.OUTPUT_DIR), config.OUTPUT_DIR)
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(
@@ -55,6 +88,23 @@ def main():
         default=','.join(config.OUTPUT_FORMATS),
         help='출력 형식 (쉼표로 구분: json,markdown,html)'
     )
+    parser.add_argument(
+        '--external-css',
+        action='store_true',
+        help='HTML 스타일을 출력 디렉토리의 playlist.css 하나로 저장하고 각 HTML 파일에서 참조'
+    )
+    parser.add_argument(
+        '--html-mode',
+        choices=HTML_MODES,
+        default=config.HTML_MODE,
+        help=f'HTML 출력 방식 (single: 한 파일, paged: 페이지별 파일, virtual: 보이는 영상만 렌더링, 기본값: {config.HTML_MODE})'
+    )
+    parser.add_argument(
+        '--html-page-size',
+        type=int,
+        default=config.HTML_PAGE_SIZE,
+        help=f'paged 모드에서 페이지당 영상 수 (기본값: {config.HTML_PAGE_SIZE})'
+    )
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -65,6 +115,44 @@ def main():
         type=str,
         help='YouTube API 키 (선택사항, OAuth 2.0이 기본값이며 권장됩니다)'
     )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='저장된 스냅샷을 무시하고 변경되지 않은 재생목록까지 모두 다시 추출'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='이전 실행이 중단된 지점(체크포인트)부터 이어서 추출'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=config.EXTRACT_CONCURRENCY,
+        help=f'동시에 추출할 재생목록 수 (기본값: {config.EXTRACT_CONCURRENCY}, 1이면 순차 처리)'
+    )
+    parser.add_argument(
+        '--export-concurrency',
+        type=int,
+        default=config.EXPORT_CONCURRENCY,
+        help=f'파일 저장 워커 수 (기본값: {config.EXPORT_CONCURRENCY}, 0이면 추출 후 바로 저장)'
+    )
+    parser.add_argument(
+        '--export-mode',
+        choices=EXPORT_MODES,
+        default=config.EXPORT_MODE,
+        help=f'파일 저장 워커 실행 방식 (기본값: {config.EXPORT_MODE})'
+    )
+    parser.add_argument(
+        '--force-write',
+        action='store_true',
+        help='내용이 바뀌지 않은 출력 파일도 모두 다시 기록 (기본값: 변경된 파일만 기록)'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='저장 후 전체 재생목록 검색 색인과 search.html 생성 (json 형식 필요)'
+    )
     
     args = parser.parse_args()
     
@@ -72,9 +160,17 @@ def main():
     if args.output_dir:
         config.OUTPUT_DIR = Path(args.output_dir)
     
+    if args.force_write:
+        config.EXPORT_SKIP_UNCHANGED = False
+    
     # 출력 형식 파싱
     output_formats = [f.strip() for f in args.format.split(',')]
-    exporters = get_exporters(output_formats)
+    exporters = get_exporters(
+        output_formats,
+        external_css=args.external_css,
+        html_mode=args.html_mode,
+        html_page_size=args.html_page_size
+    )
     
     if not exporters:
         print("오류: 유효한 출력 형식이 없습니다.")
@@ -85,7 +181,14 @@ def main():
     youtube_api = YouTubeAPI(api_key=args.api_key)
     
     # 재생목록 추출기 초기화
-    extractor = PlaylistExtractor(youtube_api)
+    extractor = PlaylistExtractor(
+        youtube_api,
+        concurrency=args.concurrency,
+        snapshot_store=PlaylistSnapshotStore(config.SNAPSHOT_DIR),
+        incremental=not args.full,
+        journal=CheckpointJournal(config.CHECKPOINT_DIR),
+        resume=args.resume
+    )
     
     try:
         # 재생목록 추출 및 파일 출력
@@ -97,13 +200,17 @@ def main():
             # 파일 출력
             print(f"\n재생목록을 {len(exporters)}가지 형식으로 저장 중...")
             total_files = 0
-            for exporter in exporters:
-                try:
-                    filepath = exporter.export(playlist_data)
+            for outcome in ExportPipeline(exporters).export(playlist_data):
+                if outcome.ok:
                     total_files += 1
-                    print(f"  ✓ {filepath.name} 생성 완료")
-                except Exception as e:
-                    print(f"  ✗ {playlist_data['title']} ({exporter.get_file_extension()}) 저장 실패: {e}")
+                    if outcome.skipped:
+                        print(f"  = {outcome.path.name} 변경 없음")
+                    else:
+                        print(f"  ✓ {outcome.path.name} 생성 완료 ({outcome.seconds:.2f}초)")
+                else:
+                    print(f"  ✗ {playlist_data['title']} ({outcome.exporter.get_file_extension()}) 저장 실패: {outcome.error}")
+            if total_files == len(exporters):
+                extractor.commit_playlist(playlist_data)
             
             print(f"\n완료! 총 {total_files}개의 파일이 생성되었습니다.")
             print(f"출력 디렉토리: {config.OUTPUT_DIR.absolute()}")
@@ -114,41 +221,115 @@ def main():
             total_files = 0
             total_playlists = 0
             
-            # 재생목록을 하나씩 추출하고 즉시 저장
+            # 재생목록을 추출하고 즉시 저장 (동시 추출 시에도 결과는 목록 순서대로 반환)
             playlists = extractor.youtube_api.get_all_playlists()
-            print(f"총 {len(playlists)}개의 재생목록을 찾았습니다.\n")
+            print(f"총 {len(playlists)}개의 재생목록을 찾았습니다.")
             
-            for idx, playlist in enumerate(playlists, 1):
-                try:
-                    print(f"[{idx}/{len(playlists)}] {playlist['title']} 처리 중...")
-                    videos = extractor._extract_playlist_videos(playlist)
-                    playlist_data = {
-                        **playlist,
-                        "videos": videos
-                    }
-                    print(f"✓ {playlist['title']}: {len(videos)}개 영상 추출 완료")
-                    
-                    # 즉시 파일 저장
-                    for exporter in exporters:
-                        try:
-                            filepath = exporter.export(playlist_data)
-                            total_files += 1
-                            print(f"  → {filepath.parent.name}/{filepath.name} 저장 완료")
-                        except Exception as e:
-                            print(f"  ✗ {playlist['title']} ({exporter.get_file_extension()}) 저장 실패: {e}")
+            # 마지막 실행 이후 메타데이터(etag, itemCount)가 그대로이고 출력 파일도 있으면 건너뜀
+            unchanged_ids = {
+                playlist["id"] for playlist in extractor.unchanged_playlists(playlists)
+                if all(exporter.get_output_path(playlist["title"]).exists() for exporter in exporters)
+            }
+            if unchanged_ids:
+                print(f"변경되지 않은 재생목록 {len(unchanged_ids)}개는 건너뜁니다. (전체 재추출: --full)")
+                playlists = [playlist for playlist in playlists if playlist["id"] not in unchanged_ids]
+            
+            # 남은 일일 할당량 안에서 실행 가능한지 미리 예측하고, 부족하면 뒤쪽 재생목록을 미룸
+            quota_plan = QuotaScheduler(youtube_api.quota_ledger).plan(playlists)
+            print("할당량 예측")
+            for line in format_plan(quota_plan):
+                print(line)
+            for playlist in quota_plan.deferred_playlists:
+                print(f"  ⏭  {playlist['title']} (다음 실행으로 미룸)")
+            playlists = quota_plan.scheduled_playlists
+            if extractor.concurrency > 1:
+                print(f"{extractor.concurrency}개 재생목록을 동시에 추출합니다.")
+            print()
+            
+            timings = None
+            if len(exporters) == 1 and exporters[0].supports_streaming:
+                # 출력 형식이 하나이고 스트리밍을 지원하면 영상을 페이지 단위로 바로 기록
+                streamed = extractor.iter_streamed_exports(playlists, exporters[0])
+                for idx, (playlist, filepath, video_count, error) in enumerate(streamed, 1):
+                    print(f"[{idx}/{len(playlists)}] {playlist['title']}")
+                    if error is not None:
+                        print(f"✗ {playlist['title']} 추출 실패: {error}\n")
+                        continue
                     
+                    print(f"✓ {playlist['title']}: {video_count}개 영상 추출 완료")
+                    print(f"  → {filepath.parent.name}/{filepath.name} 저장 완료")
+                    total_files += 1
+                    extractor.commit_playlist(playlist)
                     total_playlists += 1
                     print()
+            else:
+                # 추출 결과를 출력 워커에 넘기고 바로 다음 재생목록을 추출
+                # (대기열이 가득 차면 저장이 따라올 때까지 추출이 잠시 멈춤)
+                pool = ExportPool(exporters, workers=args.export_concurrency, mode=args.export_mode)
+                
+                def report(result) -> int:
+                    exported = 0
+                    if result.error is not None:
+                        print(f"  ✗ {result.playlist['title']} 저장 실패: {result.error}")
+                    for outcome in result.outcomes:
+                        if outcome.ok:
+                            exported += 1
+                            if outcome.skipped:
+                                print(f"  = {outcome.path.parent.name}/{outcome.path.name} 변경 없음")
+                            else:
+                                print(f"  → {outcome.path.parent.name}/{outcome.path.name} 저장 완료 ({outcome.seconds:.2f}초)")
+                        else:
+                            print(f"  ✗ {result.playlist['title']} ({outcome.exporter.get_file_extension()}) 저장 실패: {outcome.error}")
+                    
+                    # 모든 형식이 저장된 경우에만 스냅샷 갱신 (다음 실행에서 건너뛸 수 있도록)
+                    if result.ok and exported == len(exporters):
+                        extractor.commit_playlist(result.playlist)
+                    return exported
+                
+                with pool:
+                    results = extractor.iter_playlist_results(playlists)
+                    for idx, (playlist, videos, error) in enumerate(results, 1):
+                        print(f"[{idx}/{len(playlists)}] {playlist['title']}")
+                        if error is not None:
+                            print(f"✗ {playlist['title']} 추출 실패: {error}\n")
+                            continue
+                        
+                        print(f"✓ {playlist['title']}: {len(videos)}개 영상 추출 완료")
+                        pool.submit({
+                            **playlist,
+                            "videos": videos
+                        })
+                        total_playlists += 1
+                        
+                        for result in pool.completed():
+                            total_files += report(result)
+                        print()
                     
-                except Exception as e:
-                    print(f"✗ {playlist['title']} 추출 실패: {e}\n")
+                    for result in pool.drain():
+                        total_files += report(result)
+                timings = pool.format_timings()
             
             print(f"\n{'='*50}")
             print(f"완료! 총 {total_playlists}개 재생목록, {total_files}개 파일이 생성되었습니다.")
+            if timings:
+                print(f"형식별 저장 시간: {timings}")
             print(f"출력 디렉토리: {config.OUTPUT_DIR.absolute()}")
         
+        if args.search_index:
+            build_search_page(exporters)
+        
+        ledger = youtube_api.quota_ledger
+        ledger.flush()
+        print(f"오늘 사용한 할당량: {ledger.used_today()}/{ledger.daily_budget} units")
+        cache_stats = youtube_api.metadata_cache.stats()
+        print(
+            f"영상 메타데이터 캐시: {cache_stats['entries']}개 영상 "
+            f"(적중 {cache_stats['hits']}, 미스 {cache_stats['misses']})"
+        )
+        
     except KeyboardInterrupt:
         print("\n\n작업이 사용자에 의해 중단되었습니다.")
+        print("완료된 페이지는 체크포인트에 기록되었습니다. --resume 옵션으로 이어서 실행할 수 있습니다.")
         sys.exit(1)
     except Exception as e:
         print(f"\n오류 발생: {e}")
@@ -0,0 +1,189 @@
+"""
+Persistent video metadata cache.
+
+Titles, channel names and thumbnails are kept in a SQLite database keyed by
+video ID. Every field carries its own fetch time and is only served while
+younger than its TTL (a TTL of None never expires). The number of cached
+videos is capped; the least recently used videos are evicted first. Hit/miss
+counters are kept per process so runs can report how much was served locally.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+DAY = 24 * 60 * 60
+
+# Per-field time-to-live in seconds.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "title": 7 * DAY,
+    "description": 7 * DAY,
+    "channel_title": 30 * DAY,
+    "thumbnail": 30 * DAY,
+    "published_at": None,
+}
+FIELDS = tuple(DEFAULT_TTLS)
+DEFAULT_MAX_ENTRIES = 100_000
+# Stay well below SQLite's host parameter limit.
+_QUERY_CHUNK = 500
+
+
+class VideoMetadataCache:
+    """Thread-safe SQLite cache of per-video metadata fields."""
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path) if path else None
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            database = str(self.path)
+        else:
+            database = ":memory:"
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS videos_last_access ON videos (last_access);
+            CREATE TABLE IF NOT EXISTS fields (
+                video_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (video_id, name)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def _is_fresh(self, name: str, fetched_at: float, now: float) -> bool:
+        ttl = self.ttls.get(name)
+        return ttl is None or now - fetched_at < ttl
+
+    def get_many(
+        self, video_ids: Iterable[str], fields: Sequence[str] = FIELDS
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Return cached metadata for the videos whose requested fields are all
+        present and fresh. Every requested video counts as one hit or miss.
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        now = self._clock()
+        found: Dict[str, Dict[str, str]] = {}
+        with self._lock:
+            for start in range(0, len(video_ids), _QUERY_CHUNK):
+                chunk = video_ids[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT video_id, name, value, fetched_at FROM fields "
+                    f"WHERE video_id IN ({placeholders})",
+                    chunk,
+                )
+                for video_id, name, value, fetched_at in rows:
+                    if name in fields and self._is_fresh(name, fetched_at, now):
+                        found.setdefault(video_id, {})[name] = value
+
+            result = {
+                video_id: values
+                for video_id, values in found.items()
+                if all(name in values for name in fields)
+            }
+            self.hits += len(result)
+            self.misses += len(video_ids) - len(result)
+            if result:
+                self._conn.executemany(
+                    "UPDATE videos SET last_access = ? WHERE video_id = ?",
+                    [(now, video_id) for video_id in result],
+                )
+                self._conn.commit()
+        return result
+
+    def get(self, video_id: str, fields: Sequence[str] = FIELDS) -> Optional[Dict[str, str]]:
+        return self.get_many([video_id], fields).get(video_id)
+
+    def put_many(self, metadata: Dict[str, Dict[str, str]]) -> None:
+        """Store the known fields of each video; unknown keys are ignored."""
+        now = self._clock()
+        field_rows = [
+            (video_id, name, str(value), now)
+            for video_id, values in metadata.items()
+            for name, value in values.items()
+            if name in self.ttls and value is not None
+        ]
+        if not field_rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO videos (video_id, last_access) VALUES (?, ?) "
+                "ON CONFLICT(video_id) DO UPDATE SET last_access = excluded.last_access",
+                [(video_id, now) for video_id in metadata],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fields (video_id, name, value, fetched_at) VALUES (?, ?, ?, ?)",
+                field_rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def put(self, video_id: str, values: Dict[str, str]) -> None:
+        self.put_many({video_id: values})
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        victims = [
+            (video_id,)
+            for (video_id,) in self._conn.execute(
+                "SELECT video_id FROM videos ORDER BY last_access LIMIT ?", (excess,)
+            )
+        ]
+        self._conn.executemany("DELETE FROM fields WHERE video_id = ?", victims)
+        self._conn.executemany("DELETE FROM videos WHERE video_id = ?", victims)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[VideoMetadataCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_metadata_cache() -> VideoMetadataCache:
+    """Process-wide cache configured from config.METADATA_CACHE_PATH / METADATA_CACHE_MAX_ENTRIES."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            import config
+
+            _shared_cache = VideoMetadataCache(
+                config.METADATA_CACHE_PATH, max_entries=config.METADATA_CACHE_MAX_ENTRIES
+            )
+        return _shared_cache
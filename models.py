@@ -0,0 +1,213 @@
+"""
+Compact in-memory model for playlist items.
+
+PlaylistItem stores one video of a playlist in __slots__. The watch URL is
+computed from the video ID on access, the thumbnail is only stored when it
+differs from the standard hqdefault image, and channel names are interned.
+
+PlaylistItem is a MutableMapping: item["title"], item.get("url"),
+item.update(...), dict(item) and equality with dicts work, and templates can
+use attribute access (item.title, item.url). Keys are reported in the order of
+the item's layout ("api" or "takeout"). json.dumps needs
+``default=json_default`` to serialize items.
+"""
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+WATCH_URL = "https://www.youtube.com/watch?v={}"
+THUMBNAIL_URL = "https://i.ytimg.com/vi/{}/hqdefault.jpg"
+
+# Key order of items built from playlistItems.list responses.
+API_LAYOUT: Tuple[str, ...] = (
+    "playlist_item_id", "video_id", "title", "description", "thumbnail",
+    "url", "position", "added_at", "channel_title",
+)
+# Key order of items built from Takeout CSV rows.
+TAKEOUT_LAYOUT: Tuple[str, ...] = (
+    "video_id", "url", "added_at", "title", "description", "thumbnail",
+    "channel_title", "position",
+)
+LAYOUTS = {"api": API_LAYOUT, "takeout": TAKEOUT_LAYOUT}
+_KNOWN_LAYOUTS = {layout: layout for layout in LAYOUTS.values()}
+
+_STORED_FIELDS = frozenset(
+    ("playlist_item_id", "video_id", "title", "description", "position", "added_at", "channel_title")
+)
+_FIELDS = _STORED_FIELDS | {"thumbnail", "url"}
+
+
+def watch_url(video_id: str) -> str:
+    return WATCH_URL.format(video_id)
+
+
+def default_thumbnail(video_id: str) -> str:
+    return THUMBNAIL_URL.format(video_id)
+
+
+class PlaylistItem(MutableMapping):
+    """One playlist entry stored in slots and exposed as a mapping."""
+
+    __slots__ = (
+        "layout", "playlist_item_id", "video_id", "title", "description",
+        "_thumbnail", "position", "added_at", "_channel_title", "_extra",
+    )
+
+    def __init__(
+        self,
+        video_id: str,
+        layout: Union[str, Tuple[str, ...]] = "api",
+        playlist_item_id: Optional[str] = None,
+        title: str = "",
+        description: str = "",
+        thumbnail: Optional[str] = None,
+        position: int = 0,
+        added_at: str = "",
+        channel_title: str = "",
+    ):
+        """
+        Args:
+            video_id: YouTube video ID.
+            layout: "api", "takeout" or a tuple of keys (key order of the mapping).
+            thumbnail: Thumbnail URL; None means the standard hqdefault image.
+        """
+        self.layout = LAYOUTS[layout] if isinstance(layout, str) else _KNOWN_LAYOUTS.get(layout, layout)
+        self.playlist_item_id = playlist_item_id
+        self.video_id = video_id
+        self.title = title
+        self.description = description
+        self._thumbnail = None
+        self.position = position
+        self.added_at = added_at
+        self._channel_title = ""
+        self._extra: Optional[Dict[str, Any]] = None
+        self.thumbnail = thumbnail
+        self.channel_title = channel_title
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> Union["PlaylistItem", Mapping]:
+        """
+        Rebuild an item from a dict with one of the known layouts (e.g. one read
+        back from a snapshot). Dicts that cannot be represented exactly are
+        returned unchanged.
+        """
+        if isinstance(data, PlaylistItem):
+            return data
+        layout = _KNOWN_LAYOUTS.get(tuple(data))
+        video_id = data.get("video_id")
+        if layout is None or not isinstance(video_id, str) or data.get("url") != watch_url(video_id):
+            return data
+        return cls(
+            video_id,
+            layout,
+            playlist_item_id=data.get("playlist_item_id"),
+            title=data["title"],
+            description=data["description"],
+            thumbnail=data["thumbnail"],
+            position=data["position"],
+            added_at=data["added_at"],
+            channel_title=data["channel_title"],
+        )
+
+    @property
+    def url(self) -> str:
+        if self._extra and "url" in self._extra:
+            return self._extra["url"]
+        return watch_url(self.video_id)
+
+    @property
+    def thumbnail(self) -> str:
+        if self._thumbnail is None:
+            return default_thumbnail(self.video_id)
+        return self._thumbnail
+
+    @thumbnail.setter
+    def thumbnail(self, value: Optional[str]) -> None:
+        self._thumbnail = None if value is None or value == default_thumbnail(self.video_id) else value
+
+    @property
+    def channel_title(self) -> str:
+        return self._channel_title
+
+    @channel_title.setter
+    def channel_title(self, value: str) -> None:
+        self._channel_title = sys.intern(value) if type(value) is str else value
+
+    def __getitem__(self, key: str) -> Any:
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        if key in self.layout:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELDS:
+            if key == "url":
+                if value == watch_url(self.video_id):
+                    if self._extra:
+                        self._extra.pop("url", None)
+                else:
+                    self._extra = {**(self._extra or {}), "url": value}
+            else:
+                setattr(self, key, value)
+            if key not in self.layout:
+                self.layout = self.layout + (key,)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if self._extra:
+            self._extra.pop(key, None)
+        if key in self.layout:
+            self.layout = tuple(name for name in self.layout if name != key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.layout
+        if self._extra:
+            for key in self._extra:
+                if key not in self.layout:
+                    yield key
+
+    def __len__(self) -> int:
+        extra = sum(1 for key in self._extra if key not in self.layout) if self._extra else 0
+        return len(self.layout) + extra
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.layout or bool(self._extra and key in self._extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    def __repr__(self) -> str:
+        return f"PlaylistItem({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return _restore, (
+            self.layout, self.playlist_item_id, self.video_id, self.title, self.description,
+            self._thumbnail, self.position, self.added_at, self._channel_title, self._extra,
+        )
+
+
+def _restore(layout, playlist_item_id, video_id, title, description, thumbnail, position, added_at,
+             channel_title, extra) -> PlaylistItem:
+    item = PlaylistItem(
+        video_id, layout, playlist_item_id, title, description, thumbnail, position, added_at, channel_title
+    )
+    item._extra = extra
+    return item
+
+
+def items_from_dicts(videos: Iterable[Mapping]) -> List[Union[PlaylistItem, Mapping]]:
+    """Convert decoded video dicts to PlaylistItem where the layout allows it."""
+    return [PlaylistItem.from_dict(video) for video in videos]
+
+
+def json_default(value: Any) -> Any:
+    """``default=`` hook for json.dump(s) that serializes PlaylistItem as a dict."""
+    if isinstance(value, PlaylistItem):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
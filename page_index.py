@@ -0,0 +1,65 @@
+"""
+Disk-backed index of stored playlistItems pages.
+
+Snapshots and checkpoint journals store one page per JSONL line. Loading them
+only records each page's token, ETag and byte offset; the videos of a page are
+read back from disk when they are actually needed (a 304 Not Modified answer,
+or replaying a journal on resume), so memory stays bounded by a single page no
+matter how large the playlist is.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from models import items_from_dicts
+
+
+class PageIndex:
+    """page_token → (ETag, line offset) of the pages stored in one JSONL file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._etags: Dict[Optional[str], Optional[str]] = {}
+        self._offsets: Dict[Optional[str], int] = {}
+        # next_page_token of the last indexed page (where a resume continues)
+        self.next_page_token: Optional[str] = None
+
+    def add(self, record: Dict, offset: int) -> None:
+        page_token = record.get("page_token")
+        self._etags[page_token] = record.get("etag")
+        self._offsets[page_token] = offset
+        self.next_page_token = record.get("next_page_token")
+
+    def etag(self, page_token: Optional[str]) -> Optional[str]:
+        return self._etags.get(page_token)
+
+    def load(self, page_token: Optional[str]) -> Dict:
+        """Read one stored page (page_token, etag, next_page_token, videos) from disk."""
+        with open(self.path, "rb") as f:
+            return self._read(f, self._offsets[page_token])
+
+    def iter_pages(self) -> Iterator[Dict]:
+        """Stored pages in file order, read one at a time."""
+        with open(self.path, "rb") as f:
+            for offset in list(self._offsets.values()):
+                yield self._read(f, offset)
+
+    @staticmethod
+    def _read(f, offset: int) -> Dict:
+        f.seek(offset)
+        record = json.loads(f.readline())
+        return {
+            "page_token": record.get("page_token"),
+            "etag": record.get("etag"),
+            "next_page_token": record.get("next_page_token"),
+            "videos": items_from_dicts(record.get("videos") or []),
+        }
+
+    def __contains__(self, page_token: object) -> bool:
+        return page_token in self._offsets
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
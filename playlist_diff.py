@@ -0,0 +1,399 @@
+"""
+Diff two playlist snapshots into a compact changeset.
+
+Nightly exports are mostly identical to the previous night's, so downstream
+consumers only need what changed. A snapshot is a JSONExporter output file, an
+output directory of them (playlists are paired by playlist ID), or, with
+--live, the current state of the playlist read from the API.
+
+Items are matched by playlist_item_id when both sides have one, and otherwise
+by video ID and occurrence (the n-th copy of a video in the playlist), so
+Takeout exports without playlist item IDs can be compared too. The base
+snapshot is streamed into hash maps of key -> base position plus an 8-byte
+fingerprint of each item's fields; the target is streamed against them, so
+only changed items are ever held in full and matching is linear.
+
+Matched items whose base positions, read in target order, form the longest
+increasing subsequence kept their relative order; only the rest are reported
+as moved. Inserting one video at the top therefore yields one "added" entry
+instead of every item moving by one. The LIS takes O(n log n).
+
+Changeset entries refer to base items by their base position ("from") and
+place items by their target position ("to"); apply_changeset() rebuilds the
+target order from the base items and the changeset.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from deduplicator import ITEMS_KEYS, PLAYLIST_ITEM_ID_KEYS, VIDEO_ID_KEYS, find_playlist_exports
+from models import json_default
+from utils.json_stream import JSONArrayStream
+
+CHANGESET_FORMAT = 1
+# Fields whose change makes a matched item "changed" (position is covered by moves).
+FINGERPRINT_FIELDS = ("video_id", "title", "description", "channel_title", "thumbnail", "added_at")
+
+
+def _first_value(item: Mapping, keys: Tuple[str, ...]) -> Optional[Any]:
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def item_fingerprint(item: Mapping) -> bytes:
+    encoded = "\x1f".join([str(item.get(name, "")) for name in FINGERPRINT_FIELDS]).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).digest()
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> List[int]:
+    """Indexes into ``values`` of one longest strictly increasing subsequence."""
+    tail_values: List[int] = []  # smallest tail value of an increasing run of each length
+    tails: List[int] = []  # index of that tail
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length:
+            previous[index] = tails[length - 1]
+        if length == len(tails):
+            tail_values.append(value)
+            tails.append(index)
+        else:
+            tail_values[length] = value
+            tails[length] = index
+
+    result = []
+    index = tails[-1] if tails else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+    result.reverse()
+    return result
+
+
+class _BaseIndex:
+    """Key -> position maps of the base snapshot (no full items are kept)."""
+
+    def __init__(self, items: Iterable[Mapping]):
+        self.by_playlist_item_id: Dict[str, int] = {}
+        self.by_occurrence: Dict[Tuple[str, int], int] = {}
+        self.refs: List[Tuple[str, Optional[str]]] = []  # (video_id, playlist_item_id)
+        self.fingerprints: List[bytes] = []
+        occurrences: Dict[str, int] = defaultdict(int)
+        for position, item in enumerate(items):
+            video_id = str(_first_value(item, VIDEO_ID_KEYS) or "")
+            playlist_item_id = _first_value(item, PLAYLIST_ITEM_ID_KEYS)
+            if playlist_item_id is not None:
+                playlist_item_id = str(playlist_item_id)
+                self.by_playlist_item_id.setdefault(playlist_item_id, position)
+            self.by_occurrence[(video_id, occurrences[video_id])] = position
+            occurrences[video_id] += 1
+            self.refs.append((video_id, playlist_item_id))
+            self.fingerprints.append(item_fingerprint(item))
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def ref(self, position: int) -> Dict[str, Any]:
+        video_id, playlist_item_id = self.refs[position]
+        ref: Dict[str, Any] = {"video_id": video_id}
+        if playlist_item_id is not None:
+            ref["playlist_item_id"] = playlist_item_id
+        return ref
+
+
+def diff_playlist(base_items: Iterable[Mapping], target_items: Iterable[Mapping]) -> Dict[str, Any]:
+    """
+    Diff one playlist.
+
+    Args:
+        base_items: Items of the older snapshot, in playlist order.
+        target_items: Items of the newer snapshot, in playlist order.
+
+    Returns:
+        Changeset dict with base_count, target_count, summary and the
+        non-empty lists of removed, added, moved and changed entries.
+    """
+    base = _BaseIndex(base_items)
+    match_by_id = bool(base.by_playlist_item_id)
+    matched_from: List[int] = []  # base position of each matched target item, in target order
+    matched_to: List[int] = []
+    matched = set()
+    added: List[Dict[str, Any]] = []
+    changed: List[Dict[str, Any]] = []
+    occurrences: Dict[str, int] = defaultdict(int)
+    target_count = 0
+
+    for position, item in enumerate(target_items):
+        target_count += 1
+        video_id = str(_first_value(item, VIDEO_ID_KEYS) or "")
+        playlist_item_id = _first_value(item, PLAYLIST_ITEM_ID_KEYS)
+        occurrence = occurrences[video_id]
+        occurrences[video_id] += 1
+        if match_by_id and playlist_item_id is not None:
+            # A video removed and added again gets a new playlist item ID: that is remove + add.
+            base_position = base.by_playlist_item_id.get(str(playlist_item_id))
+        else:
+            base_position = base.by_occurrence.get((video_id, occurrence))
+
+        if base_position is None or base_position in matched:
+            added.append({"to": position, "item": item})
+            continue
+        matched.add(base_position)
+        matched_from.append(base_position)
+        matched_to.append(position)
+        if base.fingerprints[base_position] != item_fingerprint(item):
+            changed.append({"from": base_position, "to": position, "item": item})
+
+    removed = [{"from": position, **base.ref(position)} for position in range(len(base)) if position not in matched]
+    in_place = set(longest_increasing_subsequence(matched_from))
+    moved = [
+        {"from": matched_from[index], "to": matched_to[index], **base.ref(matched_from[index])}
+        for index in range(len(matched_from)) if index not in in_place
+    ]
+
+    changeset: Dict[str, Any] = {
+        "base_count": len(base),
+        "target_count": target_count,
+        "summary": {
+            "added": len(added),
+            "removed": len(removed),
+            "moved": len(moved),
+            "changed": len(changed),
+            "unchanged": len(matched_from) - len(changed),
+        },
+    }
+    for name, entries in (("removed", removed), ("added", added), ("moved", moved), ("changed", changed)):
+        if entries:
+            changeset[name] = entries
+    return changeset
+
+
+def is_unchanged(changeset: Dict[str, Any]) -> bool:
+    summary = changeset["summary"]
+    return not (summary["added"] or summary["removed"] or summary["moved"] or summary["changed"])
+
+
+def apply_changeset(base_items: Sequence[Any], changeset: Dict[str, Any]) -> List[Any]:
+    """
+    Rebuild the target playlist from the base items and a playlist changeset.
+
+    Items that were neither removed nor moved keep their relative order and
+    fill the positions not taken by added and moved items.
+    """
+    target: List[Any] = [None] * changeset["target_count"]
+    placed = [False] * changeset["target_count"]
+    replacements = {entry["from"]: entry["item"] for entry in changeset.get("changed", [])}
+    skipped = {entry["from"] for entry in changeset.get("removed", [])}
+
+    for entry in changeset.get("added", []):
+        target[entry["to"]] = entry["item"]
+        placed[entry["to"]] = True
+    for entry in changeset.get("moved", []):
+        target[entry["to"]] = replacements.get(entry["from"], base_items[entry["from"]])
+        placed[entry["to"]] = True
+        skipped.add(entry["from"])
+
+    remaining = (
+        replacements.get(position, item)
+        for position, item in enumerate(base_items) if position not in skipped
+    )
+    for position in range(len(target)):
+        if not placed[position]:
+            target[position] = next(remaining)
+    return target
+
+
+class _ExportFile:
+    """Streams the items of one exported playlist JSON; ``header`` fills in as it is read."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.header: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            stream = JSONArrayStream(f, ITEMS_KEYS)
+            self.header = stream.header
+            yield from stream
+        if stream.array_key is None:
+            raise ValueError(f"JSON 파일에서 items 또는 videos 배열을 찾을 수 없습니다: {self.path}")
+
+
+def read_export_header(path: Path) -> Dict[str, Any]:
+    """Top-level members of an export that precede the videos array (playlist_id, title, ...)."""
+    with open(path, "r", encoding="utf-8") as f:
+        stream = JSONArrayStream(f, ITEMS_KEYS)
+        for _ in stream:
+            break
+        return stream.header
+
+
+def _playlist_key(header: Dict[str, Any], path: Path) -> str:
+    return str(header.get("playlist_id") or header.get("title") or path.stem)
+
+
+def _playlist_entry(header: Dict[str, Any], status: str) -> Dict[str, Any]:
+    return {"playlist_id": header.get("playlist_id", ""), "title": header.get("title", ""), "status": status}
+
+
+def diff_export_files(base_path: Path, target_items: Iterable[Mapping]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Diff one export file against a target item stream.
+
+    Returns:
+        (playlist changeset, base header)
+    """
+    base = _ExportFile(base_path)
+    changeset = diff_playlist(base, target_items)
+    return changeset, base.header
+
+
+def diff_snapshots(base_path: Path, target_path: Path) -> Dict[str, Any]:
+    """
+    Diff two export files, or two output directories playlist by playlist.
+
+    Playlists only in the target directory are reported with every item added;
+    playlists only in the base directory are reported as removed without items.
+    """
+    if base_path.is_dir() != target_path.is_dir():
+        raise ValueError("두 스냅샷은 모두 JSON 파일이거나 모두 출력 디렉토리여야 합니다.")
+
+    playlists: List[Dict[str, Any]] = []
+    if not base_path.is_dir():
+        target = _ExportFile(target_path)
+        changeset, header = diff_export_files(base_path, target)
+        playlists.append({**_playlist_entry({**header, **target.header}, "modified"), **changeset})
+        return build_changeset(base_path, target_path, playlists)
+
+    base_exports = {_playlist_key(read_export_header(path), path): path for path in find_playlist_exports([base_path])}
+    for target_file in find_playlist_exports([target_path]):
+        target = _ExportFile(target_file)
+        key = _playlist_key(read_export_header(target_file), target_file)
+        base_file = base_exports.pop(key, None)
+        if base_file is None:
+            changeset = diff_playlist([], target)
+            playlists.append({**_playlist_entry(target.header, "added"), **changeset})
+        else:
+            changeset, header = diff_export_files(base_file, target)
+            playlists.append({**_playlist_entry({**header, **target.header}, "modified"), **changeset})
+    for base_file in base_exports.values():
+        playlists.append(_playlist_entry(read_export_header(base_file), "removed"))
+    return build_changeset(base_path, target_path, playlists)
+
+
+def diff_live(base_path: Path, youtube_api) -> Dict[str, Any]:
+    """Diff an export file against the playlist's current items from the API."""
+    header = read_export_header(base_path)
+    playlist_id = header.get("playlist_id")
+    if not playlist_id:
+        raise ValueError(f"JSON 파일에 playlist_id가 없습니다: {base_path}")
+    changeset, header = diff_export_files(base_path, youtube_api.get_playlist_videos(playlist_id))
+    playlists = [{**_playlist_entry(header, "modified"), **changeset}]
+    return build_changeset(base_path, f"live:{playlist_id}", playlists)
+
+
+def build_changeset(base: Any, target: Any, playlists: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Top-level changeset; unchanged playlists are only counted."""
+    totals = {"added": 0, "removed": 0, "moved": 0, "changed": 0}
+    statuses = {"added": 0, "removed": 0, "modified": 0, "unchanged": 0}
+    changed_playlists = []
+    for playlist in playlists:
+        if playlist["status"] == "modified" and is_unchanged(playlist):
+            statuses["unchanged"] += 1
+            continue
+        statuses[playlist["status"]] += 1
+        for name in totals:
+            totals[name] += playlist.get("summary", {}).get(name, 0)
+        changed_playlists.append(playlist)
+    return {
+        "format": CHANGESET_FORMAT,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "base": str(base),
+        "target": str(target),
+        "summary": {"playlists": statuses, "items": totals},
+        "playlists": changed_playlists,
+    }
+
+
+def write_changeset(changeset: Dict[str, Any], output_path: Path) -> None:
+    """Write the changeset as compact JSON (temporary file, then replace)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(changeset, f, ensure_ascii=False, separators=(",", ":"), default=json_default)
+        f.write("\n")
+    os.replace(tmp_path, output_path)
+
+
+def print_summary(changeset: Dict[str, Any], output_path: Path) -> None:
+    playlists = changeset["summary"]["playlists"]
+    items = changeset["summary"]["items"]
+    print("재생목록 비교 완료")
+    print(
+        f"- 재생목록: 변경 {playlists['modified']}개, 추가 {playlists['added']}개, "
+        f"삭제 {playlists['removed']}개, 변경 없음 {playlists['unchanged']}개"
+    )
+    print(
+        f"- 영상: 추가 {items['added']}개, 삭제 {items['removed']}개, "
+        f"이동 {items['moved']}개, 정보 변경 {items['changed']}개"
+    )
+    print(f"- 변경 내역 파일: {output_path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="두 시점의 재생목록 JSON(또는 출력 디렉토리)을 비교해 추가/삭제/이동된 영상만 변경 내역 파일로 저장합니다."
+    )
+    parser.add_argument("base", type=Path, help="이전 재생목록 JSON 파일 또는 출력 디렉토리")
+    parser.add_argument(
+        "target",
+        type=Path,
+        nargs="?",
+        help="새 재생목록 JSON 파일 또는 출력 디렉토리 (--live 사용 시 생략)",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="target 대신 YouTube API로 조회한 현재 재생목록과 비교합니다.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("changeset.json"),
+        help="변경 내역 JSON 출력 경로 (기본값: ./changeset.json)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.live:
+            if args.target is not None or args.base.is_dir():
+                raise ValueError("--live는 재생목록 JSON 파일 하나와 함께 사용해야 합니다.")
+            from youtube_api import YouTubeAPI
+
+            changeset = diff_live(args.base, YouTubeAPI())
+        else:
+            if args.target is None:
+                raise ValueError("비교할 target 경로를 지정하거나 --live를 사용하세요.")
+            changeset = diff_snapshots(args.base, args.target)
+        write_changeset(changeset, args.output)
+        print_summary(changeset, args.output)
+        return 0
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
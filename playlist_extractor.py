@@ -2,21 +2,56 @@
 재생목록 추출 로직
 병렬 처리 및 데이터 수집
 """
-from typing import List, Dict
-from youtube_api import YouTubeAPI
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, Iterator, Optional, Tuple
+import config
+
+if TYPE_CHECKING:
+    from checkpoint import CheckpointJournal
+    from exporters.base_exporter import BaseExporter
+    from snapshot_store import PlaylistSnapshotStore, SnapshotWriter
+    from youtube_api import YouTubeAPI
 
 
 class PlaylistExtractor:
     """재생목록 추출 클래스"""
     
-    def __init__(self, youtube_api: YouTubeAPI):
+    def __init__(
+        self,
+        youtube_api: "YouTubeAPI",
+        concurrency: Optional[int] = None,
+        snapshot_store: Optional["PlaylistSnapshotStore"] = None,
+        incremental: bool = True,
+        journal: Optional["CheckpointJournal"] = None,
+        resume: bool = False
+    ):
         """
         초기화
         
         Args:
             youtube_api: YouTube API 클라이언트
+            concurrency: 동시에 추출할 재생목록 수 (기본값: config.EXTRACT_CONCURRENCY)
+                        1이면 기존과 같이 순차 처리합니다.
+            snapshot_store: 재생목록 스냅샷 저장소 (지정하면 페이지 ETag를 기록)
+            incremental: False면 저장된 스냅샷을 무시하고 모든 페이지를 다시 조회
+            journal: 페이지 단위 체크포인트 저널 (지정하면 완료된 페이지를 즉시 기록)
+            resume: True면 저널에 남은 지점부터 이어서 추출
         """
         self.youtube_api = youtube_api
+        if concurrency is None:
+            concurrency = config.EXTRACT_CONCURRENCY
+        self.concurrency = max(1, int(concurrency))
+        self.snapshot_store = snapshot_store
+        self.incremental = incremental
+        self.journal = journal
+        self.resume = resume
+        self._local = threading.local()
+        # 추출은 끝났지만 아직 저장(출력 완료)되지 않은 스냅샷
+        self._pending_snapshots: Dict[str, Optional["SnapshotWriter"]] = {}
+        self._snapshot_lock = threading.Lock()
     
     def extract_all_playlists(self) -> List[Dict]:
         """
@@ -25,64 +60,288 @@ class PlaylistExtractor:
         Returns:
             재생목록 정보와 영상 리스트가 포함된 딕셔너리 리스트
         """
-        import time
-        
         print("재생목록 목록 조회 중...")
         playlists = self.youtube_api.get_all_playlists()
         print(f"총 {len(playlists)}개의 재생목록을 찾았습니다.")
         
-        # 순차 처리로 각 재생목록의 영상 정보 수집 (SSL 오류 방지)
         results = []
         total = len(playlists)
         
-        for idx, playlist in enumerate(playlists, 1):
-            try:
-                print(f"[{idx}/{total}] {playlist['title']} 처리 중...")
-                videos = self._extract_playlist_videos(playlist)
-                playlist_data = {
+        for idx, (playlist, videos, error) in enumerate(self.iter_playlist_results(playlists), 1):
+            if error is None:
+                self.commit_playlist(playlist)
+                results.append({
                     **playlist,
                     "videos": videos
-                }
-                results.append(playlist_data)
-                print(f"✓ {playlist['title']}: {len(videos)}개 영상 추출 완료")
-                
-                # 재생목록 간 짧은 지연 (SSL 연결 안정화)
-                if idx < total:
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                print(f"✗ {playlist['title']} 추출 실패: {e}")
+                })
+                print(f"[{idx}/{total}] ✓ {playlist['title']}: {len(videos)}개 영상 추출 완료")
+            else:
+                print(f"[{idx}/{total}] ✗ {playlist['title']} 추출 실패: {error}")
                 # 실패한 재생목록도 빈 영상 리스트로 추가
                 results.append({
                     **playlist,
                     "videos": []
                 })
-                # 실패 후에도 짧은 지연
-                time.sleep(0.5)
         
         # 재생목록 제목으로 정렬
         results.sort(key=lambda x: x["title"])
         return results
     
-    def _extract_playlist_videos(self, playlist: Dict) -> List[Dict]:
+    def iter_playlist_results(
+        self, playlists: List[Dict]
+    ) -> Iterator[Tuple[Dict, Optional[List[Dict]], Optional[Exception]]]:
+        """
+        여러 재생목록의 영상을 추출하여 입력 순서대로 반환
+
+        concurrency가 2 이상이면 워커마다 별도 HTTP 연결을 가진 클라이언트로
+        재생목록을 동시에 페이지네이션합니다. 완료 순서와 관계없이 결과는
+        항상 입력 순서대로 반환되므로 순차 처리와 동일한 출력이 만들어집니다.
+
+        Args:
+            playlists: 재생목록 정보 리스트
+
+        Yields:
+            (재생목록 정보, 영상 리스트, 오류) 튜플. 실패 시 영상 리스트는 None
+        """
+        return self._iter_in_order(
+            playlists,
+            self._extract_playlist_result,
+            lambda playlist, error: (playlist, None, error)
+        )
+
+    def iter_streamed_exports(
+        self, playlists: List[Dict], exporter: "BaseExporter"
+    ) -> Iterator[Tuple[Dict, Optional[Path], int, Optional[Exception]]]:
+        """
+        재생목록을 페이지 단위로 조회하면서 곧바로 파일에 기록
+
+        영상 리스트를 만들지 않고 get_playlist_videos 이터레이터를 출력 모듈에
+        직접 넘기므로, 재생목록 크기와 관계없이 메모리에는 한 페이지 분량만
+        머뭅니다. 동시 추출과 결과 순서는 iter_playlist_results와 같습니다.
+
+        Args:
+            playlists: 재생목록 정보 리스트
+            exporter: export_stream()으로 기록할 출력 모듈
+
+        Yields:
+            (재생목록 정보, 생성된 파일 경로, 영상 수, 오류) 튜플. 실패 시 경로는 None
+        """
+        def export_playlist(playlist: Dict, youtube_api: "YouTubeAPI"):
+            video_count = 0
+
+            def counted_videos() -> Iterator[Dict]:
+                nonlocal video_count
+                for video in self.stream_playlist_videos(playlist, youtube_api):
+                    video_count += 1
+                    yield video
+
+            try:
+                return playlist, exporter.export_stream(playlist, counted_videos()), video_count, None
+            except Exception as e:
+                return playlist, None, video_count, e
+
+        return self._iter_in_order(
+            playlists,
+            export_playlist,
+            lambda playlist, error: (playlist, None, 0, error)
+        )
+
+    def _iter_in_order(
+        self,
+        playlists: List[Dict],
+        task: Callable[[Dict, "YouTubeAPI"], Tuple[Any, ...]],
+        on_error: Callable[[Dict, Exception], Tuple[Any, ...]]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        재생목록마다 task를 실행하고 결과를 입력 순서대로 반환 (concurrency만큼 동시 실행)
+
+        워커용 클라이언트를 만들지 못하면 on_error의 결과를 대신 반환합니다.
+        """
+        if self.concurrency <= 1:
+            # 호출 간격은 YouTubeAPI의 공용 속도 제한기가 조절함
+            for playlist in playlists:
+                yield task(playlist, self.youtube_api)
+            return
+
+        # 진행 중인 작업 수를 제한하여 완료됐지만 아직 소비되지 않은 결과가
+        # 메모리에 무한정 쌓이지 않도록 함
+        window = self.concurrency * 2
+        playlist_iter = iter(playlists)
+        pending = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="playlist-extract"
+        )
+
+        def submit_next() -> bool:
+            playlist = next(playlist_iter, None)
+            if playlist is None:
+                return False
+            pending.append(executor.submit(self._run_in_worker, task, on_error, playlist))
+            return True
+
+        try:
+            while len(pending) < window and submit_next():
+                pass
+
+            while pending:
+                result = pending.popleft().result()
+                submit_next()
+                yield result
+        finally:
+            # 중단(KeyboardInterrupt 등) 시 아직 시작하지 않은 작업은 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _worker_api(self) -> "YouTubeAPI":
+        """현재 워커 스레드 전용 YouTubeAPI 클라이언트 반환 (스레드당 1회 생성)"""
+        youtube_api = getattr(self._local, "youtube_api", None)
+        if youtube_api is None:
+            youtube_api = self.youtube_api.clone_for_worker()
+            self._local.youtube_api = youtube_api
+        return youtube_api
+
+    def _run_in_worker(
+        self,
+        task: Callable[[Dict, "YouTubeAPI"], Tuple[Any, ...]],
+        on_error: Callable[[Dict, Exception], Tuple[Any, ...]],
+        playlist: Dict
+    ) -> Tuple[Any, ...]:
+        try:
+            youtube_api = self._worker_api()
+        except Exception as e:
+            return on_error(playlist, e)
+        return task(playlist, youtube_api)
+
+    def _extract_playlist_result(
+        self, playlist: Dict, youtube_api: "YouTubeAPI"
+    ) -> Tuple[Dict, Optional[List[Dict]], Optional[Exception]]:
+        try:
+            return playlist, self._extract_playlist_videos(playlist, youtube_api), None
+        except Exception as e:
+            return playlist, None, e
+
+    def _extract_playlist_videos(self, playlist: Dict, youtube_api: Optional["YouTubeAPI"] = None) -> List[Dict]:
         """
         단일 재생목록의 모든 영상 추출
         
         Args:
             playlist: 재생목록 정보
+            youtube_api: 사용할 클라이언트 (기본값: self.youtube_api)
             
         Returns:
             영상 정보 리스트
         """
-        videos = []
         try:
-            for video in self.youtube_api.get_playlist_videos(playlist["id"]):
-                videos.append(video)
+            return list(self.stream_playlist_videos(playlist, youtube_api))
         except Exception as e:
             print(f"재생목록 '{playlist['title']}' 영상 추출 중 오류: {e}")
             raise
         
-        return videos
+    def stream_playlist_videos(self, playlist: Dict, youtube_api: Optional["YouTubeAPI"] = None) -> Iterator[Dict]:
+        """
+        단일 재생목록의 영상을 페이지 단위로 조회하면서 하나씩 반환
+
+        스냅샷 저장소가 있으면 페이지를 받는 즉시 임시 스냅샷 파일에 기록하고,
+        끝까지 조회한 경우에만 commit_playlist()에서 반영할 수 있도록 보관합니다.
+
+        Args:
+            playlist: 재생목록 정보
+            youtube_api: 사용할 클라이언트 (기본값: self.youtube_api)
+
+        Yields:
+            영상 정보 딕셔너리
+        """
+        youtube_api = youtube_api or self.youtube_api
+        if self.snapshot_store is None and self.journal is None:
+            yield from youtube_api.get_playlist_videos(playlist["id"])
+            return
+
+        writer = self.snapshot_store.open_writer(playlist) if self.snapshot_store is not None else None
+        try:
+            for page in self._iter_playlist_pages(playlist, youtube_api):
+                if writer is not None:
+                    writer.append_page(page)
+                yield from page["videos"]
+        except BaseException:
+            # 실패하거나 소비가 중단된 경우 이전 스냅샷을 유지
+            if writer is not None:
+                writer.discard()
+            raise
+        if writer is not None:
+            writer.close()
+        with self._snapshot_lock:
+            self._pending_snapshots[playlist["id"]] = writer
+
+    def _iter_playlist_pages(self, playlist: Dict, youtube_api: "YouTubeAPI") -> Iterator[Dict]:
+        """
+        체크포인트 재개와 스냅샷 조건부 요청을 적용하여 페이지 단위로 조회
+
+        완료된 페이지는 반환 전에 저널에 기록되므로 중간에 실패하거나 중단되어도
+        --resume 실행에서 마지막으로 기록된 다음 페이지 토큰부터 이어서 조회합니다.
+        """
+        resume_state = None
+        if self.journal is not None and self.resume:
+            resume_state = self.journal.load(playlist["id"])
+            if resume_state is not None and not resume_state.matches(playlist):
+                print(f"  ↻ {playlist['title']}: 중단 이후 재생목록이 변경되어 처음부터 다시 추출합니다.")
+                resume_state = None
+
+        start_page_token = None
+        if resume_state is not None:
+            yield from resume_state.pages.iter_pages()
+            if resume_state.complete:
+                return
+            start_page_token = resume_state.next_page_token
+            if resume_state.pages and not start_page_token:
+                # 마지막 페이지까지 기록됐지만 완료 표시 전에 중단된 경우
+                return
+            print(f"  ↻ {playlist['title']}: {len(resume_state.pages)}개 페이지 이후부터 이어서 추출합니다.")
+
+        cached_pages = None
+        if self.snapshot_store is not None and self.incremental:
+            cached_pages = self.snapshot_store.cached_pages(playlist["id"])
+
+        writer = self.journal.start(playlist, resume_state) if self.journal is not None else None
+        try:
+            for page in youtube_api.iter_playlist_pages(playlist["id"], cached_pages, start_page_token):
+                if writer is not None:
+                    writer.append_page(page)
+                yield page
+            if writer is not None:
+                writer.mark_complete()
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def unchanged_playlists(self, playlists: List[Dict]) -> List[Dict]:
+        """
+        마지막 스냅샷 이후 etag와 itemCount가 바뀌지 않은 재생목록 반환
+
+        Args:
+            playlists: get_all_playlists()가 반환한 재생목록 정보 리스트
+
+        Returns:
+            다시 추출할 필요가 없는 재생목록 리스트
+        """
+        if self.snapshot_store is None or not self.incremental:
+            return []
+        return [playlist for playlist in playlists if self.snapshot_store.is_unchanged(playlist)]
+
+    def commit_playlist(self, playlist: Dict) -> None:
+        """
+        추출한 페이지를 스냅샷으로 저장하고 체크포인트 저널을 정리
+
+        출력 파일 저장까지 끝난 뒤 호출해야 다음 실행에서 안전하게 건너뛰거나
+        재개 지점을 버릴 수 있습니다.
+        """
+        with self._snapshot_lock:
+            if playlist["id"] not in self._pending_snapshots:
+                return
+            writer = self._pending_snapshots.pop(playlist["id"])
+        if writer is not None:
+            writer.commit()
+        if self.journal is not None:
+            self.journal.finalize(playlist["id"])
     
     def extract_single_playlist(self, playlist_id: str) -> Dict:
         """
@@ -0,0 +1,272 @@
+"""
+YouTube Data API quota accounting.
+
+Each API method costs a fixed number of quota units per call. QuotaLedger keeps
+a persisted per-day record of units spent by method, and QuotaScheduler uses it
+to predict whether a run fits in the remaining daily budget and to cap work
+(extraction pages first, then deletions) when it does not.
+"""
+import atexit
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+# https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS: Dict[str, int] = {
+    "playlists.list": 1,
+    "playlistItems.list": 1,
+    "playlistItems.delete": 50,
+    "playlistItems.insert": 50,
+    "channels.list": 1,
+    "videos.list": 1,
+}
+DEFAULT_COST = 1
+PAGE_SIZE = 50
+DELETE_METHOD = "playlistItems.delete"
+KEEP_DAYS = 30
+
+
+class QuotaBudgetExceeded(Exception):
+    """Raised before a call that would exceed the configured daily budget."""
+
+
+def method_cost(method: str) -> int:
+    return QUOTA_COSTS.get(method, DEFAULT_COST)
+
+
+def normalize_method(method_id: Optional[str]) -> str:
+    """Turn a discovery method id such as 'youtube.playlistItems.list' into 'playlistItems.list'."""
+    if not method_id:
+        return "unknown"
+    if method_id.startswith("youtube."):
+        return method_id[len("youtube."):]
+    return method_id
+
+
+def _quota_day_now() -> str:
+    # Quota resets at midnight Pacific Time.
+    try:
+        from zoneinfo import ZoneInfo
+
+        return datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%Y-%m-%d")
+    except Exception:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class QuotaLedger:
+    """Thread-safe daily ledger of quota units, persisted as JSON."""
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        daily_budget: int,
+        day_func: Callable[[], str] = _quota_day_now,
+        flush_every: int = 20,
+    ):
+        self.path = Path(path) if path else None
+        self.daily_budget = daily_budget
+        self._day_func = day_func
+        self._flush_every = flush_every
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict] = self._read_file()
+        # Units recorded in this process but not yet written to disk.
+        self._pending: Dict[str, Dict[str, List[int]]] = {}
+        self._pending_calls = 0
+
+    def _read_file(self) -> Dict[str, Dict]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        days = data.get("days")
+        return days if isinstance(days, dict) else {}
+
+    def _day_entry(self, days: Dict[str, Dict], day: str) -> Dict:
+        return days.setdefault(day, {"total_units": 0, "calls": {}})
+
+    @staticmethod
+    def _add(entry: Dict, method: str, count: int, units: int) -> None:
+        entry["total_units"] = entry.get("total_units", 0) + units
+        calls = entry.setdefault("calls", {}).setdefault(method, {"count": 0, "units": 0})
+        calls["count"] += count
+        calls["units"] += units
+
+    def record(self, method: str, count: int = 1) -> int:
+        """Record `count` calls of `method` for today and return the units spent."""
+        units = method_cost(method) * count
+        with self._lock:
+            day = self._day_func()
+            self._add(self._day_entry(self._days, day), method, count, units)
+            pending = self._pending.setdefault(day, {}).setdefault(method, [0, 0])
+            pending[0] += count
+            pending[1] += units
+            self._pending_calls += count
+            should_flush = self._pending_calls >= self._flush_every
+        if should_flush:
+            self.flush()
+        return units
+
+    def used_today(self) -> int:
+        with self._lock:
+            return self._days.get(self._day_func(), {}).get("total_units", 0)
+
+    def remaining(self) -> int:
+        return max(0, self.daily_budget - self.used_today())
+
+    def can_spend(self, method: str, count: int = 1) -> bool:
+        return method_cost(method) * count <= self.remaining()
+
+    def check(self, method: str, count: int = 1) -> None:
+        """Raise QuotaBudgetExceeded if the calls would overrun today's budget."""
+        if not self.can_spend(method, count):
+            raise QuotaBudgetExceeded(
+                f"일일 할당량 예산을 초과합니다: {method} {method_cost(method) * count} units 필요, "
+                f"남은 예산 {self.remaining()}/{self.daily_budget} units"
+            )
+
+    def summary(self, day: Optional[str] = None) -> Dict:
+        with self._lock:
+            entry = self._days.get(day or self._day_func(), {"total_units": 0, "calls": {}})
+            return json.loads(json.dumps(entry))
+
+    def flush(self) -> None:
+        """Merge pending units into the ledger file (atomic replace)."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending, self._pending_calls = self._pending, {}, 0
+            # Re-read so that concurrent processes sharing the ledger are merged, not overwritten.
+            days = self._read_file()
+            for day, methods in pending.items():
+                entry = self._day_entry(days, day)
+                for method, (count, units) in methods.items():
+                    self._add(entry, method, count, units)
+            for day in sorted(days)[:-KEEP_DAYS]:
+                del days[day]
+            self._days = days
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"days": days}, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+
+@dataclass
+class QuotaPlan:
+    budget: int
+    remaining: int
+    extraction_units: int
+    delete_units: int
+    scheduled_playlists: List[Dict] = field(default_factory=list)
+    deferred_playlists: List[Dict] = field(default_factory=list)
+    allowed_deletes: int = 0
+    requested_deletes: int = 0
+
+    @property
+    def required_units(self) -> int:
+        return self.extraction_units + self.delete_units
+
+    @property
+    def fits(self) -> bool:
+        return not self.deferred_playlists and self.allowed_deletes >= self.requested_deletes
+
+
+class QuotaScheduler:
+    """Predicts and caps work so that a run fits in the remaining daily budget."""
+
+    def __init__(self, ledger: QuotaLedger):
+        self.ledger = ledger
+
+    @staticmethod
+    def playlist_pages(playlist: Dict) -> int:
+        try:
+            item_count = int(playlist.get("video_count") or 0)
+        except (TypeError, ValueError):
+            item_count = 0
+        return max(1, math.ceil(item_count / PAGE_SIZE))
+
+    def estimate_extraction_units(self, playlists: Iterable[Dict]) -> int:
+        cost = method_cost("playlistItems.list")
+        return sum(self.playlist_pages(playlist) * cost for playlist in playlists)
+
+    def plan(self, playlists: Iterable[Dict] = (), delete_count: int = 0) -> QuotaPlan:
+        """
+        Schedule extraction pages first (cheap, read-only) in the given order,
+        then fit as many deletions as the rest of the budget allows.
+        """
+        remaining = self.ledger.remaining()
+        page_cost = method_cost("playlistItems.list")
+        delete_cost = method_cost(DELETE_METHOD)
+
+        scheduled: List[Dict] = []
+        deferred: List[Dict] = []
+        extraction_units = 0
+        for playlist in playlists:
+            units = self.playlist_pages(playlist) * page_cost
+            if not deferred and extraction_units + units <= remaining:
+                scheduled.append(playlist)
+                extraction_units += units
+            else:
+                deferred.append(playlist)
+
+        left = remaining - extraction_units
+        allowed_deletes = min(delete_count, max(0, left // delete_cost))
+        return QuotaPlan(
+            budget=self.ledger.daily_budget,
+            remaining=remaining,
+            extraction_units=extraction_units + sum(self.playlist_pages(p) * page_cost for p in deferred),
+            delete_units=delete_count * delete_cost,
+            scheduled_playlists=scheduled,
+            deferred_playlists=deferred,
+            allowed_deletes=allowed_deletes,
+            requested_deletes=delete_count,
+        )
+
+
+def format_plan(plan: QuotaPlan) -> List[str]:
+    lines = [
+        f"- 일일 예산: {plan.budget} units (남은 예산 {plan.remaining} units)",
+        f"- 예상 사용량: {plan.required_units} units "
+        f"(추출 {plan.extraction_units}, 삭제 {plan.delete_units})",
+    ]
+    if plan.fits:
+        lines.append("- 예측: 남은 예산 안에서 완료 가능")
+    else:
+        if plan.deferred_playlists:
+            lines.append(
+                f"- 예측: 예산 부족으로 재생목록 {len(plan.deferred_playlists)}개는 다음 실행으로 미룹니다"
+            )
+        if plan.allowed_deletes < plan.requested_deletes:
+            lines.append(
+                f"- 예측: 예산 부족으로 삭제 {plan.requested_deletes}개 중 {plan.allowed_deletes}개만 실행 가능"
+            )
+    return lines
+
+
+_shared_ledger: Optional[QuotaLedger] = None
+_shared_lock = threading.Lock()
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """Process-wide ledger configured from config.QUOTA_DAILY_BUDGET / QUOTA_LEDGER_PATH."""
+    global _shared_ledger
+    with _shared_lock:
+        if _shared_ledger is None:
+            import config
+
+            _shared_ledger = QuotaLedger(config.QUOTA_LEDGER_PATH, config.QUOTA_DAILY_BUDGET)
+            atexit.register(_shared_ledger.flush)
+        return _shared_ledger
@@ -0,0 +1,185 @@
+"""
+Shared token-bucket rate limiter for YouTube API calls.
+
+Every API call path (extraction, deletion, async client) acquires a token from
+the same bucket so that throughput follows config.API_RATE_LIMIT instead of
+fixed sleeps. The bucket is safe to share between threads and asyncio tasks.
+"""
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """Token bucket with `rate` tokens per second and up to `burst` stored tokens."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self._rate = 0.0
+        self._burst = 1.0
+        self._tokens = 0.0
+        self._updated_at = clock()
+        self.configure(rate, burst)
+        self._tokens = self._burst
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    def configure(self, rate: float, burst: Optional[int] = None) -> None:
+        """Change rate/burst at runtime. A rate of 0 or less disables limiting."""
+        with self._lock:
+            self._refill()
+            self._rate = float(rate)
+            if burst is None:
+                burst = max(1, int(rate)) if rate > 0 else 1
+            self._burst = float(max(1, burst))
+            self._tokens = min(self._tokens, self._burst)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._rate > 0:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserve tokens and return how long the caller must wait before using them.
+
+        Reservations may push the balance below zero; later callers then wait
+        behind earlier ones, which keeps the order fair across threads and tasks
+        without holding the lock while sleeping.
+        """
+        with self._lock:
+            if self._rate <= 0:
+                return 0.0
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens only if they are available right now."""
+        with self._lock:
+            if self._rate <= 0:
+                return True
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block the current thread until tokens are available. Returns the wait time."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Wait without blocking the event loop until tokens are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_shared_limiter: Optional[TokenBucket] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """
+    Return the process-wide limiter configured from config.API_RATE_LIMIT and
+    config.API_RATE_BURST. Extraction and deletion running in the same process
+    share this single budget.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            import config
+
+            _shared_limiter = TokenBucket(config.API_RATE_LIMIT, config.API_RATE_BURST)
+        return _shared_limiter
+
+
+def configure_rate_limiter(rate: float, burst: Optional[int] = None) -> TokenBucket:
+    """Reconfigure the shared limiter (e.g. from a CLI option) and return it."""
+    limiter = get_rate_limiter()
+    limiter.configure(rate, burst)
+    return limiter
+
+
+class AdaptiveRate:
+    """
+    Additive-increase / multiplicative-decrease control of a TokenBucket's rate.
+
+    A throttling response multiplies the rate by `decrease` (at most once per
+    `cooldown` seconds, so a burst of failures from concurrent requests counts
+    once), never going below `min_rate`. Every success adds `increase / rate`,
+    so the rate climbs back by about `increase` requests per second each
+    second, up to `max_rate` (default: the bucket's rate when created).
+    Unlimited buckets (rate <= 0) are left alone.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.5,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.bucket = bucket
+        self.max_rate = bucket.rate if max_rate is None else float(max_rate)
+        self.min_rate = min(min_rate, self.max_rate) if self.max_rate > 0 else min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.throttle_count = 0
+        self._max_burst = bucket.burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_decrease: Optional[float] = None
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def _set_rate(self, rate: float) -> None:
+        self.bucket.configure(rate, min(self._max_burst, max(1, int(rate))))
+
+    def on_success(self) -> None:
+        with self._lock:
+            rate = self.bucket.rate
+            if rate <= 0 or rate >= self.max_rate:
+                return
+            self._set_rate(min(self.max_rate, rate + self.increase / rate))
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttle_count += 1
+            rate = self.bucket.rate
+            if rate <= 0:
+                return
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._set_rate(max(self.min_rate, rate * self.decrease))
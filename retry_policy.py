@@ -0,0 +1,320 @@
+"""
+Retry policy for YouTube API calls.
+
+Errors are classified by HTTP status and the API's reason codes instead of by
+matching words in the error message:
+
+- throttled: 429, rateLimitExceeded / userRateLimitExceeded (403)
+- transient: 5xx, backendError / internalError
+- network:   connection resets, timeouts, TLS and DNS failures
+- fatal:     quotaExceeded / dailyLimitExceeded and the local quota budget;
+             retrying cannot succeed before the quota resets
+- permanent: everything else (400, 404, 304, programming errors, ...)
+
+Only throttled, transient and network errors are retried. The wait honours
+the server's Retry-After header (up to max_delay) and otherwise uses
+decorrelated jitter (next = uniform(base, previous * 3), capped), which spreads
+concurrent workers apart instead of having them retry in lockstep.
+
+A CircuitBreaker shared by all workers opens after several consecutive
+retryable failures. While it is open, callers wait for the cool-down instead
+of each sending its own doomed request. After the cool-down a single probe
+request is let through, and its result closes or re-opens the breaker.
+"""
+import errno
+import http.client
+import json
+import random
+import socket
+import ssl
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from quota import QuotaBudgetExceeded
+
+try:
+    from httplib2 import HttpLib2Error
+except ModuleNotFoundError:
+    HttpLib2Error = None
+
+THROTTLED = "throttled"
+TRANSIENT = "transient"
+NETWORK = "network"
+FATAL = "fatal"
+PERMANENT = "permanent"
+RETRYABLE_KINDS = frozenset({THROTTLED, TRANSIENT, NETWORK})
+
+THROTTLE_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+TRANSIENT_REASONS = frozenset({"backendError", "internalError"})
+FATAL_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+_NETWORK_ERRNOS = frozenset({
+    errno.ECONNRESET, errno.ECONNREFUSED, errno.ECONNABORTED, errno.ETIMEDOUT,
+    errno.EPIPE, errno.ENETUNREACH, errno.ENETDOWN, errno.EHOSTUNREACH,
+})
+_NETWORK_ERRORS = tuple(
+    error_type for error_type in (
+        ConnectionError, TimeoutError, socket.gaierror, ssl.SSLError, http.client.HTTPException, HttpLib2Error,
+    )
+    if error_type is not None
+)
+
+
+class ErrorClass(NamedTuple):
+    kind: str
+    status: Optional[int] = None
+    reason: str = ""
+    retry_after: Optional[float] = None
+
+    @property
+    def retryable(self) -> bool:
+        return self.kind in RETRYABLE_KINDS
+
+
+def _status(error: Exception) -> Optional[int]:
+    status = getattr(getattr(error, "resp", None), "status", getattr(error, "status", None))
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def error_reasons(error: Exception) -> List[str]:
+    """Reason codes ("rateLimitExceeded", ...) from an API error response body."""
+    content = getattr(error, "content", None)
+    if not content:
+        return []
+    try:
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        body = json.loads(content).get("error", {})
+        return [item.get("reason", "") for item in body.get("errors", []) if isinstance(item, dict)]
+    except (UnicodeDecodeError, ValueError, AttributeError):
+        return []
+
+
+def parse_retry_after(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta seconds or HTTP date)."""
+    if value in (None, ""):
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(error, "resp", None)
+    if headers is None:
+        headers = getattr(error, "headers", None)
+    if not hasattr(headers, "get"):
+        return None
+    return parse_retry_after(headers.get("retry-after", headers.get("Retry-After")))
+
+
+def classify_error(error: BaseException) -> ErrorClass:
+    """Classify an exception raised by an API call."""
+    if isinstance(error, QuotaBudgetExceeded):
+        return ErrorClass(FATAL, reason="quotaBudget")
+
+    status = _status(error)
+    if status is not None and hasattr(error, "content"):
+        reasons = error_reasons(error)
+        reason = reasons[0] if reasons else ""
+        if any(item in FATAL_REASONS for item in reasons):
+            return ErrorClass(FATAL, status, next(item for item in reasons if item in FATAL_REASONS))
+        if status == 429 or any(item in THROTTLE_REASONS for item in reasons):
+            return ErrorClass(THROTTLED, status, reason or "rateLimitExceeded", _retry_after(error))
+        if status >= 500 or any(item in TRANSIENT_REASONS for item in reasons):
+            return ErrorClass(TRANSIENT, status, reason or "backendError", _retry_after(error))
+        return ErrorClass(PERMANENT, status, reason)
+
+    if isinstance(error, _NETWORK_ERRORS):
+        return ErrorClass(NETWORK, reason=type(error).__name__)
+    if isinstance(error, OSError) and error.errno in _NETWORK_ERRNOS:
+        return ErrorClass(NETWORK, reason=type(error).__name__)
+    return ErrorClass(PERMANENT, reason=type(error).__name__)
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive retryable failures;
+    open -> half-open after `reset_timeout` seconds, when one probe call is
+    allowed; the probe's result closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.open_count = 0
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._condition:
+            if self._opened_at is None:
+                return "closed"
+            if self._probe_started is not None or self._clock() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def wait(self) -> float:
+        """Block until a call may be made. Returns the time spent waiting."""
+        started = self._clock()
+        with self._condition:
+            while self._opened_at is not None:
+                now = self._clock()
+                # Wait for the cool-down, or for the probe in flight to report
+                # (a probe that never reports is replaced after another cool-down).
+                since = self._opened_at if self._probe_started is None else self._probe_started
+                ready_at = since + self.reset_timeout
+                if now >= ready_at:
+                    self._probe_started = now
+                    break
+                self._condition.wait(ready_at - now)
+        return self._clock() - started
+
+    def record_success(self) -> None:
+        with self._condition:
+            self._failures = 0
+            if self._opened_at is not None:
+                self._opened_at = None
+                self._probe_started = None
+                self._condition.notify_all()
+
+    def record_failure(self) -> None:
+        with self._condition:
+            self._failures += 1
+            if self._probe_started is not None or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._probe_started = None
+                self.open_count += 1
+                self._condition.notify_all()
+
+
+class RetryPolicy:
+    """Classify, back off and retry; one instance can be shared by all workers."""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+
+    classify = staticmethod(classify_error)
+
+    def should_retry(self, error_class: ErrorClass, attempt: int) -> bool:
+        return error_class.retryable and attempt < self.max_attempts
+
+    def next_delay(self, error_class: ErrorClass, previous: Optional[float] = None) -> float:
+        """Retry-After if the server sent one, otherwise decorrelated jitter; both capped at max_delay."""
+        if error_class.retry_after is not None:
+            # A proxy's Retry-After (or a far-off HTTP date) must not stall a worker for hours.
+            return min(error_class.retry_after, self.max_delay)
+        previous = self.base_delay if previous is None else previous
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+
+    def before_call(self) -> None:
+        if self.breaker is not None:
+            self.breaker.wait()
+
+    def record(self, error_class: Optional[ErrorClass]) -> None:
+        """Feed an attempt's result (None = success) to the circuit breaker."""
+        if self.breaker is None:
+            return
+        if error_class is not None and error_class.retryable:
+            self.breaker.record_failure()
+        else:
+            # A definite answer (even 404 or quotaExceeded) means the service is reachable.
+            self.breaker.record_success()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(seconds)
+
+    def execute(
+        self,
+        call: Callable[[], Any],
+        on_retry: Optional[Callable[[int, float, ErrorClass, Exception], None]] = None,
+    ) -> Any:
+        """
+        Run `call` until it succeeds, fails permanently or runs out of attempts.
+
+        Args:
+            call: Makes one attempt (build a fresh request inside it).
+            on_retry: Called as (attempt, delay, error_class, error) before each wait.
+        """
+        delay = None
+        attempt = 1
+        while True:
+            self.before_call()
+            try:
+                result = call()
+            except Exception as e:
+                error_class = self.classify(e)
+                self.record(error_class)
+                if not self.should_retry(error_class, attempt):
+                    raise
+                delay = self.next_delay(error_class, delay)
+                if on_retry is not None:
+                    on_retry(attempt, delay, error_class, e)
+                self.sleep(delay)
+                attempt += 1
+                continue
+            self.record(None)
+            return result
+
+
+_shared_policy: Optional[RetryPolicy] = None
+_shared_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Return the process-wide policy configured from config.RETRY_MAX_ATTEMPTS,
+    config.RETRY_MAX_DELAY and the CIRCUIT_BREAKER_* settings. Extraction
+    workers and deletion share its circuit breaker.
+    """
+    global _shared_policy
+    with _shared_lock:
+        if _shared_policy is None:
+            import config
+
+            _shared_policy = RetryPolicy(
+                max_attempts=config.RETRY_MAX_ATTEMPTS,
+                max_delay=config.RETRY_MAX_DELAY,
+                breaker=CircuitBreaker(config.CIRCUIT_BREAKER_THRESHOLD, config.CIRCUIT_BREAKER_RESET),
+            )
+        return _shared_policy
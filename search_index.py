@@ -0,0 +1,516 @@
+"""
+Cross-playlist search index.
+
+Reads the exported playlist JSON files and builds a prebuilt inverted index
+over video titles, channel names and video IDs, plus a static search.html that
+works offline (including from file://).
+
+The index is split into small script files under <output>/_search/ that the page
+loads on demand:
+
+- manifest.js: shard counts and the playlist table
+- t<N>.js: term shards mapping each term to a delta-encoded, sorted list of
+  document numbers. A term lives in the shard chosen by hashing its first two
+  characters, so a prefix of two or more characters only needs one shard.
+- d<N>.js: document shards holding [video_id, title, channel, playlist numbers]
+
+Each video appears once, however many playlists contain it.
+"""
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+from exporters.base_exporter import AtomicTextFile
+from utils.json_stream import JSONArrayStream
+
+SEARCH_DIR_NAME = "_search"
+SEARCH_PAGE_NAME = "search.html"
+DEFAULT_TERM_SHARDS = 64
+DEFAULT_DOC_SHARD_SIZE = 2000
+# Playlist files linked from search results, in order of preference.
+PLAYLIST_LINK_EXTENSIONS = (".html", ".md", ".json")
+# Video fields read from the exports.
+INDEXED_FIELDS = ("video_id", "videoId", "title", "channel_title")
+
+_TOKEN_RE = re.compile(r"\w+")
+_SHARD_FILE_RE = re.compile(r"[td]\d+\.js")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms (must match tokenize() in search.html)."""
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def term_shard(term: str, shard_count: int) -> int:
+    """FNV-1a over the first two code points (must match termShard() in search.html)."""
+    value = 0x811C9DC5
+    for char in term[:2]:
+        value = ((value ^ ord(char)) * 0x01000193) & 0xFFFFFFFF
+    return value % shard_count
+
+
+class SearchIndexBuilder:
+    """Collects playlists and writes the sharded index and search page."""
+
+    def __init__(
+        self,
+        term_shards: int = DEFAULT_TERM_SHARDS,
+        doc_shard_size: int = DEFAULT_DOC_SHARD_SIZE,
+    ):
+        self.term_shards = max(1, term_shards)
+        self.doc_shard_size = max(1, doc_shard_size)
+        self.playlists: List[List[str]] = []
+        self.documents: List[List[Any]] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+
+    def add_playlist(self, title: str, href: Optional[str], videos: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add one playlist.
+
+        Args:
+            title: Playlist title shown in results.
+            href: Link to the exported playlist file, relative to the output root.
+            videos: Video dictionaries (video_id, title, channel_title).
+        """
+        playlist_number = len(self.playlists)
+        self.playlists.append([title, href or ""])
+        for video in videos:
+            video_id = video.get("video_id") or video.get("videoId")
+            if not video_id:
+                continue
+
+            number = self._doc_numbers.get(video_id)
+            if number is None:
+                number = len(self.documents)
+                self._doc_numbers[video_id] = number
+                title_text = video.get("title") or ""
+                channel = video.get("channel_title") or ""
+                self.documents.append([video_id, title_text, channel, []])
+                for term in set(tokenize(f"{title_text} {channel} {video_id}")):
+                    self._postings.setdefault(term, []).append(number)
+
+            playlist_numbers = self.documents[number][3]
+            if not playlist_numbers or playlist_numbers[-1] != playlist_number:
+                playlist_numbers.append(playlist_number)
+
+    def _shard_files(self) -> Dict[str, Any]:
+        term_shards: List[Dict[str, List[int]]] = [{} for _ in range(self.term_shards)]
+        for term in sorted(self._postings):
+            # Documents are numbered in insertion order, so postings are already sorted.
+            previous = 0
+            deltas = []
+            for number in self._postings[term]:
+                deltas.append(number - previous)
+                previous = number
+            term_shards[term_shard(term, self.term_shards)][term] = deltas
+
+        files: Dict[str, Any] = {f"t{index}": shard for index, shard in enumerate(term_shards)}
+        for index, start in enumerate(range(0, len(self.documents), self.doc_shard_size)):
+            files[f"d{index}"] = self.documents[start:start + self.doc_shard_size]
+        return files
+
+    def write(self, output_dir: Path) -> Dict[str, int]:
+        """
+        Write _search/*.js and search.html under output_dir.
+
+        Every file is replaced atomically; shard files left over from a larger
+        previous index are removed.
+
+        Returns:
+            Counts of playlists, videos, terms and written files.
+        """
+        search_dir = output_dir / SEARCH_DIR_NAME
+        search_dir.mkdir(parents=True, exist_ok=True)
+
+        files = self._shard_files()
+        for name, data in files.items():
+            _write_script(search_dir / f"{name}.js", "loadShard", name, data)
+
+        manifest = {
+            "version": 1,
+            "term_shards": self.term_shards,
+            "doc_shard_size": self.doc_shard_size,
+            "doc_count": len(self.documents),
+            "playlists": self.playlists,
+        }
+        # The manifest goes last so the page never sees a half-written index.
+        _write_script(search_dir / "manifest.js", "loadManifest", None, manifest)
+
+        page = AtomicTextFile(output_dir / SEARCH_PAGE_NAME)
+        try:
+            page.file.write(SEARCH_PAGE)
+            page.commit()
+        except BaseException:
+            page.discard()
+            raise
+
+        for path in search_dir.iterdir():
+            if _SHARD_FILE_RE.fullmatch(path.name) and path.stem not in files:
+                path.unlink()
+
+        return {
+            "playlists": len(self.playlists),
+            "videos": len(self.documents),
+            "terms": len(self._postings),
+            "files": len(files) + 2,
+        }
+
+
+def _write_script(path: Path, callback: str, name: Optional[str], data: Any) -> None:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    arguments = f"{json.dumps(name)},{payload}" if name is not None else payload
+    output = AtomicTextFile(path)
+    try:
+        output.file.write(f"PlaylistSearch.{callback}({arguments});\n")
+        output.commit()
+    except BaseException:
+        output.discard()
+        raise
+
+
+def _playlist_href(playlist_dir: Path) -> Optional[str]:
+    for extension in PLAYLIST_LINK_EXTENSIONS:
+        if (playlist_dir / f"{playlist_dir.name}{extension}").exists():
+            return f"{quote(playlist_dir.name)}/{quote(playlist_dir.name + extension)}"
+    return None
+
+
+def iter_exported_playlists(output_dir: Path) -> Iterable[Path]:
+    """Yield <output>/<name>/<name>.json export files in name order."""
+    for playlist_dir in sorted(path for path in output_dir.iterdir() if path.is_dir()):
+        json_path = playlist_dir / f"{playlist_dir.name}.json"
+        if json_path.is_file():
+            yield json_path
+
+
+def build_search_index(output_dir: Path, **builder_options) -> Dict[str, int]:
+    """
+    Build the search index from every playlist JSON export under output_dir.
+
+    Unreadable exports are skipped with a warning so one broken file does not
+    block the whole index.
+
+    Returns:
+        Counts of playlists, videos, terms and written files.
+    """
+    builder = SearchIndexBuilder(**builder_options)
+    for json_path in iter_exported_playlists(output_dir):
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                stream = JSONArrayStream(f, ("videos", "items"))
+                # Keep only the indexed fields of each video while the file is streamed.
+                videos = [
+                    {key: video.get(key) for key in INDEXED_FIELDS}
+                    for video in stream
+                    if isinstance(video, dict)
+                ]
+        except (OSError, ValueError) as e:
+            print(f"경고: {json_path.name}을(를) 읽을 수 없어 검색 색인에서 제외합니다: {e}", file=sys.stderr)
+            continue
+        builder.add_playlist(stream.header.get("title") or json_path.stem, _playlist_href(json_path.parent), videos)
+    return builder.write(output_dir)
+
+
+def print_summary(stats: Dict[str, int], output_dir: Path) -> None:
+    print(
+        f"검색 색인 생성 완료: 재생목록 {stats['playlists']}개, "
+        f"영상 {stats['videos']}개, 검색어 {stats['terms']}개"
+    )
+    print(f"  → {output_dir / SEARCH_PAGE_NAME}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="출력 디렉토리의 재생목록 JSON으로 전체 재생목록 검색 색인과 search.html을 생성합니다."
+    )
+    parser.add_argument(
+        "output_dir",
+        type=Path,
+        nargs="?",
+        default=Path("output"),
+        help="재생목록 JSON이 저장된 출력 디렉토리 (기본값: ./output)",
+    )
+    parser.add_argument(
+        "--term-shards",
+        type=int,
+        default=DEFAULT_TERM_SHARDS,
+        help=f"검색어 색인 분할 파일 수 (기본값: {DEFAULT_TERM_SHARDS})",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if not args.output_dir.is_dir():
+            raise FileNotFoundError(f"출력 디렉토리를 찾을 수 없습니다: {args.output_dir}")
+        stats = build_search_index(args.output_dir, term_shards=args.term_shards)
+        print_summary(stats, args.output_dir)
+        return 0
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+SEARCH_PAGE = """\
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>재생목록 검색</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            background-color: #f5f5f5;
+            color: #333;
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 960px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #ff0000;
+            border-bottom: 3px solid #ff0000;
+            padding-bottom: 10px;
+        }
+        #query {
+            width: 100%;
+            box-sizing: border-box;
+            font-size: 1.1em;
+            padding: 10px 12px;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+        }
+        #status {
+            color: #666;
+            margin: 12px 0;
+        }
+        #results {
+            list-style: none;
+            padding: 0;
+        }
+        #results li {
+            padding: 10px 0;
+            border-bottom: 1px solid #eee;
+        }
+        .title a {
+            color: #333;
+            font-weight: 600;
+            text-decoration: none;
+        }
+        .title a:hover {
+            color: #ff0000;
+        }
+        .meta {
+            color: #666;
+            font-size: 0.9em;
+            margin-top: 4px;
+        }
+        .meta a {
+            color: #065fd4;
+            margin-right: 8px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>재생목록 검색</h1>
+        <input id="query" type="search" placeholder="영상 제목, 채널 이름, 영상 ID 또는 URL" autofocus>
+        <div id="status"></div>
+        <ol id="results"></ol>
+    </div>
+    <script>
+    var PlaylistSearch = (function () {
+        var MAX_RESULTS = 200;
+        var manifest = null, shards = {}, pending = {}, resolvers = {}, sequence = 0;
+
+        function loadShard(name, data) {
+            shards[name] = data;
+            if (resolvers[name]) {
+                resolvers[name](data);
+                delete resolvers[name];
+            }
+        }
+
+        function loadManifest(data) {
+            manifest = data;
+        }
+
+        function load(name) {
+            if (shards[name]) return Promise.resolve(shards[name]);
+            if (!pending[name]) {
+                pending[name] = new Promise(function (resolve, reject) {
+                    resolvers[name] = resolve;
+                    var script = document.createElement("script");
+                    script.src = "_search/" + name + ".js";
+                    script.onerror = function () {
+                        delete pending[name];
+                        reject(new Error("검색 색인 파일을 불러올 수 없습니다: " + name));
+                    };
+                    document.head.appendChild(script);
+                });
+            }
+            return pending[name];
+        }
+
+        function tokenize(text) {
+            return text.normalize("NFKC").toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || [];
+        }
+
+        function termShard(term) {
+            var hash = 0x811c9dc5;
+            Array.from(term).slice(0, 2).forEach(function (char) {
+                hash = Math.imul(hash ^ char.codePointAt(0), 0x01000193) >>> 0;
+            });
+            return "t" + (hash % manifest.term_shards);
+        }
+
+        function decode(deltas) {
+            var numbers = [], number = 0;
+            for (var i = 0; i < deltas.length; i++) {
+                number += deltas[i];
+                numbers.push(number);
+            }
+            return numbers;
+        }
+
+        function lookup(token, prefix) {
+            return load(termShard(token)).then(function (terms) {
+                // 한 글자 검색어는 해당 글자로 시작하는 검색어가 여러 파일에 흩어져 있으므로 완전 일치만 찾음
+                if (!prefix || Array.from(token).length < 2) return decode(terms[token] || []);
+                var found = new Set();
+                Object.keys(terms).forEach(function (term) {
+                    if (term.startsWith(token)) decode(terms[term]).forEach(found.add, found);
+                });
+                return Array.from(found).sort(function (a, b) { return a - b; });
+            });
+        }
+
+        function intersect(a, b) {
+            var result = [], i = 0, j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] === b[j]) { result.push(a[i]); i++; j++; }
+                else if (a[i] < b[j]) i++;
+                else j++;
+            }
+            return result;
+        }
+
+        function search(query) {
+            var url = /[?&]v=([\\w-]{11})|youtu\\.be\\/([\\w-]{11})/.exec(query);
+            if (url) query = url[1] || url[2];
+            var tokens = tokenize(query);
+            if (!tokens.length) return Promise.resolve([]);
+            return Promise.all(tokens.map(function (token, index) {
+                return lookup(token, index === tokens.length - 1);
+            })).then(function (lists) {
+                lists.sort(function (a, b) { return a.length - b.length; });
+                return lists.reduce(intersect);
+            });
+        }
+
+        function fetchDocuments(numbers) {
+            var size = manifest.doc_shard_size;
+            var names = Array.from(new Set(numbers.map(function (number) {
+                return "d" + Math.floor(number / size);
+            })));
+            return Promise.all(names.map(load)).then(function () {
+                return numbers.map(function (number) {
+                    return shards["d" + Math.floor(number / size)][number % size];
+                });
+            });
+        }
+
+        function element(tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text) node.textContent = text;
+            return node;
+        }
+
+        function render(documents, total) {
+            var list = document.getElementById("results");
+            list.replaceChildren();
+            documents.forEach(function (doc) {
+                var item = element("li");
+                var title = element("div", "title");
+                var link = element("a", "", doc[1] || doc[0]);
+                link.href = "https://www.youtube.com/watch?v=" + encodeURIComponent(doc[0]);
+                link.target = "_blank";
+                title.appendChild(link);
+                item.appendChild(title);
+                item.appendChild(element("div", "meta", [doc[2], doc[0]].filter(Boolean).join(" · ")));
+                var playlists = element("div", "meta", "재생목록: ");
+                doc[3].forEach(function (number) {
+                    var playlist = manifest.playlists[number];
+                    var anchor = element(playlist[1] ? "a" : "span", "", playlist[0]);
+                    if (playlist[1]) anchor.href = playlist[1];
+                    playlists.appendChild(anchor);
+                });
+                item.appendChild(playlists);
+                list.appendChild(item);
+            });
+            var status = total + "개 영상";
+            if (total > documents.length) status += " (처음 " + documents.length + "개 표시)";
+            document.getElementById("status").textContent = status;
+        }
+
+        function update() {
+            var query = document.getElementById("query").value;
+            var current = ++sequence;
+            if (!query.trim()) {
+                document.getElementById("results").replaceChildren();
+                showTotals();
+                return;
+            }
+            search(query).then(function (numbers) {
+                return fetchDocuments(numbers.slice(0, MAX_RESULTS)).then(function (documents) {
+                    // 입력이 바뀐 뒤 늦게 도착한 결과는 버림
+                    if (current === sequence) render(documents, numbers.length);
+                });
+            }).catch(function (error) {
+                if (current === sequence) document.getElementById("status").textContent = error.message;
+            });
+        }
+
+        function showTotals() {
+            document.getElementById("status").textContent =
+                "재생목록 " + manifest.playlists.length + "개, 영상 " + manifest.doc_count + "개";
+        }
+
+        function start() {
+            if (!manifest) {
+                document.getElementById("status").textContent = "검색 색인(_search/manifest.js)을 찾을 수 없습니다.";
+                return;
+            }
+            showTotals();
+            document.getElementById("query").addEventListener("input", update);
+        }
+
+        return { loadShard: loadShard, loadManifest: loadManifest, start: start };
+    })();
+    </script>
+    <script src="_search/manifest.js"></script>
+    <script>PlaylistSearch.start();</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
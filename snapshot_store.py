@@ -0,0 +1,137 @@
+"""
+Local playlist snapshot store for incremental extraction.
+
+For every playlist we keep the last seen playlist `etag` and `itemCount`, plus
+each playlistItems page (page token, page ETag, next page token and the parsed
+videos). The next run can then skip playlists whose metadata is unchanged and
+send conditional (If-None-Match) page requests for the ones that changed,
+reusing the stored page whenever the API answers 304 Not Modified.
+
+A snapshot is a JSONL file: a header line followed by one line per page.
+Snapshots are written page by page into a temporary file (SnapshotWriter)
+and only replace the previous snapshot once committed. Reading one back keeps
+only the page token → ETag index in memory (PageIndex); a page's videos are
+loaded from disk only when a 304 answer reuses it.
+"""
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from models import json_default
+from page_index import PageIndex
+
+
+class SnapshotWriter:
+    """Streams pages of one playlist snapshot into a temp file until committed."""
+
+    def __init__(self, path: Path, playlist: Dict):
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps(
+            {
+                "playlist_id": playlist["id"],
+                "etag": playlist.get("etag"),
+                "item_count": playlist.get("video_count"),
+            },
+            ensure_ascii=False,
+        )
+        self._file = open(self.tmp_path, "w", encoding="utf-8")
+        self._file.write(header + "\n")
+
+    def append_page(self, page: Dict) -> None:
+        record = {
+            "page_token": page.get("page_token"),
+            "etag": page.get("etag"),
+            "next_page_token": page.get("next_page_token"),
+            "videos": page.get("videos", []),
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False, default=json_default) + "\n")
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def commit(self) -> Path:
+        """Atomically replace the stored snapshot with the written pages."""
+        self.close()
+        os.replace(self.tmp_path, self.path)
+        return self.path
+
+    def discard(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        try:
+            self.tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class PlaylistSnapshotStore:
+    """One JSON file per playlist ID under `root`."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, playlist_id: str) -> Path:
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", playlist_id)
+        return self.root / f"{safe_id}.jsonl"
+
+    def load(self, playlist_id: str) -> Optional[Dict]:
+        """Snapshot header (playlist_id, etag, item_count); the pages stay on disk."""
+        path = self._path(playlist_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(header, dict) or header.get("playlist_id") != playlist_id:
+            return None
+        return header
+
+    def is_unchanged(self, playlist: Dict) -> bool:
+        """True if the playlist etag and item count match the stored snapshot."""
+        etag = playlist.get("etag")
+        if not etag:
+            return False
+        snapshot = self.load(playlist["id"])
+        if not snapshot:
+            return False
+        return snapshot.get("etag") == etag and snapshot.get("item_count") == playlist.get("video_count")
+
+    def cached_pages(self, playlist_id: str) -> PageIndex:
+        """ETag index of the stored pages keyed by page token (None for the first page)."""
+        path = self._path(playlist_id)
+        if self.load(playlist_id) is None:
+            return PageIndex(path)
+        cached = PageIndex(path)
+        try:
+            with open(path, "rb") as f:
+                offset = len(f.readline())
+                for line in f:
+                    page = json.loads(line)
+                    if page.get("etag"):
+                        cached.add(page, offset)
+                    offset += len(line)
+        except (OSError, ValueError):
+            return PageIndex(path)
+        return cached
+
+    def open_writer(self, playlist: Dict) -> SnapshotWriter:
+        """Start a new snapshot of `playlist`; pages are appended as they are fetched."""
+        return SnapshotWriter(self._path(playlist["id"]), playlist)
+
+    def save(self, playlist: Dict, pages: List[Dict]) -> Path:
+        """Atomically replace the snapshot of `playlist` with the given pages."""
+        writer = self.open_writer(playlist)
+        try:
+            for page in pages:
+                writer.append_page(page)
+        except BaseException:
+            writer.discard()
+            raise
+        return writer.commit()
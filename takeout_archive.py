@@ -0,0 +1,200 @@
+"""
+Read Google Takeout playlist CSVs straight from the downloaded archive.
+
+Takeout is delivered as .zip or .tgz files of several GB, and the YouTube
+playlist folder sits somewhere inside ("Takeout/YouTube 및 YouTube Music/재생목록",
+"Takeout 2/...", ...). Extracting the whole archive first costs time and disk
+space, so the CSV members are decoded directly from the archive instead.
+
+The playlist folder is found by looking for the member named 재생목록.csv
+(optionally restricted to a given folder path). Zip archives have a central
+directory, so members are opened on demand. Tar archives (including gzip /
+bz2 / xz compressed ones) are read in a single streaming pass: compressed tars
+cannot seek cheaply, so every video CSV is decoded while passing by and only
+its compact columns are kept.
+"""
+import codecs
+import io
+import tarfile
+import unicodedata
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+PLAYLISTS_CSV_NAME = "재생목록.csv"
+VIDEOS_CSV_SUFFIX = "-동영상.csv"
+
+
+def _member_path(name: str) -> PurePosixPath:
+    # Archives made on macOS store decomposed (NFD) Hangul names.
+    return PurePosixPath(unicodedata.normalize("NFC", name.replace("\\", "/")))
+
+
+def is_takeout_archive(path: Path) -> bool:
+    """Whether ``path`` is a zip or tar file (as opposed to an extracted directory)."""
+    path = Path(path)
+    return path.is_file() and (zipfile.is_zipfile(path) or tarfile.is_tarfile(path))
+
+
+def locate_playlist_dir(
+    members: List[PurePosixPath],
+    playlist_dir: Optional[str] = None
+) -> PurePosixPath:
+    """
+    Pick the folder that holds 재생목록.csv.
+
+    Args:
+        members: Member paths of the archive.
+        playlist_dir: Folder inside the archive, or a trailing part of it
+            (e.g. "YouTube 및 YouTube Music/재생목록"); None searches everywhere.
+
+    Returns:
+        The folder path. When several folders qualify (e.g. a merged archive),
+        the shallowest one wins.
+    """
+    wanted = _member_path(playlist_dir.strip("/")).parts if playlist_dir else ()
+    candidates = [
+        member.parent for member in members
+        if member.name == PLAYLISTS_CSV_NAME and (not wanted or member.parent.parts[-len(wanted):] == wanted)
+    ]
+    if not candidates:
+        where = f" ({playlist_dir})" if playlist_dir else ""
+        raise FileNotFoundError(f"아카이브에서 {PLAYLISTS_CSV_NAME} 파일을 찾을 수 없습니다{where}")
+    return min(candidates, key=lambda folder: (len(folder.parts), str(folder)))
+
+
+class TakeoutArchive(ABC):
+    """Playlist CSVs of one Takeout archive."""
+
+    def __init__(self, path: Path, playlist_dir: Optional[str] = None):
+        self.path = Path(path)
+        self.requested_dir = playlist_dir
+        self.playlist_dir: Optional[PurePosixPath] = None
+
+    @abstractmethod
+    def playlists_csv_text(self) -> str:
+        """Contents of 재생목록.csv."""
+
+    @abstractmethod
+    def video_csv_names(self) -> List[str]:
+        """File names of the "-동영상.csv" members in the playlist folder."""
+
+    @abstractmethod
+    def read_videos(self, name: str, reader: Callable[[TextIO], Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        Decode one video CSV member.
+
+        Args:
+            name: File name returned by video_csv_names().
+            reader: Row decoder applied to the member as a text stream.
+        """
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "TakeoutArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ZipTakeoutArchive(TakeoutArchive):
+    """Zip archive; members are decompressed on demand."""
+
+    def __init__(self, path: Path, playlist_dir: Optional[str] = None):
+        super().__init__(path, playlist_dir)
+        self._zip = zipfile.ZipFile(self.path)
+        self._members: Dict[PurePosixPath, zipfile.ZipInfo] = {
+            _member_path(info.filename): info for info in self._zip.infolist() if not info.is_dir()
+        }
+        try:
+            self.playlist_dir = locate_playlist_dir(list(self._members), playlist_dir)
+        except BaseException:
+            self._zip.close()
+            raise
+
+    def _open_text(self, name: str) -> TextIO:
+        info = self._members[self.playlist_dir / name]
+        return io.TextIOWrapper(self._zip.open(info), encoding="utf-8", newline="")
+
+    def playlists_csv_text(self) -> str:
+        with self._open_text(PLAYLISTS_CSV_NAME) as f:
+            return f.read()
+
+    def video_csv_names(self) -> List[str]:
+        return sorted(
+            member.name for member in self._members
+            if member.parent == self.playlist_dir and member.name.endswith(VIDEOS_CSV_SUFFIX)
+        )
+
+    def read_videos(self, name: str, reader: Callable[[TextIO], Tuple[str, str]]) -> Tuple[str, str]:
+        with self._open_text(name) as f:
+            return reader(f)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarTakeoutArchive(TakeoutArchive):
+    """Tar archive (optionally compressed); read in one streaming pass."""
+
+    def __init__(
+        self,
+        path: Path,
+        reader: Callable[[TextIO], Tuple[str, str]],
+        playlist_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            reader: Row decoder applied to every video CSV member during the pass.
+        """
+        super().__init__(path, playlist_dir)
+        playlists_csvs: Dict[PurePosixPath, str] = {}
+        videos: Dict[PurePosixPath, Tuple[str, str]] = {}
+        members: List[PurePosixPath] = []
+        with tarfile.open(self.path, mode="r|*") as tar:
+            for info in tar:
+                if not info.isfile():
+                    continue
+                member = _member_path(info.name)
+                if member.name == PLAYLISTS_CSV_NAME:
+                    members.append(member)
+                    playlists_csvs[member] = tar.extractfile(info).read().decode("utf-8")
+                elif member.name.endswith(VIDEOS_CSV_SUFFIX):
+                    # Stream members are not seekable, which TextIOWrapper requires.
+                    videos[member] = reader(codecs.getreader("utf-8")(tar.extractfile(info)))
+        self.playlist_dir = locate_playlist_dir(members, playlist_dir)
+        self._playlists_csv = playlists_csvs[self.playlist_dir / PLAYLISTS_CSV_NAME]
+        # Only keep the videos of the chosen folder.
+        self._videos = {
+            member.name: columns for member, columns in videos.items() if member.parent == self.playlist_dir
+        }
+
+    def playlists_csv_text(self) -> str:
+        return self._playlists_csv
+
+    def video_csv_names(self) -> List[str]:
+        return sorted(self._videos)
+
+    def read_videos(self, name: str, reader: Callable[[TextIO], Tuple[str, str]]) -> Tuple[str, str]:
+        return self._videos[name]
+
+
+def open_takeout_archive(
+    path: Path,
+    reader: Callable[[TextIO], Tuple[str, str]],
+    playlist_dir: Optional[str] = None
+) -> TakeoutArchive:
+    """
+    Open a Takeout .zip or .tar(.gz/.bz2/.xz) file.
+
+    Args:
+        path: Archive file.
+        reader: Row decoder for video CSVs (used during the pass over tar archives).
+        playlist_dir: Playlist folder inside the archive; None locates it automatically.
+    """
+    if zipfile.is_zipfile(path):
+        return ZipTakeoutArchive(path, playlist_dir)
+    return TarTakeoutArchive(path, reader, playlist_dir)
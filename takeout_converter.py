@@ -7,16 +7,26 @@ from pathlib import Path
 from takeout_parser import TakeoutParser
 from exporters.json_exporter import JSONExporter
 from exporters.markdown_exporter import MarkdownExporter
-from exporters.html_exporter import HTMLExporter
+from exporters.html_exporter import HTML_MODES, HTMLExporter
+from exporters.export_pool import EXPORT_MODES, ExportPool
+from search_index import build_search_index, print_summary as print_search_summary
 import config
 
 
-def get_exporters(output_formats: list) -> list:
+def get_exporters(
+    output_formats: list,
+    external_css: bool = False,
+    html_mode: str = "single",
+    html_page_size: int = 100
+) -> list:
     """
     출력 형식에 맞는 Exporter 인스턴스 리스트 반환
     
     Args:
         output_formats: 출력 형식 리스트 ('json', 'markdown', 'html')
+        external_css: True면 HTML 스타일을 출력 루트의 공용 스타일시트로 저장
+        html_mode: HTML 출력 방식 ('single', 'paged', 'virtual')
+        html_page_size: paged 모드에서 한 페이지에 넣을 영상 수
         
     Returns:
         Exporter 인스턴스 리스트
@@ -31,13 +41,32 @@ def get_exporters(output_formats: list) -> list:
         elif fmt == 'markdown' or fmt == 'md':
             exporters.append(MarkdownExporter(output_dir))
         elif fmt == 'html':
-            exporters.append(HTMLExporter(output_dir))
+            exporters.append(HTMLExporter(
+                output_dir,
+                external_css=external_css,
+                mode=html_mode,
+                page_size=html_page_size
+            ))
         else:
             print(f"경고: 알 수 없는 출력 형식 '{fmt}'는 무시됩니다.")
     
     return exporters
 
 
+def build_search_page(exporters: list) -> None:
+    """
+    출력 디렉토리의 재생목록 JSON으로 전체 재생목록 검색 색인 생성
+    
+    Args:
+        exporters: 이번 실행의 Exporter 인스턴스 리스트
+    """
+    if not any(isinstance(exporter, JSONExporter) for exporter in exporters):
+        print("⚠️  검색 색인은 JSON 출력 파일로 만들므로 --format에 json을 포함해야 합니다.")
+        return
+    print("\n전체 재생목록 검색 색인 생성 중...")
+    print_search_summary(build_search_index(config.OUTPUT_DIR), config.OUTPUT_DIR)
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(
@@ -47,7 +76,12 @@ def main():
         '--takeout-dir',
         type=str,
         required=True,
-        help='Takeout 데이터 디렉토리 경로 (예: takeout_data/251216/Takeout 2/YouTube 및 YouTube Music/재생목록/)'
+        help='Takeout 데이터 디렉토리 또는 압축 파일(.zip, .tgz) 경로 (예: takeout_data/251216/Takeout 2/YouTube 및 YouTube Music/재생목록/)'
+    )
+    parser.add_argument(
+        '--playlist-dir',
+        type=str,
+        help='재생목록.csv가 있는 폴더 (압축 파일/디렉토리 안의 경로, 예: "YouTube 및 YouTube Music/재생목록", 기본값: 자동 탐색)'
     )
     parser.add_argument(
         '--format',
@@ -55,15 +89,71 @@ def main():
         default=','.join(config.OUTPUT_FORMATS),
         help='출력 형식 (쉼표로 구분: json,markdown,html)'
     )
+    parser.add_argument(
+        '--external-css',
+        action='store_true',
+        help='HTML 스타일을 출력 디렉토리의 playlist.css 하나로 저장하고 각 HTML 파일에서 참조'
+    )
+    parser.add_argument(
+        '--html-mode',
+        choices=HTML_MODES,
+        default=config.HTML_MODE,
+        help=f'HTML 출력 방식 (single: 한 파일, paged: 페이지별 파일, virtual: 보이는 영상만 렌더링, 기본값: {config.HTML_MODE})'
+    )
+    parser.add_argument(
+        '--html-page-size',
+        type=int,
+        default=config.HTML_PAGE_SIZE,
+        help=f'paged 모드에서 페이지당 영상 수 (기본값: {config.HTML_PAGE_SIZE})'
+    )
     parser.add_argument(
         '--output-dir',
         type=str,
         help='출력 디렉토리 경로 (기본값: ./output)'
     )
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=config.TAKEOUT_PARSE_WORKERS,
+        help=f'영상 CSV 파일을 동시에 파싱할 프로세스 수 (기본값: {config.TAKEOUT_PARSE_WORKERS}, 0이면 CPU 수, 1이면 순차 파싱)'
+    )
     parser.add_argument(
         '--enrich',
         action='store_true',
-        help='YouTube API를 사용하여 영상 상세 정보 가져오기 (선택사항, API 키 필요)'
+        help='YouTube API를 사용하여 영상 상세 정보 가져오기 (선택사항, OAuth 인증 필요)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='영상 정보 보강 시 동시에 실행할 조회 수 (기본값: 4, API_RATE_LIMIT 속도 제한 적용)'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='영상 정보 보강 시 videos.list 호출을 HTTP 배치 요청으로 묶어 전송'
+    )
+    parser.add_argument(
+        '--export-concurrency',
+        type=int,
+        default=config.EXPORT_CONCURRENCY,
+        help=f'파일 저장 워커 수 (기본값: {config.EXPORT_CONCURRENCY}, 0이면 순차 저장)'
+    )
+    parser.add_argument(
+        '--export-mode',
+        choices=EXPORT_MODES,
+        default=config.EXPORT_MODE,
+        help=f'파일 저장 워커 실행 방식 (기본값: {config.EXPORT_MODE})'
+    )
+    parser.add_argument(
+        '--force-write',
+        action='store_true',
+        help='내용이 바뀌지 않은 출력 파일도 모두 다시 기록 (기본값: 변경된 파일만 기록)'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='저장 후 전체 재생목록 검색 색인과 search.html 생성 (json 형식 필요)'
     )
     
     args = parser.parse_args()
@@ -79,12 +169,20 @@ def main():
     # Takeout 디렉토리 확인
     takeout_dir = Path(args.takeout_dir)
     if not takeout_dir.exists():
-        print(f"오류: Takeout 디렉토리를 찾을 수 없습니다: {takeout_dir}")
+        print(f"오류: Takeout 디렉토리 또는 압축 파일을 찾을 수 없습니다: {takeout_dir}")
         sys.exit(1)
     
+    if args.force_write:
+        config.EXPORT_SKIP_UNCHANGED = False
+    
     # 출력 형식 파싱
     output_formats = [f.strip() for f in args.format.split(',')]
-    exporters = get_exporters(output_formats)
+    exporters = get_exporters(
+        output_formats,
+        external_css=args.external_css,
+        html_mode=args.html_mode,
+        html_page_size=args.html_page_size
+    )
     
     if not exporters:
         print("오류: 유효한 출력 형식이 없습니다.")
@@ -92,11 +190,14 @@ def main():
     
     try:
         # Takeout 파서 초기화
-        print(f"Takeout 데이터 디렉토리: {takeout_dir.absolute()}")
-        takeout_parser = TakeoutParser(takeout_dir)
+        print(f"Takeout 데이터 경로: {takeout_dir.absolute()}")
+        takeout_parser = TakeoutParser(takeout_dir, playlist_dir=args.playlist_dir)
+        if takeout_parser.videos_dir != takeout_dir:
+            print(f"재생목록 폴더: {takeout_parser.videos_dir}")
         
         # 재생목록 및 영상 정보 파싱
-        playlists_data = takeout_parser.get_all_playlists_with_videos()
+        with takeout_parser:
+            playlists_data = takeout_parser.get_all_playlists_with_videos(workers=args.parse_workers)
         
         # YouTube API로 정보 보강 (선택사항)
         youtube_api = None
@@ -105,29 +206,52 @@ def main():
             try:
                 from youtube_api import YouTubeAPI
                 youtube_api = YouTubeAPI()
-                # TODO: 영상 정보 보강 로직 구현
-                print("⚠️  영상 정보 보강 기능은 아직 구현되지 않았습니다.")
+                # 보강 워커를 시작하기 전에 한 번만 인증
+                youtube_api.get_service(require_oauth=True)
+                stats = takeout_parser.enrich_playlists(
+                    playlists_data,
+                    youtube_api,
+                    concurrency=args.concurrency,
+                    use_batch=args.batch
+                )
+                print(
+                    f"✓ 전체 {stats['total_rows']}개 항목 중 고유 영상 {stats['unique_videos']}개 조회, "
+                    f"{stats['resolved_videos']}개 정보 확인 ({stats['enriched_rows']}개 항목 보강)"
+                )
+                cache_stats = youtube_api.metadata_cache.stats()
+                print(f"  메타데이터 캐시: 적중 {cache_stats['hits']}개, 미스 {cache_stats['misses']}개")
             except Exception as e:
-                print(f"⚠️  YouTube API 초기화 실패: {e}")
+                print(f"⚠️  영상 정보 보강 실패: {e}")
                 print("기본 정보만으로 진행합니다.")
         
         # 파일 출력
         print(f"\n{len(playlists_data)}개의 재생목록을 {len(exporters)}가지 형식으로 저장 중...\n")
         
         total_files = 0
-        for playlist_data in playlists_data:
-            for exporter in exporters:
-                try:
-                    filepath = exporter.export(playlist_data)
-                    total_files += 1
-                    print(f"  ✓ {filepath.parent.name}/{filepath.name} 저장 완료")
-                except Exception as e:
-                    print(f"  ✗ {playlist_data['title']} ({exporter.get_file_extension()}) 저장 실패: {e}")
+        with ExportPool(exporters, workers=args.export_concurrency, mode=args.export_mode) as pool:
+            for playlist_data in playlists_data:
+                pool.submit(playlist_data)
+            for result in pool.drain():
+                if result.error is not None:
+                    print(f"  ✗ {result.playlist['title']} 저장 실패: {result.error}")
+                for outcome in result.outcomes:
+                    if outcome.ok:
+                        total_files += 1
+                        if outcome.skipped:
+                            print(f"  = {outcome.path.parent.name}/{outcome.path.name} 변경 없음")
+                        else:
+                            print(f"  ✓ {outcome.path.parent.name}/{outcome.path.name} 저장 완료")
+                    else:
+                        print(f"  ✗ {result.playlist['title']} ({outcome.exporter.get_file_extension()}) 저장 실패: {outcome.error}")
         
         print(f"\n{'='*50}")
         print(f"완료! 총 {len(playlists_data)}개 재생목록, {total_files}개 파일이 생성되었습니다.")
+        print(f"형식별 저장 시간: {pool.format_timings()}")
         print(f"출력 디렉토리: {config.OUTPUT_DIR.absolute()}")
         
+        if args.search_index:
+            build_search_page(exporters)
+        
     except KeyboardInterrupt:
         print("\n\n작업이 사용자에 의해 중단되었습니다.")
         sys.exit(1)
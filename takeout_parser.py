@@ -3,25 +3,159 @@ Google Takeout CSV 파일 파서
 YouTube 재생목록 데이터를 CSV에서 읽어서 Python 데이터 구조로 변환
 """
 import csv
-from pathlib import Path
-from typing import List, Dict, Optional
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import List, Dict, Optional, TextIO, Tuple
 import re
+from models import PlaylistItem
+from takeout_archive import (
+    PLAYLISTS_CSV_NAME, VIDEOS_CSV_SUFFIX, TakeoutArchive, is_takeout_archive, locate_playlist_dir,
+    open_takeout_archive
+)
+
+# 나중에 볼 동영상 재생목록의 제목/파일명 표기
+WATCH_LATER_TITLES = frozenset({"watch later", "watchlater", "나중에 볼 동영상"})
+
+
+def normalize_playlist_title(title: str) -> str:
+    """
+    재생목록 제목과 CSV 파일명 비교용 정규화 (대소문자, 슬래시, 나중에 볼 동영상 표기)
+    
+    Args:
+        title: 재생목록 제목 또는 CSV 파일명의 재생목록명
+        
+    Returns:
+        정규화된 제목
+    """
+    normalized = title.replace("/", "_").replace("\\", "_").strip().casefold()
+    if normalized in WATCH_LATER_TITLES:
+        return "watch later"
+    return normalized
+
+
+def read_videos_rows(f: TextIO) -> Tuple[str, str]:
+    """
+    영상 CSV 내용에서 영상 ID와 추가 시각 열만 읽기
+    
+    결과를 다른 프로세스로 넘기거나 보관하는 비용을 줄이기 위해 각 열을 줄바꿈으로
+    이어 붙인 문자열 하나로 반환합니다.
+    
+    Args:
+        f: "{재생목록명}-동영상.csv" 텍스트 스트림
+        
+    Returns:
+        (영상 ID 열, 추가 시각 열) - 빈 영상 ID 행은 제외
+    """
+    video_ids = []
+    added_ats = []
+    reader = csv.reader(f)
+    header = next(reader, [])
+    if "동영상 ID" not in header:
+        return "", ""
+    id_column = header.index("동영상 ID")
+    added_column = header.index("재생목록 동영상 생성 타임스탬프") if "재생목록 동영상 생성 타임스탬프" in header else None
+    
+    for row in reader:
+        video_id = row[id_column].strip() if id_column < len(row) else ""
+        if not video_id:
+            continue
+        video_ids.append(video_id)
+        added_ats.append(row[added_column] if added_column is not None and added_column < len(row) else "")
+    
+    return "\n".join(video_ids), "\n".join(added_ats)
+
+
+def read_videos_csv(csv_path: Path) -> Tuple[str, str]:
+    """
+    재생목록 영상 CSV 파일 하나 읽기 (프로세스 풀에서 실행할 수 있도록 모듈 함수로 정의)
+    
+    Args:
+        csv_path: "{재생목록명}-동영상.csv" 파일 경로
+        
+    Returns:
+        (영상 ID 열, 추가 시각 열)
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        return read_videos_rows(f)
+
+
+def build_videos(columns: Tuple[str, str]) -> List[PlaylistItem]:
+    """
+    read_videos_csv() 결과로 영상 리스트 생성
+    
+    Args:
+        columns: (영상 ID 열, 추가 시각 열)
+        
+    Returns:
+        영상 정보 리스트 (video_id, added_at 포함)
+    """
+    video_ids, added_ats = columns
+    if not video_ids:
+        return []
+    # CSV에는 제목, 썸네일, 채널 정보가 없음
+    # (제목 등은 YouTube API로 채울 수 있고, URL과 썸네일은 영상 ID로 계산)
+    return [
+        PlaylistItem(video_id, "takeout", added_at=added_at, position=position)  # 순서대로
+        for position, (video_id, added_at) in enumerate(zip(video_ids.split("\n"), added_ats.split("\n")))
+    ]
 
 
 class TakeoutParser:
     """Google Takeout CSV 파일 파서"""
     
-    def __init__(self, takeout_dir: Path):
+    def __init__(self, takeout_dir: Path, playlist_dir: Optional[str] = None):
         """
         초기화
         
         Args:
-            takeout_dir: Takeout 데이터 디렉토리 경로
+            takeout_dir: Takeout 데이터 디렉토리 경로 또는 Takeout 압축 파일(.zip, .tgz 등)
                         예: takeout_data/251216/Takeout 2/YouTube 및 YouTube Music/재생목록/
+                            takeout-20251216T000000Z-001.zip
+            playlist_dir: 재생목록.csv가 있는 폴더 (압축 파일 또는 디렉토리 안의 경로, 뒷부분만 써도 됨)
+                         None이면 재생목록.csv가 있는 폴더를 자동으로 찾음
         """
         self.takeout_dir = Path(takeout_dir)
-        self.playlists_csv = self.takeout_dir / "재생목록.csv"
-        self.videos_dir = self.takeout_dir
+        self.archive: Optional[TakeoutArchive] = None
+        if is_takeout_archive(self.takeout_dir):
+            # 압축을 풀지 않고 압축 파일 안의 CSV를 바로 읽음
+            self.archive = open_takeout_archive(self.takeout_dir, read_videos_rows, playlist_dir)
+            self.videos_dir = self.takeout_dir / self.archive.playlist_dir
+        elif playlist_dir or not (self.takeout_dir / PLAYLISTS_CSV_NAME).exists():
+            self.videos_dir = self._locate_videos_dir(playlist_dir)
+        else:
+            self.videos_dir = self.takeout_dir
+        self.playlists_csv = self.videos_dir / PLAYLISTS_CSV_NAME
+        # 영상 CSV 파일명 색인 (처음 조회할 때 생성)
+        self._exact_index: Optional[Dict[str, Path]] = None
+        self._normalized_index: Dict[str, Path] = {}
+    
+    def _locate_videos_dir(self, playlist_dir: Optional[str]) -> Path:
+        """압축을 푼 Takeout 디렉토리 안에서 재생목록.csv가 있는 폴더 찾기"""
+        if not self.takeout_dir.is_dir():
+            return self.takeout_dir
+        members = [
+            PurePosixPath(path.relative_to(self.takeout_dir).as_posix())
+            for path in self.takeout_dir.rglob(PLAYLISTS_CSV_NAME)
+        ]
+        try:
+            return self.takeout_dir / locate_playlist_dir(members, playlist_dir)
+        except FileNotFoundError:
+            # 재생목록.csv를 읽을 때 기존 오류 메시지로 안내
+            return self.takeout_dir
+    
+    def close(self) -> None:
+        """Takeout 압축 파일 닫기 (파싱이 끝난 뒤 호출)"""
+        if self.archive is not None:
+            self.archive.close()
+    
+    def __enter__(self) -> "TakeoutParser":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def parse_playlists_metadata(self) -> List[Dict]:
         """
@@ -32,10 +166,14 @@ class TakeoutParser:
         """
         playlists = []
         
-        if not self.playlists_csv.exists():
+        if self.archive is not None:
+            f = io.StringIO(self.archive.playlists_csv_text(), newline='')
+        elif not self.playlists_csv.exists():
             raise FileNotFoundError(f"재생목록.csv 파일을 찾을 수 없습니다: {self.playlists_csv}")
+        else:
+            f = open(self.playlists_csv, 'r', encoding='utf-8')
         
-        with open(self.playlists_csv, 'r', encoding='utf-8') as f:
+        with f:
             reader = csv.DictReader(f)
             for row in reader:
                 playlists.append({
@@ -51,6 +189,48 @@ class TakeoutParser:
         
         return playlists
     
+    def _build_csv_index(self) -> None:
+        """
+        영상 CSV 파일명 색인 생성 (디렉토리는 한 번만 조회)
+        
+        파일명의 재생목록명 그대로의 색인과, 대소문자/슬래시/나중에 볼 동영상 표기를
+        정규화한 색인을 함께 만듭니다.
+        """
+        self._exact_index: Dict[str, Path] = {}
+        self._normalized_index: Dict[str, Path] = {}
+        if self.archive is not None:
+            names = self.archive.video_csv_names()
+        else:
+            names = sorted(
+                entry.name for entry in os.scandir(self.videos_dir)
+                if entry.name.endswith(VIDEOS_CSV_SUFFIX) and entry.is_file()
+            )
+        for name in names:
+            stem = name[:-len(VIDEOS_CSV_SUFFIX)]
+            path = self.videos_dir / name
+            self._exact_index[stem] = path
+            self._normalized_index.setdefault(normalize_playlist_title(stem), path)
+    
+    def find_videos_csv(self, playlist_title: str) -> Optional[Path]:
+        """
+        재생목록의 영상 CSV 파일 경로 찾기
+        
+        Args:
+            playlist_title: 재생목록 제목
+            
+        Returns:
+            CSV 파일 경로 (없으면 None)
+        """
+        if self._exact_index is None:
+            self._build_csv_index()
+        # CSV 파일명: "{재생목록명}-동영상.csv" (슬래시는 _로 바뀜)
+        safe_title = playlist_title.replace("/", "_").replace("\\", "_")
+        return (
+            self._exact_index.get(safe_title) or
+            self._exact_index.get(playlist_title) or
+            self._normalized_index.get(normalize_playlist_title(playlist_title))
+        )
+    
     def parse_playlist_videos(self, playlist_title: str) -> List[Dict]:
         """
         특정 재생목록의 영상 CSV 파일 파싱
@@ -61,78 +241,71 @@ class TakeoutParser:
         Returns:
             영상 정보 리스트 (video_id, added_at 포함)
         """
-        # CSV 파일명 생성: "{재생목록명}-동영상.csv"
-        # 특수문자 처리 필요
-        safe_title = playlist_title.replace("/", "_").replace("\\", "_")
-        csv_filename = f"{safe_title}-동영상.csv"
-        csv_path = self.videos_dir / csv_filename
-        
-        # 파일이 없으면 다른 패턴 시도
-        if not csv_path.exists():
-            # 모든 "-동영상.csv" 파일 검색
-            for file in self.videos_dir.glob("*-동영상.csv"):
-                # 파일명에서 재생목록명 추출
-                file_stem = file.stem.replace("-동영상", "")
-                # 정확히 일치하거나, 대소문자 무시 비교
-                # 또는 "Watch later"와 "Watch Later" 같은 변형 처리
-                title_lower = playlist_title.lower()
-                file_stem_lower = file_stem.lower()
-                
-                if (file_stem == playlist_title or 
-                    file_stem == safe_title or
-                    file_stem_lower == title_lower or
-                    # "Watch later"와 "Watch Later" 매칭
-                    (title_lower in ["watch later", "나중에 볼 동영상"] and 
-                     file_stem_lower in ["watch later", "watchlater"])):
-                    csv_path = file
-                    break
-        
-        if not csv_path.exists():
-            print(f"⚠️  영상 CSV 파일을 찾을 수 없습니다: {csv_filename}")
+        csv_path = self.find_videos_csv(playlist_title)
+        if csv_path is None:
+            print(f"⚠️  영상 CSV 파일을 찾을 수 없습니다: {self._missing_csv_name(playlist_title)}")
             return []
-        
-        videos = []
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                video_id = row.get("동영상 ID", "").strip()
-                if not video_id:
-                    continue
-                
-                videos.append({
-                    "video_id": video_id,
-                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                    "added_at": row.get("재생목록 동영상 생성 타임스탬프", ""),
-                    # CSV에는 제목, 썸네일, 채널 정보가 없음
-                    # YouTube API로 가져오거나 기본값 사용
-                    "title": "",  # 나중에 API로 채울 수 있음
-                    "description": "",
-                    "thumbnail": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
-                    "channel_title": "",
-                    "position": len(videos)  # 순서대로
-                })
-        
-        return videos
+        return build_videos(self._read_videos(csv_path))
     
-    def get_all_playlists_with_videos(self) -> List[Dict]:
+    def _read_videos(self, csv_path: Path) -> Tuple[str, str]:
+        if self.archive is not None:
+            return self.archive.read_videos(csv_path.name, read_videos_rows)
+        return read_videos_csv(csv_path)
+    
+    @staticmethod
+    def _missing_csv_name(playlist_title: str) -> str:
+        return playlist_title.replace("/", "_").replace("\\", "_") + VIDEOS_CSV_SUFFIX
+    
+    def get_all_playlists_with_videos(self, workers: Optional[int] = None) -> List[Dict]:
         """
         모든 재생목록과 영상 정보 파싱
         
+        영상 CSV 파일은 프로세스 풀에서 동시에 읽고, 영상 리스트는 재생목록.csv 순서대로
+        현재 프로세스에서 만듭니다.
+        
+        Args:
+            workers: 파싱 프로세스 수 (None 또는 0이면 CPU 수, 1이면 현재 프로세스에서 순차 파싱,
+                     압축 파일은 항상 순차 파싱)
+        
         Returns:
             재생목록 정보와 영상 리스트가 포함된 딕셔너리 리스트
         """
         print("Takeout CSV 파일 파싱 중...")
         playlists_metadata = self.parse_playlists_metadata()
-        print(f"총 {len(playlists_metadata)}개의 재생목록을 찾았습니다.")
+        total = len(playlists_metadata)
+        print(f"총 {total}개의 재생목록을 찾았습니다.")
         
-        results = []
-        for idx, playlist in enumerate(playlists_metadata, 1):
-            print(f"[{idx}/{len(playlists_metadata)}] {playlist['title']} 처리 중...")
-            videos = self.parse_playlist_videos(playlist["title"])
-            playlist["video_count"] = len(videos)
-            playlist["videos"] = videos
-            results.append(playlist)
-            print(f"✓ {playlist['title']}: {len(videos)}개 영상 발견")
+        csv_paths = [self.find_videos_csv(playlist["title"]) for playlist in playlists_metadata]
+        found_paths = [path for path in csv_paths if path is not None]
+        if not workers:
+            workers = os.cpu_count() or 1
+        workers = min(max(1, workers), len(found_paths))
+        if self.archive is not None:
+            # 압축 파일은 한 번의 순차 읽기로 처리
+            workers = 1
+        
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            if executor is not None:
+                parsed = executor.map(read_videos_csv, found_paths, chunksize=max(1, len(found_paths) // (workers * 4)))
+            else:
+                parsed = map(self._read_videos, found_paths)
+            
+            results = []
+            for idx, (playlist, csv_path) in enumerate(zip(playlists_metadata, csv_paths), 1):
+                print(f"[{idx}/{total}] {playlist['title']} 처리 중...")
+                if csv_path is None:
+                    print(f"⚠️  영상 CSV 파일을 찾을 수 없습니다: {self._missing_csv_name(playlist['title'])}")
+                    videos = []
+                else:
+                    videos = build_videos(next(parsed))
+                playlist["video_count"] = len(videos)
+                playlist["videos"] = videos
+                results.append(playlist)
+                print(f"✓ {playlist['title']}: {len(videos)}개 영상 발견")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
         return results
     
@@ -141,7 +314,7 @@ class TakeoutParser:
         영상 ID로 YouTube API를 호출하여 상세 정보 가져오기 (선택사항)
         
         Args:
-            videos: 영상 ID 리스트
+            videos: 영상 정보 리스트
             youtube_api: YouTubeAPI 인스턴스 (선택사항)
             
         Returns:
@@ -150,7 +323,112 @@ class TakeoutParser:
         if not youtube_api:
             return videos
         
-        # TODO: YouTube API를 사용하여 영상 제목, 채널 정보 등 가져오기
-        # 현재는 기본 정보만 반환
+        self.enrich_playlists([{"videos": videos}], youtube_api)
         return videos
-
+    
+    def enrich_playlists(
+        self,
+        playlists: List[Dict],
+        youtube_api,
+        concurrency: int = 1,
+        use_batch: bool = False
+    ) -> Dict[str, int]:
+        """
+        모든 재생목록의 영상 정보를 videos.list로 한 번에 보강
+        
+        전체 재생목록에서 고유한 영상 ID만 모아 50개씩 조회한 뒤, 그 결과를
+        해당 영상을 포함한 모든 재생목록 항목에 채워 넣습니다.
+        (예: 20,000행 중 고유 영상 8,000개 → videos.list 160회)
+        
+        Args:
+            playlists: get_all_playlists_with_videos() 결과
+            youtube_api: YouTubeAPI 인스턴스
+            concurrency: 동시에 실행할 조회 워커 수 (공용 속도 제한기 적용)
+            use_batch: True면 videos.list 호출을 HTTP 배치 요청으로 묶어 전송
+            
+        Returns:
+            통계 (total_rows, unique_videos, resolved_videos, enriched_rows)
+        """
+        video_ids = list(dict.fromkeys(
+            video["video_id"]
+            for playlist in playlists
+            for video in playlist["videos"]
+            if video.get("video_id")
+        ))
+        metadata = self._fetch_video_metadata(video_ids, youtube_api, concurrency, use_batch)
+        
+        total_rows = 0
+        enriched_rows = 0
+        for playlist in playlists:
+            for video in playlist["videos"]:
+                total_rows += 1
+                info = metadata.get(video.get("video_id"))
+                if not info:
+                    continue
+                video["title"] = info["title"]
+                video["description"] = info["description"]
+                video["channel_title"] = info["channel_title"]
+                if info["thumbnail"]:
+                    video["thumbnail"] = info["thumbnail"]
+                enriched_rows += 1
+        
+        return {
+            "total_rows": total_rows,
+            "unique_videos": len(video_ids),
+            "resolved_videos": len(metadata),
+            "enriched_rows": enriched_rows
+        }
+    
+    def _fetch_video_metadata(
+        self,
+        video_ids: List[str],
+        youtube_api,
+        concurrency: int,
+        use_batch: bool
+    ) -> Dict[str, Dict]:
+        """캐시에 없는 영상만 작업 단위로 나눠 (필요하면 동시에) 조회"""
+        metadata_cache = getattr(youtube_api, "metadata_cache", None)
+        metadata = metadata_cache.get_many(video_ids) if metadata_cache is not None else {}
+        video_ids = [video_id for video_id in video_ids if video_id not in metadata]
+        if not video_ids:
+            return metadata
+        
+        fetched = self._fetch_uncached_metadata(video_ids, youtube_api, concurrency, use_batch)
+        if metadata_cache is not None:
+            metadata_cache.put_many(fetched)
+        metadata.update(fetched)
+        return metadata
+    
+    def _fetch_uncached_metadata(
+        self,
+        video_ids: List[str],
+        youtube_api,
+        concurrency: int,
+        use_batch: bool
+    ) -> Dict[str, Dict]:
+        """고유 영상 ID 목록을 작업 단위로 나눠 (필요하면 동시에) 조회"""
+        chunk_size = youtube_api.VIDEOS_PER_REQUEST
+        if use_batch:
+            chunk_size *= youtube_api.VIDEOS_LIST_PER_BATCH
+        chunks = [video_ids[i:i + chunk_size] for i in range(0, len(video_ids), chunk_size)]
+        
+        if concurrency <= 1 or len(chunks) <= 1:
+            return youtube_api.get_videos_metadata(video_ids, use_batch=use_batch, use_cache=False)
+        
+        # 워커를 시작하기 전에 인증을 끝내 두어 워커들이 동시에 OAuth 흐름을 열지 않게 함
+        youtube_api.get_service(require_oauth=True)
+        # 워커마다 별도 HTTP 연결을 가진 클라이언트 사용 (httplib2는 스레드 간 공유 불가)
+        local = threading.local()
+        
+        def fetch(chunk: List[str]) -> Dict[str, Dict]:
+            worker_api = getattr(local, "youtube_api", None)
+            if worker_api is None:
+                worker_api = youtube_api.clone_for_worker()
+                local.youtube_api = worker_api
+            return worker_api.get_videos_metadata(chunk, use_batch=use_batch, use_cache=False)
+        
+        metadata = {}
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="takeout-enrich") as executor:
+            for result in executor.map(fetch, chunks):
+                metadata.update(result)
+        return metadata
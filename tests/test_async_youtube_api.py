@@ -0,0 +1,278 @@
+import asyncio
+import importlib.util
+import json
+import random
+import sys
+import types
+import unittest
+from unittest import mock
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+HAS_AIOHTTP = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("aiohttp", "googleapiclient", "google_auth_oauthlib", "httplib2")
+)
+
+if HAS_AIOHTTP:
+    import async_youtube_api
+    from async_youtube_api import AsyncHttpError, AsyncYouTubeAPI
+    from retry_policy import CircuitBreaker, RetryPolicy
+
+
+def _item(video_id):
+    return {
+        "id": f"pi-{video_id}",
+        "snippet": {"title": f"영상 {video_id}", "position": 0},
+        "contentDetails": {"videoId": video_id},
+    }
+
+
+def _page(video_ids, etag="etag", next_page_token=None):
+    data = {"etag": etag, "items": [_item(video_id) for video_id in video_ids]}
+    if next_page_token:
+        data["nextPageToken"] = next_page_token
+    return 200, data
+
+
+class _FakeResponse:
+    def __init__(self, status, data=None, headers=None, delay=0):
+        self.status = status
+        self.reason = "reason"
+        self.headers = headers or {}
+        self._content = json.dumps(data).encode("utf-8") if data is not None else b""
+        self._delay = delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def read(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self._content
+
+
+class _FakeSession:
+    """응답을 순서대로 돌려주거나(responses) 요청마다 만드는(handler) aiohttp 세션 대역"""
+
+    closed = False
+
+    def __init__(self, responses=None, handler=None):
+        self.responses = list(responses or [])
+        self.handler = handler
+        self.requests = []
+
+    def request(self, method, url, params=None, json=None, headers=None):
+        self.requests.append({"method": method, "url": url, "params": dict(params or {}), "headers": dict(headers or {})})
+        if self.handler is not None:
+            return self.handler(params or {})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        status, data, *rest = response
+        return _FakeResponse(status, data, headers=rest[0] if rest else None)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeRateLimiter:
+    async def acquire_async(self, tokens=1):
+        return 0
+
+
+class _FakeQuotaLedger:
+    def __init__(self):
+        self.recorded = []
+
+    def check(self, method, count=1):
+        pass
+
+    def record(self, method, count=1):
+        self.recorded.append(method)
+
+
+class _FakePageIndex:
+    def __init__(self, pages):
+        self.pages = pages
+        self.loaded = []
+
+    def etag(self, page_token):
+        page = self.pages.get(page_token)
+        return page["etag"] if page else None
+
+    def load(self, page_token):
+        self.loaded.append(page_token)
+        return self.pages[page_token]
+
+
+class _FakeCredentials:
+    def __init__(self, token="old-token"):
+        self.token = token
+        self.refreshed = 0
+
+    @property
+    def valid(self):
+        return self.token is not None
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.token = f"new-token-{self.refreshed}"
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp가 설치되어 있지 않습니다.")
+class AsyncYouTubeAPITests(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+
+        async def fake_sleep(seconds):
+            self.sleeps.append(seconds)
+
+        self.sleep_patch = mock.patch.object(async_youtube_api.asyncio, "sleep", fake_sleep)
+        self.ledger = _FakeQuotaLedger()
+
+    def _client(self, session, credentials=None, max_attempts=4, breaker=None):
+        client = AsyncYouTubeAPI(
+            credentials=credentials,
+            api_key="key",
+            rate_limiter=_FakeRateLimiter(),
+            quota_ledger=self.ledger,
+            retry_policy=RetryPolicy(
+                max_attempts=max_attempts, base_delay=0.5, max_delay=2.0, breaker=breaker, rng=random.Random(1)
+            ),
+        )
+        client._session = session
+        return client
+
+    def _run(self, coroutine, fake_sleep=True):
+        if not fake_sleep:
+            return asyncio.run(coroutine)
+        with self.sleep_patch:
+            return asyncio.run(coroutine)
+
+    def test_iter_playlist_pages_follows_tokens_and_reuses_not_modified_pages(self):
+        cached_first = {"page_token": None, "etag": "etag-1", "next_page_token": "p2", "videos": [{"video_id": "a"}]}
+        cached_pages = _FakePageIndex({None: cached_first, "p3": {**cached_first, "etag": "etag-3"}})
+        session = _FakeSession([(304, None), _page(["b", "c"], etag="etag-2", next_page_token="p3"), _page(["d"])])
+        client = self._client(session)
+
+        async def collect():
+            return [page async for page in client.iter_playlist_pages("PL1", cached_pages=cached_pages)]
+
+        pages = self._run(collect())
+
+        self.assertEqual([page["not_modified"] for page in pages], [True, False, False])
+        self.assertEqual(pages[0]["videos"], [{"video_id": "a"}])
+        self.assertEqual([video["video_id"] for video in pages[1]["videos"]], ["b", "c"])
+        self.assertEqual(pages[1]["etag"], "etag-2")
+        self.assertEqual([request["params"].get("pageToken") for request in session.requests], [None, "p2", "p3"])
+        self.assertEqual(session.requests[0]["headers"].get("If-None-Match"), "etag-1")
+        self.assertNotIn("If-None-Match", session.requests[1]["headers"])
+        self.assertEqual(session.requests[2]["headers"].get("If-None-Match"), "etag-3")
+        # 200 응답을 받은 p3 페이지는 디스크에서 읽지 않음
+        self.assertEqual(cached_pages.loaded, [None])
+        self.assertEqual(session.requests[0]["params"]["key"], "key")
+        self.assertEqual(self.ledger.recorded, ["playlistItems.list"] * 3)
+
+    def test_throttled_and_server_errors_are_retried(self):
+        session = _FakeSession([
+            (429, {"error": {"errors": [{"reason": "rateLimitExceeded"}]}}, {"Retry-After": "1.5"}),
+            (503, {"error": {"errors": [{"reason": "backendError"}]}}),
+            _page(["a"]),
+        ])
+        client = self._client(session)
+
+        videos = self._run(self._collect_videos(client))
+
+        self.assertEqual([video["video_id"] for video in videos], ["a"])
+        self.assertEqual(len(session.requests), 3)
+        self.assertEqual(self.sleeps[0], 1.5)
+        self.assertTrue(0.5 <= self.sleeps[1] <= 2.0)
+
+    def test_permanent_and_exhausted_errors_raise(self):
+        not_found = _FakeSession([(404, {"error": {"errors": [{"reason": "playlistNotFound"}]}})])
+        with self.assertRaises(AsyncHttpError) as context:
+            self._run(self._collect_videos(self._client(not_found)))
+        self.assertEqual(context.exception.status, 404)
+        self.assertEqual(len(not_found.requests), 1)
+
+        quota = _FakeSession([(403, {"error": {"errors": [{"reason": "quotaExceeded"}]}})])
+        with self.assertRaises(AsyncHttpError):
+            self._run(self._collect_videos(self._client(quota)))
+        self.assertEqual(len(quota.requests), 1)
+
+        failing = _FakeSession([(500, None)] * 3)
+        with self.assertRaises(AsyncHttpError) as context:
+            self._run(self._collect_videos(self._client(failing, max_attempts=3)))
+        self.assertEqual(context.exception.status, 500)
+        self.assertEqual(len(failing.requests), 3)
+
+    def test_connection_errors_are_retried(self):
+        import aiohttp
+
+        breaker = CircuitBreaker(failure_threshold=10)
+        session = _FakeSession([aiohttp.ServerDisconnectedError(), _page(["a"])])
+        client = self._client(session, breaker=breaker)
+
+        videos = self._run(self._collect_videos(client))
+
+        self.assertEqual([video["video_id"] for video in videos], ["a"])
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_rejected_token_is_refreshed_once(self):
+        credentials = _FakeCredentials()
+        session = _FakeSession([(401, None), _page(["a"])])
+        client = self._client(session, credentials=credentials)
+
+        videos = self._run(self._collect_videos(client))
+
+        self.assertEqual([video["video_id"] for video in videos], ["a"])
+        self.assertEqual(credentials.refreshed, 1)
+        self.assertEqual(
+            [request["headers"]["Authorization"] for request in session.requests],
+            ["Bearer old-token", "Bearer new-token-1"],
+        )
+        self.assertNotIn("key", session.requests[0]["params"])
+
+        credentials = _FakeCredentials()
+        session = _FakeSession([(401, None), (401, None)])
+        with self.assertRaises(AsyncHttpError) as context:
+            self._run(self._collect_videos(self._client(session, credentials=credentials)))
+        self.assertEqual(context.exception.status, 401)
+        self.assertEqual(credentials.refreshed, 1)
+
+    def test_extract_playlists_keeps_input_order(self):
+        # 앞 재생목록일수록 늦게 끝나도록 응답 지연
+        delays = {"PL0": 0.03, "PL1": 0.02, "PL2": 0.0, "PL3": 0.01}
+
+        def handler(params):
+            playlist_id = params["playlistId"]
+            if playlist_id == "PL2":
+                return _FakeResponse(404, {"error": {"errors": [{"reason": "playlistNotFound"}]}})
+            return _FakeResponse(200, _page([f"{playlist_id}-v"])[1], delay=delays[playlist_id])
+
+        client = self._client(_FakeSession(handler=handler))
+        playlists = [{"id": playlist_id} for playlist_id in delays]
+
+        results = self._run(client.extract_playlists(playlists, concurrency=4), fake_sleep=False)
+
+        self.assertEqual([playlist["id"] for playlist, _, _ in results], ["PL0", "PL1", "PL2", "PL3"])
+        self.assertEqual([video["video_id"] for video in results[0][1]], ["PL0-v"])
+        self.assertIsNone(results[2][1])
+        self.assertIsInstance(results[2][2], AsyncHttpError)
+        self.assertIsNone(results[3][2])
+
+    @staticmethod
+    async def _collect_videos(client):
+        return [video async for video in client.get_playlist_videos("PL1")]
+
+
+if __name__ == "__main__":
+    unittest.main()
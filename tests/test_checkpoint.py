@@ -0,0 +1,101 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from checkpoint import CheckpointJournal
+from playlist_extractor import PlaylistExtractor
+
+
+def _page(token, next_token, *video_ids):
+    return {
+        "page_token": token,
+        "etag": f"etag-{token}",
+        "next_page_token": next_token,
+        "videos": [{"video_id": video_id} for video_id in video_ids],
+    }
+
+
+_NEVER = object()
+
+
+class _FlakyPagingAPI:
+    def __init__(self, pages, fail_at=_NEVER):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.requested_tokens = []
+
+    def iter_playlist_pages(self, playlist_id, cached_pages=None, start_page_token=None):
+        started = start_page_token is None
+        for page in self.pages:
+            if not started:
+                started = page["page_token"] == start_page_token
+                if not started:
+                    continue
+            self.requested_tokens.append(page["page_token"])
+            if page["page_token"] == self.fail_at:
+                raise RuntimeError("simulated failure")
+            yield page
+
+
+class CheckpointJournalTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = CheckpointJournal(Path(self.temp_dir.name))
+        self.playlist = {"id": "WL", "title": "Watch Later", "etag": "pl-etag"}
+        self.pages = [_page(None, "T1", "a"), _page("T1", "T2", "b"), _page("T2", None, "c")]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load_ignores_torn_trailing_line(self):
+        with self.journal.start(self.playlist) as writer:
+            writer.append_page(self.pages[0])
+        path = Path(self.temp_dir.name) / "WL.jsonl"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "page", "page_tok')
+
+        state = self.journal.load("WL")
+
+        self.assertEqual(len(state.pages), 1)
+        self.assertEqual(state.next_page_token, "T1")
+        with self.journal.start(self.playlist, state) as writer:
+            writer.append_page(self.pages[1])
+        self.assertEqual([v["video_id"] for v in self.journal.load("WL").videos], ["a", "b"])
+
+    def test_resume_continues_from_last_page_without_refetching(self):
+        failing_api = _FlakyPagingAPI(self.pages, fail_at="T2")
+        extractor = PlaylistExtractor(failing_api, concurrency=1, journal=self.journal)
+        with self.assertRaises(RuntimeError):
+            extractor._extract_playlist_videos(self.playlist)
+
+        api = _FlakyPagingAPI(self.pages)
+        resumed = PlaylistExtractor(api, concurrency=1, journal=self.journal, resume=True)
+        videos = resumed._extract_playlist_videos(self.playlist)
+
+        self.assertEqual([v["video_id"] for v in videos], ["a", "b", "c"])
+        self.assertEqual(api.requested_tokens, ["T2"])
+        self.assertTrue(self.journal.load("WL").complete)
+        resumed.commit_playlist(self.playlist)
+        self.assertIsNone(self.journal.load("WL"))
+
+    def test_changed_playlist_is_not_resumed(self):
+        with self.journal.start(self.playlist) as writer:
+            writer.append_page(self.pages[0])
+
+        api = _FlakyPagingAPI(self.pages)
+        extractor = PlaylistExtractor(api, concurrency=1, journal=self.journal, resume=True)
+        videos = extractor._extract_playlist_videos({**self.playlist, "etag": "changed"})
+
+        self.assertEqual([v["video_id"] for v in videos], ["a", "b", "c"])
+        self.assertEqual(api.requested_tokens, [None, "T1", "T2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
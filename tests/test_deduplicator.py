@@ -3,7 +3,12 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from deduplicator import analyze_playlist_json, write_dry_run_output
+from deduplicator import (
+    analyze_playlist_exports,
+    analyze_playlist_json,
+    find_playlist_exports,
+    write_dry_run_output,
+)
 
 
 class DeduplicatorTests(unittest.TestCase):
@@ -86,5 +91,101 @@ class DeduplicatorTests(unittest.TestCase):
         self.assertEqual(data["summary"]["duplicate_count"], 1)
 
 
+class CrossPlaylistDeduplicatorTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self._write_export(
+            "Watch Later",
+            "WL",
+            [
+                {"video_id": "A", "playlist_item_id": "wl-a", "position": 0, "added_at": "2024-03-01T00:00:00Z"},
+                {"video_id": "B", "playlist_item_id": "wl-b", "position": 1, "added_at": "2024-03-02T00:00:00Z"},
+            ],
+        )
+        self._write_export(
+            "Music",
+            "PL1",
+            [
+                {"video_id": "A", "playlist_item_id": "m-a", "position": 0, "added_at": "2023-01-01T00:00:00Z"},
+                {"video_id": "C", "playlist_item_id": "m-c", "position": 1, "added_at": "2023-01-02T00:00:00Z"},
+                {"video_id": "A", "playlist_item_id": "m-a2", "position": 2, "added_at": "2024-05-01T00:00:00Z"},
+            ],
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_export(self, title, playlist_id, videos):
+        playlist_dir = self.output_dir / title
+        playlist_dir.mkdir()
+        payload = {"playlist_id": playlist_id, "title": title, "videos": videos}
+        (playlist_dir / f"{title}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    def test_finds_exports_in_output_directory(self):
+        (self.output_dir / "target_to_delete.json").write_text("{}", encoding="utf-8")
+
+        exports = find_playlist_exports([self.output_dir])
+
+        self.assertEqual([path.name for path in exports], ["Music.json", "Watch Later.json"])
+
+    def test_priority_policy_keeps_copy_in_highest_priority_playlist(self):
+        exports = find_playlist_exports([self.output_dir])
+
+        result = analyze_playlist_exports(exports, policy="priority", priority=["Music"])
+
+        self.assertEqual(result.total_count, 5)
+        self.assertEqual(result.unique_count, 3)
+        self.assertEqual(result.delete_list, ["m-a2", "wl-a"])
+        self.assertEqual(result.duplicate_groups[0]["keepPlaylistId"], "PL1")
+
+    def test_unlisted_playlists_rank_in_input_order(self):
+        exports = find_playlist_exports([self.output_dir])
+
+        result = analyze_playlist_exports(exports, priority=["WL"])
+
+        self.assertEqual(result.delete_list, ["m-a", "m-a2"])
+
+    def test_oldest_and_newest_policies_use_added_at(self):
+        exports = find_playlist_exports([self.output_dir])
+
+        oldest = analyze_playlist_exports(exports, policy="oldest", priority=["WL"])
+        newest = analyze_playlist_exports(exports, policy="newest")
+
+        self.assertEqual(oldest.keep_list[0], "m-a")
+        self.assertEqual(newest.keep_list[0], "m-a2")
+        self.assertEqual(sorted(newest.delete_list), ["m-a", "wl-a"])
+
+    def test_repeated_exports_never_delete_a_kept_item(self):
+        export = self.output_dir / "Music" / "Music.json"
+        single_dir = self.output_dir / "single"
+        single_dir.mkdir()
+        (single_dir / "copy.json").write_text(
+            json.dumps({"playlist_id": "PL9", "title": "Copy", "videos": [{"video_id": "Z", "playlist_item_id": "p1"}]}),
+            encoding="utf-8",
+        )
+
+        exports = find_playlist_exports([self.output_dir, export, self.output_dir / "." / "Music" / "Music.json"])
+        self.assertEqual([path.name for path in exports], ["Music.json", "Watch Later.json"])
+
+        result = analyze_playlist_exports([export, export, single_dir / "copy.json", single_dir / "copy.json"])
+        self.assertEqual(result.total_count, 4)
+        self.assertEqual(result.delete_list, ["m-a2"])
+        self.assertFalse(set(result.keep_list) & set(result.delete_list))
+        self.assertIn("p1", result.keep_list)
+
+    def test_output_is_a_deleter_target_file(self):
+        exports = find_playlist_exports([self.output_dir])
+        output_path = self.output_dir / "target_to_delete.json"
+
+        result = analyze_playlist_exports(exports, priority=["Music"])
+        write_dry_run_output(result, output_path, self.output_dir)
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        self.assertEqual(data["delete_list"], ["m-a2", "wl-a"])
+        self.assertEqual(data["policy"], "priority")
+        self.assertEqual([playlist["playlistId"] for playlist in data["playlists"]], ["PL1", "WL"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,17 +1,35 @@
+import io
 import json
 import tempfile
+import threading
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
 
 from deleter import (
+    HttpError,
     backup_target_file,
     delete_playlist_items,
     limited_targets,
     load_successful_playlist_item_ids,
     load_target_file,
     pending_targets,
+    print_plan,
     write_log,
 )
+from quota import QuotaLedger
+from rate_limiter import AdaptiveRate, TokenBucket
+from retry_policy import RetryPolicy
+
+
+def _http_error(status, reason=""):
+    resp = SimpleNamespace(status=status, reason="")
+    content = json.dumps({"error": {"message": "simulated", "errors": [{"reason": reason}]}}).encode("utf-8")
+    error = HttpError(resp, content)
+    error.resp = resp
+    error.content = content
+    return error
 
 
 class _FakeDeleteRequest:
@@ -20,8 +38,12 @@ class _FakeDeleteRequest:
         self.failures = failures
 
     def execute(self):
-        if self.playlist_item_id in self.failures:
-            raise RuntimeError("simulated failure")
+        failure = self.failures.get(self.playlist_item_id)
+        if isinstance(failure, list):
+            # 앞에서부터 한 번씩 실패하고 목록이 비면 성공
+            failure = failure.pop(0) if failure else None
+        if failure is not None:
+            raise failure
         return None
 
 
@@ -35,14 +57,38 @@ class _FakePlaylistItems:
         return _FakeDeleteRequest(id, self.failures)
 
 
+class _FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
 class _FakeService:
     def __init__(self, failures=None):
         self.calls = []
-        self.failures = set(failures or [])
+        self.batches = []
+        if not isinstance(failures, dict):
+            failures = {item: RuntimeError("simulated failure") for item in failures or []}
+        self.failures = failures
 
     def playlistItems(self):
         return _FakePlaylistItems(self.calls, self.failures)
 
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(self, callback)
+
 
 class DeleterTests(unittest.TestCase):
     def setUp(self):
@@ -75,6 +121,16 @@ class DeleterTests(unittest.TestCase):
     def test_limited_targets_applies_limit(self):
         self.assertEqual(limited_targets(["a", "b", "c"], 2), ["a", "b"])
 
+    def test_print_plan_reports_quota_deferred_targets(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_plan({"delete_list": ["pi-1", "pi-2", "pi-3"]}, Path("t.json"), ["pi-1"], False, 0, 3, False, deferred_count=2)
+
+        lines = output.getvalue().splitlines()
+        self.assertIn("- limit 적용 후 요청 개수: 3", lines)
+        self.assertIn("- 할당량 부족으로 다음 실행으로 미룬 개수: 2", lines)
+        self.assertIn("- 이번 실행 실제 요청 개수: 1", lines)
+
     def test_limited_targets_rejects_invalid_limit(self):
         with self.assertRaisesRegex(ValueError, "1 이상"):
             limited_targets(["a"], 0)
@@ -123,5 +179,110 @@ class DeleterTests(unittest.TestCase):
         self.assertEqual(failures[0]["reason"], "RuntimeError")
 
 
+class DeletionEngineTests(unittest.TestCase):
+    IDS = [f"pi-{i}" for i in range(1, 24)]
+
+    def _failures(self):
+        return {"pi-5": RuntimeError("simulated failure"), "pi-17": _http_error(404, "playlistItemNotFound")}
+
+    def _run(self, **options):
+        service = _FakeService(self._failures())
+        return service, delete_playlist_items(service, self.IDS, delay=0, **options)
+
+    def test_batched_and_concurrent_runs_match_sequential_logs(self):
+        _, expected = self._run()
+
+        for options in ({"batch_size": 5}, {"concurrency": 4}, {"concurrency": 3, "batch_size": 4}):
+            with self.subTest(**options):
+                service, result = self._run(**options)
+
+                self.assertEqual(result, expected)
+                self.assertEqual(sorted(service.calls), sorted(self.IDS))
+
+        self.assertEqual(expected[1][1]["http_status"], 404)
+        self.assertEqual(expected[1][1]["reason"], "playlistItemNotFound")
+
+    def test_batches_group_requests(self):
+        service, _ = self._run(batch_size=10)
+
+        self.assertEqual(service.batches, [10, 10, 3])
+
+    def test_workers_use_their_own_service(self):
+        created = []
+        shared = _FakeService()
+
+        def factory():
+            created.append(threading.get_ident())
+            return shared
+
+        delete_playlist_items(_FakeService(), self.IDS, delay=0, concurrency=3, service_factory=factory)
+
+        self.assertEqual(len(created), len(set(created)))
+        self.assertEqual(sorted(shared.calls), sorted(self.IDS))
+
+    def test_quota_exhaustion_stops_without_logging_remaining_items(self):
+        ledger = QuotaLedger(None, daily_budget=50 * 7)
+        service = _FakeService()
+
+        successes, failures = delete_playlist_items(
+            service, self.IDS, delay=0, ledger=ledger, concurrency=2, batch_size=3
+        )
+
+        self.assertEqual(len(successes), 7)
+        self.assertEqual(failures, [])
+        self.assertEqual(len(service.calls), 7)
+
+    def test_throttled_responses_lower_adaptive_rate(self):
+        bucket = TokenBucket(rate=1000)
+        adaptive = AdaptiveRate(bucket)
+        failures = {"pi-3": _http_error(429), "pi-4": _http_error(403, "rateLimitExceeded")}
+
+        successes, failed = delete_playlist_items(
+            _FakeService(failures), self.IDS[:4], delay=0, limiter=bucket, adaptive=adaptive
+        )
+
+        self.assertEqual(adaptive.throttle_count, 2)
+        self.assertLess(bucket.rate, 1000)
+        self.assertEqual([record["playlistItemId"] for record in failed], ["pi-3", "pi-4"])
+        self.assertEqual(len(successes), 2)
+
+    def test_retry_policy_retries_throttled_items(self):
+        sleeps = []
+        policy = RetryPolicy(sleep=sleeps.append)
+        failures = {
+            "pi-2": [_http_error(429), _http_error(503, "backendError")],
+            "pi-3": _http_error(403, "quotaExceeded"),
+        }
+
+        for options in ({}, {"batch_size": 4}):
+            with self.subTest(**options):
+                service = _FakeService({key: list(value) if isinstance(value, list) else value
+                                        for key, value in failures.items()})
+                successes, failed = delete_playlist_items(
+                    service, self.IDS[:4], delay=0, retry_policy=policy, **options
+                )
+
+                self.assertEqual([record["playlistItemId"] for record in successes], ["pi-1", "pi-2", "pi-4"])
+                self.assertEqual([(record["playlistItemId"], record["reason"]) for record in failed],
+                                 [("pi-3", "quotaExceeded")])
+                # pi-2 was sent three times, pi-3 (quotaExceeded) only once
+                self.assertEqual(service.calls.count("pi-2"), 3)
+                self.assertEqual(service.calls.count("pi-3"), 1)
+        self.assertEqual(len(sleeps), 4)
+
+    def test_batch_retries_only_failed_items(self):
+        service = _FakeService({"pi-2": [_http_error(429)]})
+
+        delete_playlist_items(
+            service, self.IDS[:5], delay=0, batch_size=5, retry_policy=RetryPolicy(sleep=lambda _: None)
+        )
+
+        self.assertEqual(service.batches, [5, 1])
+
+    def test_invalid_batch_size_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "batch-size"):
+            delete_playlist_items(_FakeService(), self.IDS, delay=0, batch_size=51)
+
+
 if __name__ == "__main__":
     unittest.main()
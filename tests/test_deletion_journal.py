@@ -0,0 +1,98 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from deleter import delete_playlist_items, write_log
+from deletion_journal import JOURNAL_NAME, DeletionJournal, load_deleted_ids
+
+
+class _InterruptingService:
+    """pi-3 삭제 요청에서 프로세스가 중단된 것처럼 KeyboardInterrupt 발생"""
+
+    def __init__(self):
+        self.calls = []
+
+    def playlistItems(self):
+        return self
+
+    def delete(self, id):
+        self.calls.append(id)
+        return self
+
+    def execute(self):
+        if self.calls[-1] == "pi-3":
+            raise KeyboardInterrupt
+        return None
+
+
+class DeletionJournalTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.log_dir = Path(self._tmp.name)
+
+    def test_records_are_visible_to_a_new_process_before_close(self):
+        journal = DeletionJournal(self.log_dir).open()
+        journal.record({"playlistItemId": "pi-1", "status": "deleted", "index": 1})
+        journal.record({"playlistItemId": "pi-2", "status": "deleted", "index": 2})
+
+        # 닫지 않은 상태(비정상 종료)에서도 기록이 남아 있어야 함
+        self.assertEqual(load_deleted_ids(self.log_dir), {"pi-1", "pi-2"})
+        journal.close()
+
+        line = json.loads((self.log_dir / JOURNAL_NAME).read_text(encoding="utf-8").splitlines()[0])
+        self.assertEqual(line["playlistItemId"], "pi-1")
+        self.assertEqual(line["index"], 1)
+        self.assertIn("deleted_at", line)
+
+    def test_torn_trailing_line_is_ignored_and_truncated(self):
+        with DeletionJournal(self.log_dir) as journal:
+            journal.record({"playlistItemId": "pi-1", "status": "deleted", "index": 1})
+        with open(self.log_dir / JOURNAL_NAME, "a", encoding="utf-8") as f:
+            f.write('{"playlistItemId": "pi-2"')
+
+        self.assertEqual(load_deleted_ids(self.log_dir), {"pi-1"})
+        with DeletionJournal(self.log_dir) as journal:
+            journal.record({"playlistItemId": "pi-3", "status": "deleted", "index": 3})
+
+        self.assertEqual(load_deleted_ids(self.log_dir), {"pi-1", "pi-3"})
+
+    def test_legacy_logs_are_imported_once(self):
+        write_log(self.log_dir / "deletion_success_20260101_000000.json", [{"playlistItemId": "old-1"}])
+        write_log(self.log_dir / "deletion_failed_20260101_000000.json", [{"playlistItemId": "failed"}])
+
+        self.assertEqual(load_deleted_ids(self.log_dir), {"old-1"})
+        self.assertFalse((self.log_dir / JOURNAL_NAME).exists())  # 읽기만 할 때는 저널을 만들지 않음
+
+        with DeletionJournal(self.log_dir):
+            pass
+        with mock.patch("deletion_journal.read_legacy_log") as read_legacy_log:
+            journal = DeletionJournal(self.log_dir).load()
+
+        read_legacy_log.assert_not_called()
+        self.assertEqual(journal.deleted_ids, {"old-1"})
+        self.assertIn("old-1", journal)
+
+    def test_fsync_is_periodic(self):
+        with mock.patch("deletion_journal.os.fsync") as fsync:
+            with DeletionJournal(self.log_dir, fsync_every=2) as journal:
+                for index in range(1, 6):
+                    journal.record({"playlistItemId": f"pi-{index}", "status": "deleted", "index": index})
+                self.assertEqual(fsync.call_count, 2)
+
+        self.assertEqual(fsync.call_count, 3)
+
+    def test_interrupted_deletion_keeps_finished_items(self):
+        with DeletionJournal(self.log_dir) as journal:
+            with self.assertRaises(KeyboardInterrupt):
+                delete_playlist_items(
+                    _InterruptingService(), ["pi-1", "pi-2", "pi-3", "pi-4"], delay=0, journal=journal
+                )
+
+        self.assertEqual(load_deleted_ids(self.log_dir), {"pi-1", "pi-2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from exporters.html_exporter import HTMLExporter
+from exporters.json_exporter import JSONExporter
+from exporters.manifest import MANIFEST_FILENAME
+from exporters.markdown_exporter import MarkdownExporter
+from exporters.pipeline import ExportPipeline
+
+
+def _file_id(path: Path):
+    # 파일을 교체하면 inode가 바뀜
+    stat = path.stat()
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class ExportManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.playlist = {
+            "id": "PL1",
+            "title": "음악",
+            "description": "desc",
+            "published_at": "2024-01-01T00:00:00Z",
+            "videos": [
+                {
+                    "video_id": f"v{n}",
+                    "title": f"Video {n}",
+                    "url": f"https://www.youtube.com/watch?v=v{n}",
+                    "channel_title": "channel",
+                    "added_at": "2024-01-02T00:00:00Z",
+                }
+                for n in range(5)
+            ],
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _exporters(self, html_mode="single"):
+        return [
+            JSONExporter(self.output_dir),
+            MarkdownExporter(self.output_dir),
+            HTMLExporter(self.output_dir, mode=html_mode, page_size=2),
+        ]
+
+    def _changed_playlist(self):
+        videos = [dict(video) for video in self.playlist["videos"]]
+        videos[1]["title"] = "새 제목"
+        return {**self.playlist, "videos": videos}
+
+    def test_pipeline_skips_unchanged_files(self):
+        first = ExportPipeline(self._exporters()).export(self.playlist)
+        self.assertFalse(any(outcome.skipped for outcome in first))
+        before = {outcome.path: _file_id(outcome.path) for outcome in first}
+        self.assertTrue((self.output_dir / "음악" / MANIFEST_FILENAME).exists())
+
+        second = ExportPipeline(self._exporters()).export(self.playlist)
+
+        self.assertTrue(all(outcome.ok and outcome.skipped for outcome in second))
+        self.assertEqual({outcome.path: _file_id(outcome.path) for outcome in second}, before)
+
+        third = ExportPipeline(self._exporters()).export(self._changed_playlist())
+
+        self.assertFalse(any(outcome.skipped for outcome in third))
+        self.assertIn("새 제목", (self.output_dir / "음악" / "음악.json").read_text(encoding="utf-8"))
+
+    def test_missing_or_modified_files_are_rewritten(self):
+        outcomes = ExportPipeline(self._exporters()).export(self.playlist)
+        json_path, md_path, html_path = (outcome.path for outcome in outcomes)
+        expected = md_path.read_text(encoding="utf-8")
+        json_path.unlink()
+        md_path.write_text("edited", encoding="utf-8")
+
+        outcomes = ExportPipeline(self._exporters()).export(self.playlist)
+
+        self.assertEqual([outcome.skipped for outcome in outcomes], [False, False, True])
+        self.assertTrue(json_path.exists())
+        self.assertEqual(md_path.read_text(encoding="utf-8"), expected)
+
+    def test_changed_format_settings_rewrite_files(self):
+        ExportPipeline(self._exporters()).export(self.playlist)
+
+        outcomes = ExportPipeline(self._exporters(html_mode="paged")).export(self.playlist)
+
+        self.assertEqual([outcome.skipped for outcome in outcomes], [True, True, False])
+        self.assertTrue((self.output_dir / "음악" / "음악_3.html").exists())
+
+    def test_missing_or_modified_extra_pages_are_rewritten(self):
+        ExportPipeline(self._exporters(html_mode="paged")).export(self.playlist)
+        page_2 = self.output_dir / "음악" / "음악_2.html"
+        page_3 = self.output_dir / "음악" / "음악_3.html"
+        expected = page_2.read_text(encoding="utf-8")
+
+        outcomes = ExportPipeline(self._exporters(html_mode="paged")).export(self.playlist)
+        self.assertTrue(all(outcome.skipped for outcome in outcomes))
+
+        page_3.unlink()
+        outcomes = ExportPipeline(self._exporters(html_mode="paged")).export(self.playlist)
+        self.assertEqual([outcome.skipped for outcome in outcomes], [True, True, False])
+        self.assertTrue(page_3.exists())
+
+        page_2.write_text("edited", encoding="utf-8")
+        exporter = HTMLExporter(self.output_dir, mode="paged", page_size=2)
+        exporter.export(self.playlist)
+        self.assertEqual(page_2.read_text(encoding="utf-8"), expected)
+        before = _file_id(page_2)
+        exporter.export(self.playlist)
+        self.assertEqual(_file_id(page_2), before)
+
+    def test_streamed_export_keeps_unchanged_file(self):
+        exporter = JSONExporter(self.output_dir)
+        info = {key: value for key, value in self.playlist.items() if key != "videos"}
+        info["video_count"] = len(self.playlist["videos"])
+        path = exporter.export_stream(info, iter(self.playlist["videos"]))
+        before = _file_id(path)
+
+        self.assertEqual(exporter.export_stream(info, iter(self.playlist["videos"])), path)
+
+        self.assertEqual(_file_id(path), before)
+        self.assertEqual(sorted(os.listdir(path.parent)), [MANIFEST_FILENAME, "음악.json"])
+
+        changed = self._changed_playlist()["videos"]
+        exporter.export_stream(info, iter(changed))
+        self.assertIn("새 제목", path.read_text(encoding="utf-8"))
+
+    def test_skip_can_be_disabled(self):
+        exporter = MarkdownExporter(self.output_dir)
+        path = exporter.export(self.playlist)
+        before = _file_id(path)
+        self.assertEqual(_file_id(exporter.export(self.playlist)), before)
+
+        exporter.skip_unchanged = False
+        exporter.export(self.playlist)
+
+        self.assertNotEqual(_file_id(path), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
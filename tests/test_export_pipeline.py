@@ -0,0 +1,98 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from exporters.base_exporter import BaseExporter, ExportSink
+from exporters.json_exporter import JSONExporter
+from exporters.markdown_exporter import MarkdownExporter
+from exporters.pipeline import ExportPipeline
+
+
+class _FailingSink(ExportSink):
+    def write_video(self, index, video):
+        if index == 2:
+            raise RuntimeError("simulated failure")
+        self.file.write(video["video_id"])
+
+
+class _FailingExporter(BaseExporter):
+    def create_sink(self, file, filepath):
+        return _FailingSink(file)
+
+    def get_file_extension(self):
+        return ".txt"
+
+
+class _LegacyExporter(BaseExporter):
+    def export(self, playlist_data):
+        filepath = self.get_playlist_dir(playlist_data["title"]) / "legacy.txt"
+        filepath.write_text(str(len(playlist_data["videos"])), encoding="utf-8")
+        return filepath
+
+    def get_file_extension(self):
+        return ".legacy"
+
+
+class ExportPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.playlist = {
+            "id": "PL1",
+            "title": "My: Playlist?",
+            "description": "desc",
+            "video_count": 3,
+            "published_at": "2024-01-01T00:00:00Z",
+            "videos": [
+                {
+                    "video_id": f"v{n}",
+                    "title": f"Video {n}",
+                    "url": f"https://www.youtube.com/watch?v=v{n}",
+                    "channel_title": "channel",
+                    "added_at": "2024-01-02T00:00:00Z",
+                }
+                for n in range(3)
+            ],
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_pipeline_matches_individual_exports(self):
+        exporters = [JSONExporter(self.output_dir), MarkdownExporter(self.output_dir)]
+        expected = {}
+        for exporter in exporters:
+            path = exporter.export(self.playlist)
+            expected[path] = path.read_bytes()
+            path.unlink()
+
+        outcomes = ExportPipeline(exporters).export(self.playlist)
+
+        self.assertTrue(all(outcome.ok for outcome in outcomes))
+        self.assertEqual({outcome.path: outcome.path.read_bytes() for outcome in outcomes}, expected)
+
+    def test_failing_format_does_not_stop_other_formats(self):
+        pipeline = ExportPipeline([
+            _FailingExporter(self.output_dir),
+            JSONExporter(self.output_dir),
+            _LegacyExporter(self.output_dir),
+        ])
+
+        failing, json_outcome, legacy = pipeline.export(self.playlist)
+
+        self.assertIsInstance(failing.error, RuntimeError)
+        self.assertTrue(json_outcome.ok)
+        self.assertEqual(legacy.path.read_text(encoding="utf-8"), "3")
+        self.assertEqual(list(self.output_dir.rglob("*.tmp")), [])
+        self.assertEqual(set(pipeline.timings), {".txt", ".json", ".legacy"})
+
+
+if __name__ == "__main__":
+    unittest.main()
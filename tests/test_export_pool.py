@@ -0,0 +1,105 @@
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from exporters.base_exporter import BaseExporter, ExportSink
+from exporters.export_pool import ExportPool
+from exporters.json_exporter import JSONExporter
+
+
+class _SlowSink(ExportSink):
+    def __init__(self, file, exporter):
+        super().__init__(file)
+        self.exporter = exporter
+
+    def begin(self, playlist, video_count):
+        with self.exporter.lock:
+            self.exporter.started += 1
+
+    def write_video(self, index, video):
+        time.sleep(0.01)
+        self.file.write(video["video_id"])
+
+
+class _SlowExporter(BaseExporter):
+    def __init__(self, output_dir):
+        super().__init__(output_dir)
+        self.lock = threading.Lock()
+        self.started = 0
+
+    def create_sink(self, file, filepath):
+        return _SlowSink(file, self)
+
+    def get_file_extension(self):
+        return ".txt"
+
+
+def _playlist(index):
+    return {
+        "id": f"PL{index}",
+        "title": f"playlist {index}",
+        "video_count": 2,
+        "videos": [{"video_id": f"v{index}-{n}"} for n in range(2)],
+    }
+
+
+class ExportPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_results_are_returned_in_submission_order(self):
+        with ExportPool([JSONExporter(self.output_dir)], workers=3) as pool:
+            for index in range(8):
+                pool.submit(_playlist(index))
+            results = list(pool.drain())
+
+        self.assertEqual([result.playlist["id"] for result in results], [f"PL{i}" for i in range(8)])
+        self.assertTrue(all(result.ok for result in results))
+        self.assertNotIn("videos", results[0].playlist)
+        self.assertEqual(results[0].video_count, 2)
+
+    def test_submit_blocks_when_queue_is_full(self):
+        exporter = _SlowExporter(self.output_dir)
+        with ExportPool([exporter], workers=1, queue_size=1) as pool:
+            for index in range(4):
+                pool.submit(_playlist(index))
+                # At most one playlist running plus one waiting.
+                self.assertLessEqual(index + 1 - exporter.started, 2)
+            self.assertEqual(len(list(pool.drain())), 4)
+
+    def test_process_mode_writes_files(self):
+        with ExportPool([JSONExporter(self.output_dir)], workers=2, mode="process") as pool:
+            for index in range(3):
+                pool.submit(_playlist(index))
+            results = list(pool.drain())
+
+        self.assertTrue(all(result.ok for result in results))
+        for result in results:
+            self.assertTrue(result.outcomes[0].path.exists())
+        self.assertGreaterEqual(pool.timings[".json"], 0.0)
+
+    def test_zero_workers_exports_inline(self):
+        pool = ExportPool([JSONExporter(self.output_dir)], workers=0)
+        pool.submit(_playlist(0))
+
+        results = list(pool.completed())
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import importlib.util
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+import config
+
+
+@unittest.skipUnless(importlib.util.find_spec("jinja2"), "jinja2 is not installed")
+class HTMLExporterTests(unittest.TestCase):
+    def setUp(self):
+        from exporters import html_exporter
+
+        self.html_exporter = html_exporter
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name) / "output"
+        self.cache_dir = Path(self.temp_dir.name) / "jinja"
+        self.original_cache_dir = config.JINJA_CACHE_DIR
+        config.JINJA_CACHE_DIR = self.cache_dir
+        html_exporter._environment = None
+        self.playlist = {
+            "id": "PL1",
+            "title": "playlist",
+            "videos": [
+                {"video_id": "a", "title": "A", "url": "https://www.youtube.com/watch?v=a", "thumbnail": ""},
+            ],
+        }
+
+    def tearDown(self):
+        config.JINJA_CACHE_DIR = self.original_cache_dir
+        self.html_exporter._environment = None
+        self.temp_dir.cleanup()
+
+    def test_inline_styles_and_bytecode_cache(self):
+        path = self.html_exporter.HTMLExporter(self.output_dir).export(self.playlist)
+
+        html = path.read_text(encoding="utf-8")
+        self.assertIn("<style>", html)
+        self.assertIn(">A</a>", html)
+        self.assertFalse((self.output_dir / "playlist.css").exists())
+        self.assertTrue(any(self.cache_dir.iterdir()))
+
+    def test_external_stylesheet_is_written_once_per_output_root(self):
+        exporter = self.html_exporter.HTMLExporter(self.output_dir, external_css=True)
+        first = exporter.export(self.playlist)
+        second = exporter.export({**self.playlist, "title": "other"})
+
+        stylesheet = (self.output_dir / "playlist.css").read_text(encoding="utf-8")
+        self.assertEqual(stylesheet, exporter.HTML_STYLESHEET)
+        for path in (first, second):
+            html = path.read_text(encoding="utf-8")
+            self.assertNotIn("<style>", html)
+            self.assertIn('<link rel="stylesheet" href="../playlist.css">', html)
+
+    def make_videos(self, count):
+        return [
+            {"video_id": f"v{i}", "title": f"Video {i}", "url": f"https://www.youtube.com/watch?v=v{i}", "thumbnail": ""}
+            for i in range(1, count + 1)
+        ]
+
+    def test_paged_mode_splits_videos_and_links_pages(self):
+        exporter = self.html_exporter.HTMLExporter(self.output_dir, mode="paged", page_size=2)
+        first = exporter.export({**self.playlist, "videos": self.make_videos(5)})
+
+        pages = sorted(path.name for path in first.parent.glob("*.html"))
+        self.assertEqual(pages, ["playlist.html", "playlist_2.html", "playlist_3.html"])
+        html = first.read_text(encoding="utf-8")
+        self.assertIn(">Video 2</a>", html)
+        self.assertNotIn(">Video 3</a>", html)
+        self.assertIn('<a href="playlist_2.html">다음</a>', html)
+        last = (first.parent / "playlist_3.html").read_text(encoding="utf-8")
+        self.assertIn(">Video 5</a>", last)
+        self.assertIn('<a href="playlist_2.html">이전</a>', last)
+        self.assertIn('<span class="current">3</span>', last)
+        self.assertFalse(list(first.parent.glob("*.tmp")))
+
+    def test_paged_mode_removes_stale_pages(self):
+        exporter = self.html_exporter.HTMLExporter(self.output_dir, mode="paged", page_size=2)
+        exporter.export({**self.playlist, "videos": self.make_videos(5)})
+        first = exporter.export({**self.playlist, "videos": self.make_videos(3)})
+
+        pages = sorted(path.name for path in first.parent.glob("*.html"))
+        self.assertEqual(pages, ["playlist.html", "playlist_2.html"])
+
+    def test_virtual_mode_embeds_compact_data(self):
+        videos = self.make_videos(3)
+        videos[0]["title"] = "</script><b>"
+        exporter = self.html_exporter.HTMLExporter(self.output_dir, mode="virtual")
+        html = exporter.export({**self.playlist, "videos": videos}).read_text(encoding="utf-8")
+
+        self.assertIn('<div class="videos-grid virtual">', html)
+        self.assertIn('id="playlist-data">[["https://www.youtube.com/watch?v=v1","","<\\/script><b>","",""],', html)
+        self.assertNotIn('class="video-card"', html)
+        self.assertEqual(html.count("</script>"), 2)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.html_exporter.HTMLExporter(self.output_dir, mode="infinite")
+
+
+if __name__ == "__main__":
+    unittest.main()
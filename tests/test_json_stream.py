@@ -0,0 +1,69 @@
+import io
+import json
+import unittest
+
+from utils.json_stream import JSONArrayStream
+
+
+class JSONArrayStreamTests(unittest.TestCase):
+    def stream(self, payload, chunk_size=3, **kwargs):
+        text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False, indent=2)
+        return JSONArrayStream(io.StringIO(text), chunk_size=chunk_size, **kwargs)
+
+    def test_streams_items_and_collects_header(self):
+        payload = {
+            "playlist_id": "PL1",
+            "title": "재생목록",
+            "video_count": 1234567,
+            "videos": [{"video_id": "a", "position": 0}, {"video_id": "b", "position": 10.5e3}],
+            "after": [1, 2],
+        }
+        stream = self.stream(payload)
+
+        items = list(stream)
+
+        self.assertEqual(items, payload["videos"])
+        self.assertEqual(stream.array_key, "videos")
+        self.assertEqual(stream.header, {"playlist_id": "PL1", "title": "재생목록", "video_count": 1234567, "after": [1, 2]})
+
+    def test_numbers_split_across_chunks_are_not_truncated(self):
+        for chunk_size in range(1, 8):
+            stream = self.stream('{"items": [123456789, 42]}', chunk_size=chunk_size)
+            self.assertEqual(list(stream), [123456789, 42])
+
+    def test_every_chunk_size_matches_json_loads(self):
+        texts = [
+            '{"videos":[{"a":1},12.5]}',
+            '{"videos": [1e5, 1.5E+3, -2.25e-2, 0, -0.5, 7], "n": 3.75E10}',
+            '{"count": 12.5e1, "items": [true, false, null, 1, "1.5", 10.0]}',
+        ]
+        for text in texts:
+            expected = json.loads(text)
+            key = "videos" if "videos" in expected else "items"
+            for chunk_size in range(1, len(text) + 1):
+                with self.subTest(text=text, chunk_size=chunk_size):
+                    stream = self.stream(text, chunk_size=chunk_size)
+                    items = list(stream)
+                    self.assertEqual(items, expected[key])
+                    self.assertEqual({**stream.header, key: items}, expected)
+
+    def test_header_is_available_during_iteration(self):
+        stream = self.stream({"title": "t", "items": [1]})
+
+        for _ in stream:
+            self.assertEqual(stream.header, {"title": "t"})
+
+    def test_missing_or_non_array_member(self):
+        stream = self.stream({"videos": None, "title": "t"})
+
+        self.assertEqual(list(stream), [])
+        self.assertIsNone(stream.array_key)
+        self.assertEqual(stream.header, {"videos": None, "title": "t"})
+
+    def test_truncated_input_raises(self):
+        with self.assertRaises(ValueError):
+            list(self.stream('{"videos": [{"video_id": "a"}, {"video_'))
+
+
+if __name__ == "__main__":
+    unittest.main()
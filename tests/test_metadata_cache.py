@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from metadata_cache import DAY, VideoMetadataCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _metadata(title):
+    return {
+        "title": title,
+        "description": "",
+        "channel_title": "channel",
+        "thumbnail": "https://i.ytimg.com/vi/x/hqdefault.jpg",
+        "published_at": "2024-01-01T00:00:00Z",
+    }
+
+
+class VideoMetadataCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+
+    def test_round_trip_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.sqlite3"
+            cache = VideoMetadataCache(path, clock=self.clock)
+            cache.put("a", _metadata("A"))
+            cache.close()
+
+            reopened = VideoMetadataCache(path, clock=self.clock)
+            self.assertEqual(reopened.get("a"), _metadata("A"))
+            reopened.close()
+
+    def test_fields_expire_independently(self):
+        cache = VideoMetadataCache(None, clock=self.clock)
+        cache.put("a", _metadata("A"))
+
+        self.clock.now += 8 * DAY
+        # title/description are past their 7 day TTL, channel/thumbnail are not.
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", fields=("channel_title", "thumbnail"))["channel_title"], "channel")
+
+        self.clock.now += 30 * DAY
+        self.assertEqual(cache.get("a", fields=("published_at",))["published_at"], "2024-01-01T00:00:00Z")
+
+    def test_least_recently_used_videos_are_evicted(self):
+        cache = VideoMetadataCache(None, max_entries=2, clock=self.clock)
+        cache.put("a", _metadata("A"))
+        self.clock.now += 1
+        cache.put("b", _metadata("B"))
+        self.clock.now += 1
+        cache.get("a")
+        self.clock.now += 1
+        cache.put("c", _metadata("C"))
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(set(cache.get_many(["a", "b", "c"])), {"a", "c"})
+
+    def test_counts_hits_and_misses(self):
+        cache = VideoMetadataCache(None, clock=self.clock)
+        cache.put_many({"a": _metadata("A"), "b": _metadata("B")})
+
+        cache.get_many(["a", "b", "c", "a"])
+
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 1, "entries": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import pickle
+import unittest
+
+from models import PlaylistItem, items_from_dicts, json_default
+
+
+def api_dict(video_id="abc", thumbnail=None):
+    return {
+        "playlist_item_id": "pi-1",
+        "video_id": video_id,
+        "title": "Title",
+        "description": "",
+        "thumbnail": thumbnail if thumbnail is not None else f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "position": 3,
+        "added_at": "2024-01-01T00:00:00Z",
+        "channel_title": "Channel",
+    }
+
+
+class PlaylistItemTests(unittest.TestCase):
+    def test_takeout_item_matches_previous_dict_layout(self):
+        item = PlaylistItem("abc", "takeout", added_at="2024-01-01 00:00:00 UTC", position=0)
+
+        self.assertEqual(
+            list(item.items()),
+            [
+                ("video_id", "abc"),
+                ("url", "https://www.youtube.com/watch?v=abc"),
+                ("added_at", "2024-01-01 00:00:00 UTC"),
+                ("title", ""),
+                ("description", ""),
+                ("thumbnail", "https://i.ytimg.com/vi/abc/hqdefault.jpg"),
+                ("channel_title", ""),
+                ("position", 0),
+            ],
+        )
+
+    def test_from_dict_round_trips_api_items(self):
+        for data in (api_dict(), api_dict(thumbnail=""), api_dict(thumbnail="https://example.com/t.jpg")):
+            item = PlaylistItem.from_dict(data)
+            self.assertIsInstance(item, PlaylistItem)
+            self.assertEqual(item, data)
+            self.assertEqual(json.dumps(item, default=json_default), json.dumps(data))
+
+    def test_unknown_layouts_stay_dicts(self):
+        data = {"video_id": "abc", "title": "t"}
+        changed_url = {**api_dict(), "url": "https://example.com"}
+
+        self.assertIs(PlaylistItem.from_dict(data), data)
+        self.assertIs(items_from_dicts([changed_url])[0], changed_url)
+
+    def test_mapping_updates(self):
+        item = PlaylistItem("abc", "takeout")
+        item.update({"title": "New", "channel_title": "Channel", "published_at": "2020"})
+        item["playlist_item_id"] = "pi-1"
+
+        self.assertEqual(item.title, "New")
+        self.assertEqual(item["published_at"], "2020")
+        self.assertEqual(set(list(item)[-2:]), {"published_at", "playlist_item_id"})
+        self.assertEqual(item.get("missing", "default"), "default")
+        del item["published_at"]
+        self.assertNotIn("published_at", item)
+
+    def test_channel_titles_are_interned(self):
+        first = PlaylistItem("a", channel_title="".join(["Chan", "nel"]))
+        second = PlaylistItem("b", channel_title="".join(["Chan", "nel"]))
+
+        self.assertIs(first.channel_title, second.channel_title)
+
+    def test_pickle(self):
+        item = PlaylistItem.from_dict(api_dict())
+        item["extra"] = 1
+
+        restored = pickle.loads(pickle.dumps(item))
+
+        self.assertEqual(restored, item)
+        self.assertEqual(list(restored), list(item))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import json
+import random
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from exporters.json_exporter import JSONExporter
+from models import PlaylistItem
+from playlist_diff import (
+    apply_changeset,
+    diff_live,
+    diff_playlist,
+    diff_snapshots,
+    longest_increasing_subsequence,
+    write_changeset,
+)
+
+
+def _item(video_id, playlist_item_id=None, title=None):
+    return PlaylistItem(
+        video_id,
+        "api" if playlist_item_id else "takeout",
+        playlist_item_id=playlist_item_id,
+        title=title or f"영상 {video_id}",
+    )
+
+
+def _items(video_ids, with_ids=True):
+    return [_item(video_id, f"pi-{video_id}" if with_ids else None) for video_id in video_ids]
+
+
+class _FakeYouTubeAPI:
+    def __init__(self, videos):
+        self.videos = videos
+        self.requested = []
+
+    def get_playlist_videos(self, playlist_id):
+        self.requested.append(playlist_id)
+        yield from self.videos
+
+
+class PlaylistDiffTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.workdir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _export(self, output_dir, playlist_id, title, videos):
+        playlist = {"id": playlist_id, "title": title, "videos": videos}
+        return JSONExporter(output_dir).export(playlist)
+
+    def test_longest_increasing_subsequence(self):
+        values = [3, 0, 1, 7, 2, 4, 5]
+        result = longest_increasing_subsequence(values)
+
+        self.assertEqual([values[index] for index in result], [0, 1, 2, 4, 5])
+        self.assertEqual(longest_increasing_subsequence([]), [])
+
+    def test_insert_at_top_is_not_reported_as_moves(self):
+        changeset = diff_playlist(_items("ABCD"), _items("XABCD"))
+
+        self.assertEqual(changeset["summary"], {"added": 1, "removed": 0, "moved": 0, "changed": 0, "unchanged": 4})
+        self.assertEqual(changeset["added"][0]["to"], 0)
+        self.assertNotIn("moved", changeset)
+
+    def test_reports_removed_moved_and_changed_items(self):
+        target = _items("BCAE")
+        target[1] = _item("C", "pi-C", title="새 제목")
+        changeset = diff_playlist(_items("ABCDE"), target)
+
+        self.assertEqual(changeset["removed"], [{"from": 3, "video_id": "D", "playlist_item_id": "pi-D"}])
+        self.assertEqual(changeset["moved"], [{"from": 0, "to": 2, "video_id": "A", "playlist_item_id": "pi-A"}])
+        self.assertEqual([(entry["from"], entry["to"]) for entry in changeset["changed"]], [(2, 1)])
+        self.assertEqual(changeset["summary"]["unchanged"], 3)
+
+    def test_readded_video_with_new_playlist_item_id_is_removed_and_added(self):
+        changeset = diff_playlist(_items("AB"), [_item("A", "pi-A"), _item("B", "pi-B2")])
+
+        self.assertEqual(changeset["summary"]["removed"], 1)
+        self.assertEqual(changeset["summary"]["added"], 1)
+
+    def test_takeout_items_match_by_video_occurrence(self):
+        base = _items("ABAC", with_ids=False)
+        target = _items("AACB", with_ids=False)
+        changeset = diff_playlist(base, target)
+
+        self.assertEqual(changeset["summary"]["added"], 0)
+        self.assertEqual(changeset["summary"]["removed"], 0)
+        self.assertEqual(changeset["summary"]["moved"], 1)
+        self.assertEqual(
+            [item.video_id for item in apply_changeset(base, changeset)],
+            [item.video_id for item in target],
+        )
+
+    def test_apply_changeset_rebuilds_target(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            base = _items([f"v{index}" for index in range(rng.randint(0, 30))])
+            target = [item for item in base if rng.random() > 0.2]
+            if rng.random() < 0.3:
+                rng.shuffle(target)
+            for index in range(rng.randint(0, 3)):
+                target.insert(rng.randint(0, len(target)), _item(f"new{index}", f"pi-new{index}"))
+            if target and rng.random() < 0.5:
+                position = rng.randrange(len(target))
+                moved = target.pop(position)
+                target.insert(rng.randint(0, len(target)), moved)
+            if target:
+                position = rng.randrange(len(target))
+                target[position] = _item(target[position].video_id, target[position].playlist_item_id, "수정")
+
+            changeset = diff_playlist(base, target)
+            rebuilt = apply_changeset(base, changeset)
+
+            self.assertEqual([dict(item) for item in rebuilt], [dict(item) for item in target])
+
+    def test_diffs_export_directories_by_playlist_id(self):
+        base_dir = self.workdir / "base"
+        target_dir = self.workdir / "target"
+        self._export(base_dir, "PL1", "음악", _items("ABC"))
+        self._export(base_dir, "PL2", "요리", _items("D"))
+        self._export(base_dir, "PL3", "삭제될 목록", _items("E"))
+        # 제목이 바뀌어도 playlist_id로 짝을 맞춤
+        self._export(target_dir, "PL1", "음악 모음", _items("CAB"))
+        self._export(target_dir, "PL2", "요리", _items("D"))
+        self._export(target_dir, "PL4", "새 목록", _items("F"))
+
+        changeset = diff_snapshots(base_dir, target_dir)
+
+        self.assertEqual(
+            changeset["summary"]["playlists"], {"added": 1, "removed": 1, "modified": 1, "unchanged": 1}
+        )
+        self.assertEqual(changeset["summary"]["items"], {"added": 1, "removed": 0, "moved": 1, "changed": 0})
+        by_id = {playlist["playlist_id"]: playlist for playlist in changeset["playlists"]}
+        self.assertEqual(by_id["PL1"]["title"], "음악 모음")
+        self.assertEqual(by_id["PL1"]["moved"][0]["video_id"], "C")
+        self.assertEqual(by_id["PL3"]["status"], "removed")
+        self.assertEqual(by_id["PL4"]["added"][0]["item"]["video_id"], "F")
+
+    def test_written_changeset_is_compact_json(self):
+        base = self._export(self.workdir / "base", "PL1", "음악", _items("AB"))
+        target = self._export(self.workdir / "target", "PL1", "음악", _items("BCA"))
+        output_path = self.workdir / "out" / "changeset.json"
+
+        write_changeset(diff_snapshots(base, target), output_path)
+
+        text = output_path.read_text(encoding="utf-8")
+        self.assertEqual(text.count("\n"), 1)
+        data = json.loads(text)
+        self.assertEqual(data["format"], 1)
+        playlist = data["playlists"][0]
+        self.assertEqual(playlist["added"][0]["item"]["url"], "https://www.youtube.com/watch?v=C")
+        self.assertEqual([item["video_id"] for item in apply_changeset(_items("AB"), playlist)], ["B", "C", "A"])
+
+    def test_live_mode_diffs_against_api_items(self):
+        base = self._export(self.workdir, "PL1", "음악", _items("ABC"))
+        youtube_api = _FakeYouTubeAPI(_items("AC"))
+
+        changeset = diff_live(base, youtube_api)
+
+        self.assertEqual(youtube_api.requested, ["PL1"])
+        self.assertEqual(changeset["target"], "live:PL1")
+        self.assertEqual(changeset["playlists"][0]["removed"][0]["video_id"], "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
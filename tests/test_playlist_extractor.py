@@ -0,0 +1,111 @@
+import json
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from exporters.json_exporter import JSONExporter
+from playlist_extractor import PlaylistExtractor
+
+
+class _FakeYouTubeAPI:
+    def __init__(self, videos_by_playlist, failures=None, clones=None):
+        self.videos_by_playlist = videos_by_playlist
+        self.failures = set(failures or [])
+        self.clones = clones if clones is not None else []
+
+    def get_all_playlists(self):
+        return [{"id": playlist_id, "title": playlist_id} for playlist_id in self.videos_by_playlist]
+
+    def clone_for_worker(self):
+        clone = _FakeYouTubeAPI(self.videos_by_playlist, self.failures, self.clones)
+        self.clones.append((threading.get_ident(), clone))
+        return clone
+
+    def get_playlist_videos(self, playlist_id):
+        if playlist_id in self.failures:
+            raise RuntimeError("simulated failure")
+        # 앞쪽 재생목록이 더 늦게 끝나도록 하여 순서 보장을 확인
+        time.sleep(0.01 * (len(self.videos_by_playlist) - int(playlist_id[2:])))
+        for video_id in self.videos_by_playlist[playlist_id]:
+            yield {"video_id": video_id}
+
+
+class PlaylistExtractorTests(unittest.TestCase):
+    def setUp(self):
+        self.videos_by_playlist = {
+            f"PL{index}": [f"v{index}-{n}" for n in range(index + 1)]
+            for index in range(6)
+        }
+
+    def test_concurrent_results_keep_input_order(self):
+        api = _FakeYouTubeAPI(self.videos_by_playlist)
+        playlists = api.get_all_playlists()
+
+        results = list(PlaylistExtractor(api, concurrency=3).iter_playlist_results(playlists))
+
+        self.assertEqual([playlist["id"] for playlist, _, _ in results], list(self.videos_by_playlist))
+        for playlist, videos, error in results:
+            self.assertIsNone(error)
+            self.assertEqual([v["video_id"] for v in videos], self.videos_by_playlist[playlist["id"]])
+
+    def test_concurrent_workers_use_separate_clients(self):
+        api = _FakeYouTubeAPI(self.videos_by_playlist)
+
+        list(PlaylistExtractor(api, concurrency=3).iter_playlist_results(api.get_all_playlists()))
+
+        thread_ids = [thread_id for thread_id, _ in api.clones]
+        self.assertLessEqual(len(api.clones), 3)
+        self.assertEqual(len(thread_ids), len(set(thread_ids)))
+
+    def test_concurrent_failure_is_reported_per_playlist(self):
+        api = _FakeYouTubeAPI(self.videos_by_playlist, failures={"PL2"})
+
+        results = list(PlaylistExtractor(api, concurrency=2).iter_playlist_results(api.get_all_playlists()))
+
+        errors = {playlist["id"]: error for playlist, _, error in results}
+        self.assertIsInstance(errors["PL2"], RuntimeError)
+        self.assertIsNone(errors["PL3"])
+
+    def test_streamed_exports_match_materialized_json(self):
+        api = _FakeYouTubeAPI(self.videos_by_playlist, failures={"PL4"})
+        playlists = [{**playlist, "video_count": 0} for playlist in api.get_all_playlists()]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = JSONExporter(Path(tmp))
+            results = list(PlaylistExtractor(api, concurrency=2).iter_streamed_exports(playlists, exporter))
+
+            self.assertEqual([playlist["id"] for playlist, _, _, _ in results], list(self.videos_by_playlist))
+            for playlist, filepath, video_count, error in results:
+                if playlist["id"] == "PL4":
+                    self.assertIsInstance(error, RuntimeError)
+                    self.assertFalse(exporter.get_output_path("PL4").exists())
+                    continue
+                videos = [{"video_id": video_id} for video_id in self.videos_by_playlist[playlist["id"]]]
+                expected = json.dumps(
+                    {
+                        "playlist_id": playlist["id"],
+                        "title": playlist["title"],
+                        "description": "",
+                        "video_count": 0,
+                        "published_at": "",
+                        "videos": videos,
+                    },
+                    ensure_ascii=False,
+                    indent=2,
+                )
+                self.assertEqual(video_count, len(videos))
+                self.assertEqual(filepath.read_text(encoding="utf-8"), expected)
+            self.assertEqual(list(Path(tmp).rglob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
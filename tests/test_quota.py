@@ -0,0 +1,92 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from quota import QuotaBudgetExceeded, QuotaLedger, QuotaScheduler, normalize_method
+
+
+class QuotaLedgerTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ledger_path = Path(self.temp_dir.name) / "quota_ledger.json"
+        self.day = "2026-04-24"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _ledger(self, budget=10000):
+        return QuotaLedger(self.ledger_path, budget, day_func=lambda: self.day)
+
+    def test_records_units_per_method_and_persists(self):
+        ledger = self._ledger()
+        ledger.record("playlistItems.list", count=3)
+        ledger.record("playlistItems.delete")
+        ledger.flush()
+
+        data = json.loads(self.ledger_path.read_text(encoding="utf-8"))
+        day = data["days"][self.day]
+        self.assertEqual(day["total_units"], 53)
+        self.assertEqual(day["calls"]["playlistItems.delete"], {"count": 1, "units": 50})
+        self.assertEqual(self._ledger().used_today(), 53)
+
+    def test_flush_merges_with_other_processes(self):
+        first = self._ledger()
+        second = self._ledger()
+        first.record("videos.list")
+        second.record("channels.list")
+        first.flush()
+        second.flush()
+
+        self.assertEqual(self._ledger().used_today(), 2)
+
+    def test_new_day_starts_from_zero(self):
+        ledger = self._ledger()
+        ledger.record("playlistItems.delete")
+        self.day = "2026-04-25"
+
+        self.assertEqual(ledger.used_today(), 0)
+        self.assertEqual(ledger.remaining(), 10000)
+
+    def test_check_raises_when_budget_would_be_exceeded(self):
+        ledger = self._ledger(budget=60)
+        ledger.record("playlistItems.delete")
+
+        ledger.check("playlistItems.list")
+        with self.assertRaises(QuotaBudgetExceeded):
+            ledger.check("playlistItems.delete")
+
+    def test_normalize_method_strips_service_prefix(self):
+        self.assertEqual(normalize_method("youtube.playlistItems.list"), "playlistItems.list")
+        self.assertEqual(normalize_method(None), "unknown")
+
+
+class QuotaSchedulerTests(unittest.TestCase):
+    def test_plan_fits_extraction_before_deletes(self):
+        ledger = QuotaLedger(None, 300, day_func=lambda: "2026-04-24")
+        playlists = [{"id": "A", "video_count": 120}, {"id": "B", "video_count": 0}]
+
+        plan = QuotaScheduler(ledger).plan(playlists, delete_count=10)
+
+        self.assertEqual(plan.extraction_units, 4)
+        self.assertEqual([p["id"] for p in plan.scheduled_playlists], ["A", "B"])
+        self.assertEqual(plan.allowed_deletes, 5)
+        self.assertFalse(plan.fits)
+
+    def test_plan_defers_playlists_that_do_not_fit(self):
+        ledger = QuotaLedger(None, 5, day_func=lambda: "2026-04-24")
+        playlists = [
+            {"id": "A", "video_count": 100},
+            {"id": "B", "video_count": 200},
+            {"id": "C", "video_count": 1},
+        ]
+
+        plan = QuotaScheduler(ledger).plan(playlists)
+
+        self.assertEqual([p["id"] for p in plan.scheduled_playlists], ["A"])
+        self.assertEqual([p["id"] for p in plan.deferred_playlists], ["B", "C"])
+        self.assertEqual(plan.required_units, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
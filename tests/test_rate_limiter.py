@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import unittest
+
+from rate_limiter import AdaptiveRate, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_is_available_immediately(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+        self.assertEqual(clock.sleeps, [])
+
+    def test_waits_follow_rate_after_burst(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=2, burst=1, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_reservations_queue_callers_fairly(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=10, burst=1, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        self.assertEqual(waits[0], 0.0)
+        for expected, actual in zip([0.1, 0.2, 0.3], waits[1:]):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket(rate=0)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertTrue(bucket.try_acquire())
+
+    def test_try_acquire_does_not_go_negative(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+        clock.now += 1
+        self.assertTrue(bucket.try_acquire())
+
+    def test_shared_between_threads_and_tasks(self):
+        bucket = TokenBucket(rate=1000, burst=5)
+        waits = []
+
+        def worker():
+            waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        async def run_tasks():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+        asyncio.run(run_tasks())
+        self.assertEqual(len(waits), 5)
+        self.assertLess(bucket.reserve(), 1.0)
+
+
+class AdaptiveRateTests(unittest.TestCase):
+    def test_throttle_halves_rate_once_per_cooldown(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=8, clock=clock)
+        adaptive = AdaptiveRate(bucket, clock=clock)
+
+        adaptive.on_throttle()
+        adaptive.on_throttle()
+        self.assertEqual(bucket.rate, 4)
+        clock.now += 1
+        adaptive.on_throttle()
+
+        self.assertEqual(bucket.rate, 2)
+        self.assertEqual(bucket.burst, 2)
+        self.assertEqual(adaptive.throttle_count, 3)
+
+    def test_rate_never_drops_below_minimum(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1, clock=clock)
+        adaptive = AdaptiveRate(bucket, min_rate=0.5, clock=clock)
+
+        for _ in range(5):
+            adaptive.on_throttle()
+            clock.now += 1
+
+        self.assertEqual(bucket.rate, 0.5)
+
+    def test_successes_recover_up_to_configured_rate(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=10, burst=4, clock=clock)
+        adaptive = AdaptiveRate(bucket, clock=clock)
+        adaptive.on_throttle()
+
+        for _ in range(200):
+            adaptive.on_success()
+
+        self.assertEqual(bucket.rate, 10)
+        self.assertEqual(bucket.burst, 4)
+
+    def test_unlimited_bucket_is_left_alone(self):
+        bucket = TokenBucket(rate=0)
+        adaptive = AdaptiveRate(bucket)
+
+        adaptive.on_throttle()
+        adaptive.on_success()
+
+        self.assertEqual(bucket.rate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import errno
+import json
+import socket
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from quota import QuotaBudgetExceeded
+from retry_policy import (
+    FATAL,
+    NETWORK,
+    PERMANENT,
+    THROTTLED,
+    TRANSIENT,
+    CircuitBreaker,
+    ErrorClass,
+    RetryPolicy,
+    classify_error,
+    parse_retry_after,
+)
+
+
+class _ApiError(Exception):
+    def __init__(self, status, reason="", headers=None):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status, get=(headers or {}).get)
+        self.content = json.dumps({"error": {"errors": [{"reason": reason}]}}).encode("utf-8")
+
+
+class _Sleeps(list):
+    def __call__(self, seconds):
+        self.append(seconds)
+
+
+class ClassifyErrorTests(unittest.TestCase):
+    def test_http_errors_are_classified_by_status_and_reason(self):
+        cases = [
+            (_ApiError(429), THROTTLED),
+            (_ApiError(403, "rateLimitExceeded"), THROTTLED),
+            (_ApiError(403, "userRateLimitExceeded"), THROTTLED),
+            (_ApiError(403, "quotaExceeded"), FATAL),
+            (_ApiError(500, "backendError"), TRANSIENT),
+            (_ApiError(503), TRANSIENT),
+            (_ApiError(403, "forbidden"), PERMANENT),
+            (_ApiError(404, "playlistItemNotFound"), PERMANENT),
+            (_ApiError(304), PERMANENT),
+        ]
+        for error, kind in cases:
+            with self.subTest(status=error.resp.status, content=error.content):
+                self.assertEqual(classify_error(error).kind, kind)
+
+    def test_only_network_os_errors_are_retryable(self):
+        self.assertEqual(classify_error(ConnectionResetError()).kind, NETWORK)
+        self.assertEqual(classify_error(socket.timeout()).kind, NETWORK)
+        self.assertEqual(classify_error(OSError(errno.ENETUNREACH, "unreachable")).kind, NETWORK)
+        self.assertEqual(classify_error(FileNotFoundError("token.json")).kind, PERMANENT)
+        self.assertEqual(classify_error(ValueError("connection in message")).kind, PERMANENT)
+
+    def test_local_quota_budget_is_fatal(self):
+        self.assertEqual(classify_error(QuotaBudgetExceeded("budget")).kind, FATAL)
+
+    def test_retry_after_header(self):
+        error = _ApiError(429, headers={"retry-after": "7"})
+
+        self.assertEqual(classify_error(error).retry_after, 7.0)
+        self.assertEqual(parse_retry_after("Thu, 01 Jan 1970 00:01:40 GMT", now=40), 60.0)
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def _policy(self, **options):
+        sleeps = _Sleeps()
+        return RetryPolicy(sleep=sleeps, **options), sleeps
+
+    def _failing(self, errors, result="ok"):
+        calls = []
+
+        def call():
+            calls.append(1)
+            if errors:
+                raise errors.pop(0)
+            return result
+
+        return call, calls
+
+    def test_retries_throttling_then_succeeds(self):
+        policy, sleeps = self._policy()
+        call, calls = self._failing([_ApiError(429, headers={"retry-after": "2"}), _ApiError(500, "backendError")])
+
+        self.assertEqual(policy.execute(call), "ok")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sleeps[0], 2.0)
+
+    def test_fatal_and_permanent_errors_are_not_retried(self):
+        for error in (_ApiError(403, "quotaExceeded"), _ApiError(404), KeyError("x")):
+            policy, sleeps = self._policy()
+            call, calls = self._failing([error])
+            with self.subTest(error=error):
+                with self.assertRaises(type(error)):
+                    policy.execute(call)
+                self.assertEqual((len(calls), sleeps), (1, []))
+
+    def test_gives_up_after_max_attempts(self):
+        policy, sleeps = self._policy(max_attempts=3)
+        call, calls = self._failing([_ApiError(503)] * 5)
+
+        with self.assertRaises(_ApiError):
+            policy.execute(call)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(sleeps), 2)
+
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        policy, _ = self._policy(base_delay=1.0, max_delay=10.0)
+        error_class = ErrorClass(TRANSIENT, 503)
+        delay = None
+        for _ in range(50):
+            previous = delay or 1.0
+            delay = policy.next_delay(error_class, delay)
+            self.assertGreaterEqual(delay, 1.0)
+            self.assertLessEqual(delay, min(10.0, previous * 3))
+
+    def test_retry_after_is_capped_at_max_delay(self):
+        policy, _ = self._policy(max_delay=30.0)
+
+        self.assertEqual(policy.next_delay(ErrorClass(THROTTLED, 429, retry_after=7.0)), 7.0)
+        self.assertEqual(policy.next_delay(ErrorClass(THROTTLED, 429, retry_after=3600.0)), 30.0)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_threshold_and_closes_after_probe(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+        waited = breaker.wait()
+        self.assertGreaterEqual(waited, 0.04)
+        self.assertEqual(breaker.state, "half-open")
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.open_count, 1)
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        breaker.record_failure()
+        breaker.wait()  # this caller is the probe
+        released = []
+
+        def waiter():
+            breaker.wait()
+            released.append(time.monotonic())
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.01)
+        self.assertEqual(released, [])
+        breaker.record_success()
+        thread.join(1)
+
+        self.assertEqual(len(released), 1)
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.01)
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.wait()
+
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(breaker.open_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from search_index import SearchIndexBuilder, build_search_index, term_shard, tokenize
+
+
+def load_script(path: Path):
+    text = path.read_text(encoding="utf-8")
+    arguments = text[text.index("(") + 1:text.rindex(")")]
+    return json.loads(f"[{arguments}]")
+
+
+def write_export(output_dir: Path, title: str, videos, extensions=(".json",)):
+    playlist_dir = output_dir / title
+    playlist_dir.mkdir(parents=True)
+    for extension in extensions:
+        path = playlist_dir / f"{title}{extension}"
+        path.write_text(json.dumps({"title": title, "videos": videos}), encoding="utf-8")
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def lookup(self, term):
+        (manifest,) = load_script(self.output_dir / "_search" / "manifest.js")
+        _, terms = load_script(self.output_dir / "_search" / f"t{term_shard(term, manifest['term_shards'])}.js")
+        numbers, number = [], 0
+        for delta in terms.get(term, []):
+            number += delta
+            numbers.append(number)
+        return manifest, numbers
+
+    def test_tokenize_normalizes_case_and_width(self):
+        self.assertEqual(tokenize("Never ＧＯＮＮＡ - 밤편지 (Live) a-b_c"), ["never", "gonna", "밤편지", "live", "a", "b_c"])
+
+    def test_videos_are_indexed_once_across_playlists(self):
+        shared = {"video_id": "dQw4w9WgXcQ", "title": "Never Gonna Give You Up", "channel_title": "Rick Astley"}
+        write_export(self.output_dir, "Later", [shared], extensions=(".json", ".html"))
+        write_export(self.output_dir, "Music", [{"video_id": "v2", "title": "밤편지", "channel_title": "IU"}, shared])
+
+        stats = build_search_index(self.output_dir, term_shards=4)
+
+        self.assertEqual(stats["playlists"], 2)
+        self.assertEqual(stats["videos"], 2)
+        self.assertTrue((self.output_dir / "search.html").exists())
+        manifest, numbers = self.lookup("astley")
+        self.assertEqual(manifest["playlists"], [["Later", "Later/Later.html"], ["Music", "Music/Music.json"]])
+        self.assertEqual(numbers, [0])
+        _, documents = load_script(self.output_dir / "_search" / "d0.js")
+        self.assertEqual(documents[0], ["dQw4w9WgXcQ", "Never Gonna Give You Up", "Rick Astley", [0, 1]])
+        self.assertEqual(self.lookup("dqw4w9wgxcq")[1], [0])
+        self.assertEqual(self.lookup("밤편지")[1], [1])
+
+    def test_postings_are_delta_encoded_and_documents_sharded(self):
+        builder = SearchIndexBuilder(term_shards=1, doc_shard_size=2)
+        builder.add_playlist("P", None, [{"video_id": f"v{i}", "title": "same"} for i in range(5)])
+        builder.write(self.output_dir)
+
+        _, terms = load_script(self.output_dir / "_search" / "t0.js")
+        self.assertEqual(terms["same"], [0, 1, 1, 1, 1])
+        self.assertEqual(sorted(path.name for path in (self.output_dir / "_search").glob("d*.js")), ["d0.js", "d1.js", "d2.js"])
+
+    def test_stale_shards_are_removed(self):
+        SearchIndexBuilder(term_shards=8).write(self.output_dir)
+        SearchIndexBuilder(term_shards=2).write(self.output_dir)
+
+        names = sorted(path.name for path in (self.output_dir / "_search").iterdir())
+        self.assertEqual(names, ["manifest.js", "t0.js", "t1.js"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+from playlist_extractor import PlaylistExtractor
+from snapshot_store import PlaylistSnapshotStore
+
+
+class _FakePagingAPI:
+    def __init__(self, pages):
+        self.pages = pages
+        self.cached_pages_seen = []
+
+    def iter_playlist_pages(self, playlist_id, cached_pages=None, start_page_token=None):
+        self.cached_pages_seen.append(cached_pages)
+        for page in self.pages:
+            if cached_pages is not None and cached_pages.etag(page["page_token"]) == page["etag"]:
+                yield {**cached_pages.load(page["page_token"]), "not_modified": True}
+            else:
+                yield {**page, "not_modified": False}
+
+
+class PlaylistSnapshotStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = PlaylistSnapshotStore(Path(self.temp_dir.name))
+        self.playlist = {"id": "PL/1", "title": "A", "video_count": 2, "etag": "etag-1"}
+        self.pages = [
+            {"page_token": None, "etag": "p0", "next_page_token": "T1", "videos": [{"video_id": "a"}]},
+            {"page_token": "T1", "etag": "p1", "next_page_token": None, "videos": [{"video_id": "b"}]},
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_unchanged_requires_same_etag_and_item_count(self):
+        self.assertFalse(self.store.is_unchanged(self.playlist))
+        self.store.save(self.playlist, self.pages)
+
+        self.assertTrue(self.store.is_unchanged(self.playlist))
+        self.assertFalse(self.store.is_unchanged({**self.playlist, "etag": "etag-2"}))
+        self.assertFalse(self.store.is_unchanged({**self.playlist, "video_count": 3}))
+
+    def test_cached_pages_are_keyed_by_page_token(self):
+        self.store.save(self.playlist, self.pages)
+
+        cached = self.store.cached_pages("PL/1")
+
+        self.assertEqual(set(cached), {None, "T1"})
+        self.assertEqual(cached.etag("T1"), "p1")
+        self.assertIsNone(cached.etag("T2"))
+        self.assertEqual(cached.load("T1")["videos"], [{"video_id": "b"}])
+
+    def test_snapshot_is_one_line_per_page(self):
+        path = self.store.save(self.playlist, self.pages)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(len(lines), 1 + len(self.pages))
+        self.assertEqual(self.store.load("PL/1"), {"playlist_id": "PL/1", "etag": "etag-1", "item_count": 2})
+        self.assertEqual(len(self.store.cached_pages("missing")), 0)
+
+    def test_extractor_reuses_pages_and_commits_after_export(self):
+        self.store.save(self.playlist, self.pages)
+        changed_pages = [self.pages[0], {**self.pages[1], "etag": "p1-new", "videos": [{"video_id": "c"}]}]
+        api = _FakePagingAPI(changed_pages)
+        extractor = PlaylistExtractor(api, concurrency=1, snapshot_store=self.store)
+        changed_playlist = {**self.playlist, "etag": "etag-2"}
+
+        videos = extractor._extract_playlist_videos(changed_playlist)
+
+        self.assertEqual([v["video_id"] for v in videos], ["a", "c"])
+        self.assertEqual(set(api.cached_pages_seen[0]), {None, "T1"})
+        self.assertFalse(self.store.is_unchanged(changed_playlist))
+        extractor.commit_playlist(changed_playlist)
+        self.assertTrue(self.store.is_unchanged(changed_playlist))
+        self.assertEqual(extractor.unchanged_playlists([changed_playlist, self.playlist]), [changed_playlist])
+
+
+if __name__ == "__main__":
+    unittest.main()
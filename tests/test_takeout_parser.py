@@ -0,0 +1,227 @@
+import contextlib
+import io
+import os
+import tarfile
+import tempfile
+import unicodedata
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from metadata_cache import VideoMetadataCache
+from takeout_parser import TakeoutParser
+
+
+class _FakeYouTubeAPI:
+    VIDEOS_PER_REQUEST = 50
+    VIDEOS_LIST_PER_BATCH = 10
+
+    def __init__(self, calls=None, metadata_cache=None):
+        self.calls = calls if calls is not None else []
+        self.metadata_cache = metadata_cache
+
+    def get_service(self, require_oauth=True):
+        return None
+
+    def clone_for_worker(self):
+        return _FakeYouTubeAPI(self.calls, self.metadata_cache)
+
+    def get_videos_metadata(self, video_ids, use_batch=False, use_cache=True):
+        requests = [
+            video_ids[i:i + self.VIDEOS_PER_REQUEST]
+            for i in range(0, len(video_ids), self.VIDEOS_PER_REQUEST)
+        ]
+        self.calls.extend(requests)
+        return {
+            video_id: {
+                "title": f"title {video_id}",
+                "description": "",
+                "channel_title": "channel",
+                "thumbnail": "",
+                "published_at": "",
+            }
+            for video_id in video_ids
+            if video_id != "gone"
+        }
+
+
+def _video(video_id):
+    return {"video_id": video_id, "title": "", "description": "", "thumbnail": "thumb", "channel_title": ""}
+
+
+class TakeoutEnrichmentTests(unittest.TestCase):
+    def setUp(self):
+        shared = [f"v{i}" for i in range(80)]
+        self.playlists = [
+            {"videos": [_video(video_id) for video_id in shared]},
+            {"videos": [_video(video_id) for video_id in shared[:40]] + [_video("gone")]},
+            {"videos": [_video(video_id) for video_id in reversed(shared)]},
+        ]
+
+    def test_enrichment_requests_each_unique_video_once(self):
+        api = _FakeYouTubeAPI()
+
+        stats = TakeoutParser(Path(".")).enrich_playlists(self.playlists, api)
+
+        self.assertEqual(stats["total_rows"], 201)
+        self.assertEqual(stats["unique_videos"], 81)
+        self.assertEqual(len(api.calls), 2)
+        requested = [video_id for call in api.calls for video_id in call]
+        self.assertEqual(len(requested), len(set(requested)))
+
+    def test_enrichment_fans_results_into_every_playlist(self):
+        stats = TakeoutParser(Path(".")).enrich_playlists(self.playlists, _FakeYouTubeAPI(), concurrency=3)
+
+        self.assertEqual(stats["enriched_rows"], 200)
+        for playlist in self.playlists:
+            for video in playlist["videos"]:
+                if video["video_id"] == "gone":
+                    self.assertEqual(video["title"], "")
+                else:
+                    self.assertEqual(video["title"], f"title {video['video_id']}")
+                    self.assertEqual(video["thumbnail"], "thumb")
+
+    def test_repeat_enrichment_is_served_from_metadata_cache(self):
+        cache = VideoMetadataCache(None)
+        TakeoutParser(Path(".")).enrich_playlists(self.playlists, _FakeYouTubeAPI(metadata_cache=cache))
+
+        api = _FakeYouTubeAPI(metadata_cache=cache)
+        stats = TakeoutParser(Path(".")).enrich_playlists(self.playlists, api)
+
+        self.assertEqual(stats["resolved_videos"], 80)
+        # Only the unavailable video is requested again.
+        self.assertEqual(api.calls, [["gone"]])
+        self.assertEqual(cache.hits, 80)
+
+
+
+PLAYLISTS_HEADER = "재생목록 ID,재생목록 제목(원본),재생목록 공개 상태\n"
+VIDEOS_HEADER = "동영상 ID,재생목록 동영상 생성 타임스탬프\n"
+
+
+class TakeoutCsvIndexTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.takeout_dir = Path(self._tmp.name)
+        titles = ["AC/DC", "Music", "Watch later", "Missing", "Empty"]
+        (self.takeout_dir / "재생목록.csv").write_text(
+            PLAYLISTS_HEADER + "".join(f"PL{i},{title},Private\n" for i, title in enumerate(titles)),
+            encoding="utf-8"
+        )
+        self._write_videos("AC_DC", ["a1", "a2"])
+        self._write_videos("music", ["m1", " m2 ", ""])
+        self._write_videos("WatchLater", ["w1"])
+        self._write_videos("Empty", [])
+
+    def _write_videos(self, stem, video_ids):
+        rows = "".join(f"{video_id},2024-01-0{i + 1}T00:00:00+00:00\n" for i, video_id in enumerate(video_ids))
+        (self.takeout_dir / f"{stem}-동영상.csv").write_text(VIDEOS_HEADER + rows, encoding="utf-8")
+
+    def _parse_all(self, parser, workers):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            playlists = parser.get_all_playlists_with_videos(workers=workers)
+        return playlists, output.getvalue()
+
+    def test_index_matches_slash_case_and_watch_later_variants(self):
+        parser = TakeoutParser(self.takeout_dir)
+
+        self.assertEqual(parser.find_videos_csv("AC/DC").name, "AC_DC-동영상.csv")
+        self.assertEqual(parser.find_videos_csv("MUSIC").name, "music-동영상.csv")
+        self.assertEqual(parser.find_videos_csv("나중에 볼 동영상").name, "WatchLater-동영상.csv")
+        self.assertIsNone(parser.find_videos_csv("Missing"))
+
+    def test_directory_is_scanned_once(self):
+        parser = TakeoutParser(self.takeout_dir)
+        with mock.patch("takeout_parser.os.scandir", wraps=os.scandir) as scandir:
+            self._parse_all(parser, workers=1)
+            parser.find_videos_csv("Music")
+
+        self.assertEqual(scandir.call_count, 1)
+
+    def test_sequential_parse_keeps_order_and_rows(self):
+        playlists, output = self._parse_all(TakeoutParser(self.takeout_dir), workers=1)
+
+        self.assertEqual([p["title"] for p in playlists], ["AC/DC", "Music", "Watch later", "Missing", "Empty"])
+        self.assertEqual([p["video_count"] for p in playlists], [2, 2, 1, 0, 0])
+        music = playlists[1]["videos"]
+        self.assertEqual([video["video_id"] for video in music], ["m1", "m2"])
+        self.assertEqual([video["position"] for video in music], [0, 1])
+        self.assertEqual(music[1]["added_at"], "2024-01-02T00:00:00+00:00")
+        self.assertIn("영상 CSV 파일을 찾을 수 없습니다: Missing-동영상.csv", output)
+
+    def test_process_pool_matches_sequential_parse(self):
+        sequential, sequential_output = self._parse_all(TakeoutParser(self.takeout_dir), workers=1)
+        parallel, parallel_output = self._parse_all(TakeoutParser(self.takeout_dir), workers=2)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(parallel_output, sequential_output)
+
+
+
+class TakeoutArchiveTests(TakeoutCsvIndexTests):
+    NESTED_DIR = "Takeout 2/YouTube 및 YouTube Music/재생목록"
+
+    def _csv_files(self):
+        return sorted(path for path in self.takeout_dir.iterdir() if path.suffix == ".csv")
+
+    def _zip(self, name, prefix=NESTED_DIR, normalization="NFC"):
+        archive = Path(self._tmp.name) / name
+        with zipfile.ZipFile(archive, "w") as zf:
+            for path in self._csv_files():
+                zf.write(path, unicodedata.normalize(normalization, f"{prefix}/{path.name}"))
+        return archive
+
+    def _tar(self, name, prefixes=(NESTED_DIR,)):
+        archive = Path(self._tmp.name) / name
+        with tarfile.open(archive, "w:gz") as tar:
+            for prefix in prefixes:
+                for path in self._csv_files():
+                    tar.add(path, f"{prefix}/{path.name}")
+        return archive
+
+    def _assert_same_as_directory(self, takeout_path, **parser_options):
+        expected, _ = self._parse_all(TakeoutParser(self.takeout_dir), workers=1)
+        with TakeoutParser(takeout_path, **parser_options) as parser:
+            playlists, output = self._parse_all(parser, workers=4)
+
+        self.assertEqual(playlists, expected)
+        self.assertIn("영상 CSV 파일을 찾을 수 없습니다: Missing-동영상.csv", output)
+        return parser
+
+    def test_zip_archive_is_read_without_extracting(self):
+        parser = self._assert_same_as_directory(self._zip("takeout.zip"))
+
+        self.assertEqual(str(parser.archive.playlist_dir), self.NESTED_DIR)
+
+    def test_zip_with_decomposed_hangul_names(self):
+        self._assert_same_as_directory(self._zip("takeout-nfd.zip", normalization="NFD"))
+
+    def test_tgz_archive_is_streamed(self):
+        self._assert_same_as_directory(self._tar("takeout.tgz"))
+
+    def test_playlist_dir_selects_folder_in_merged_archive(self):
+        archive = self._tar("merged.tgz", prefixes=("old/재생목록", self.NESTED_DIR))
+
+        with TakeoutParser(archive, playlist_dir="YouTube 및 YouTube Music/재생목록") as parser:
+            self.assertEqual(str(parser.archive.playlist_dir), self.NESTED_DIR)
+        with TakeoutParser(archive) as parser:
+            self.assertEqual(str(parser.archive.playlist_dir), "old/재생목록")
+        with self.assertRaises(FileNotFoundError):
+            TakeoutParser(archive, playlist_dir="Takeout 3/재생목록")
+
+    def test_extracted_takeout_root_locates_playlist_folder(self):
+        root = Path(self._tmp.name) / "extracted"
+        nested = root / self.NESTED_DIR
+        nested.mkdir(parents=True)
+        for path in self._csv_files():
+            (nested / path.name).write_bytes(path.read_bytes())
+
+        parser = self._assert_same_as_directory(root)
+
+        self.assertEqual(parser.videos_dir, nested)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+if "dotenv" not in sys.modules:
+    dotenv_stub = types.ModuleType("dotenv")
+    dotenv_stub.load_dotenv = lambda *args, **kwargs: None
+    sys.modules["dotenv"] = dotenv_stub
+
+HAS_GOOGLE_CLIENT = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("googleapiclient", "google_auth_oauthlib", "httplib2")
+)
+
+if HAS_GOOGLE_CLIENT:
+    import config
+    import youtube_api
+    from metadata_cache import VideoMetadataCache
+    from retry_policy import RetryPolicy
+    from takeout_parser import TakeoutParser
+
+
+def _make_api():
+    return youtube_api.YouTubeAPI(
+        rate_limiter=object(),
+        quota_ledger=object(),
+        metadata_cache=VideoMetadataCache(None),
+        retry_policy=RetryPolicy(),
+    )
+
+
+@unittest.skipUnless(HAS_GOOGLE_CLIENT, "google-api-python-client가 설치되어 있지 않습니다.")
+class YouTubeAPIAuthenticationTests(unittest.TestCase):
+    def _count_authentications(self, api):
+        calls = []
+        lock = threading.Lock()
+
+        def authenticate():
+            with lock:
+                calls.append(threading.current_thread().name)
+            # 인증이 오래 걸리는 동안 다른 워커가 들어오도록 잠시 대기
+            time.sleep(0.05)
+            api.credentials = object()
+            api.service = object()
+            return True
+
+        api.authenticate = authenticate
+        return calls
+
+    def test_concurrent_get_service_authenticates_once(self):
+        api = _make_api()
+        calls = self._count_authentications(api)
+        barrier = threading.Barrier(8)
+        services = []
+
+        def worker():
+            barrier.wait()
+            services.append(api.get_service(require_oauth=True))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(service) for service in services}), 1)
+
+    def test_concurrent_enrichment_authenticates_once(self):
+        api = _make_api()
+        calls = self._count_authentications(api)
+        playlists = [{"videos": [{"video_id": f"v{i}", "title": ""} for i in range(500)]}]
+
+        def get_videos_metadata(self, video_ids, use_batch=False, use_cache=True):
+            return {
+                video_id: {"title": f"title {video_id}", "description": "", "channel_title": "", "thumbnail": ""}
+                for video_id in video_ids
+            }
+
+        with mock.patch.object(youtube_api, "build_service", lambda **kwargs: object()), \
+                mock.patch.object(youtube_api.YouTubeAPI, "get_videos_metadata", get_videos_metadata):
+            stats = TakeoutParser(Path(".")).enrich_playlists(playlists, api, concurrency=4)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(stats["resolved_videos"], 500)
+
+
+@unittest.skipUnless(HAS_GOOGLE_CLIENT, "google-api-python-client가 설치되어 있지 않습니다.")
+class DiscoveryDocumentCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        cache_dir = Path(self.temp_dir.name)
+        self.cache_path = cache_dir / "youtube.v3.json"
+        patches = [
+            mock.patch.object(config, "DISCOVERY_CACHE_DIR", cache_dir),
+            mock.patch.dict(youtube_api._discovery_documents, clear=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_cache(self, library_version):
+        document = {"name": "youtube", "version": "v3", "stale": True}
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({"library_version": library_version, "document": document}, f)
+
+    def test_cache_from_same_library_version_is_used(self):
+        self._write_cache(youtube_api.GOOGLEAPICLIENT_VERSION)
+
+        self.assertTrue(youtube_api.load_discovery_document("youtube", "v3").get("stale"))
+
+    def test_cache_from_other_library_version_is_rebuilt(self):
+        self.assertTrue(youtube_api.GOOGLEAPICLIENT_VERSION)
+        self._write_cache("0.0.1")
+
+        document = youtube_api.load_discovery_document("youtube", "v3")
+
+        self.assertNotIn("stale", document)
+        self.assertIn("resources", document)
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        self.assertEqual(cached["library_version"], youtube_api.GOOGLEAPICLIENT_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()
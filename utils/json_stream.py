@@ -0,0 +1,138 @@
+"""
+Incremental reader for large playlist export JSON files.
+
+Exports are a single object whose bulk is one array ("videos" or "items").
+JSONArrayStream reads the file in chunks and decodes one array element at a
+time with json.JSONDecoder.raw_decode, so only the current element and a small
+read buffer are held in memory. The other top-level members (title,
+playlist_id, ...) are decoded normally and collected in ``header``.
+"""
+import json
+import re
+from typing import Any, Dict, Iterator, Optional, Sequence, TextIO
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that can continue a number raw_decode has already accepted ("12" of "12.5").
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+
+class JSONArrayStream:
+    """
+    Iterate the elements of the first top-level array member found under one
+    of ``array_keys``.
+
+    Members before the array are in ``header`` once iteration starts; members
+    after it are added when iteration finishes. ``array_key`` is the key that
+    was streamed (None if the object had no such array).
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        array_keys: Sequence[str] = ("items", "videos"),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.file = file
+        self.array_keys = tuple(array_keys)
+        self.chunk_size = chunk_size
+        self.header: Dict[str, Any] = {}
+        self.array_key: Optional[str] = None
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more input; returns False at end of file."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        # Grow reads with the pending data so one huge value is not re-parsed quadratically.
+        chunk = self.file.read(max(self.chunk_size, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of file"
+            raise ValueError(f"Invalid JSON: expected {' or '.join(map(repr, chars))}, found {found}")
+        self._pos += 1
+        return char
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number cut at the chunk edge decodes as a shorter valid number
+            # ("12" of "12.5", "1.5" of "1.5E+3"); re-decode it with more input.
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self._buffer) or self._buffer[end] in _NUMBER_CONTINUATION)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _read_member_key(self) -> str:
+        key = self._decode()
+        if not isinstance(key, str):
+            raise ValueError("Invalid JSON: object keys must be strings")
+        self._expect(":")
+        return key
+
+    def _read_members(self, stop_at_array: bool) -> bool:
+        """
+        Read object members into ``header`` until the object closes, or (when
+        stop_at_array) until positioned inside the streamed array.
+        """
+        while True:
+            if self._peek() == "}":
+                self._pos += 1
+                return False
+            key = self._read_member_key()
+            if stop_at_array and key in self.array_keys and self._peek() == "[":
+                self._pos += 1
+                self.array_key = key
+                return True
+            self.header[key] = self._decode()
+            if self._expect(",}") == "}":
+                return False
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if not self._read_members(stop_at_array=True):
+            return
+
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._decode()
+                if self._expect(",]") == "]":
+                    break
+
+        if self._expect(",}") == ",":
+            self._read_members(stop_at_array=False)
@@ -4,37 +4,142 @@ OAuth 2.0 인증 및 API 호출 처리
 """
 import os
 import json
-import time
 import ssl
+import threading
 from typing import List, Dict, Optional, Iterator
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document, V2_DISCOVERY_URI
 from googleapiclient.errors import HttpError
+from googleapiclient.version import __version__ as GOOGLEAPICLIENT_VERSION
 import httplib2
 import config
+from rate_limiter import TokenBucket, get_rate_limiter
+from retry_policy import NETWORK, ErrorClass, RetryPolicy, get_retry_policy
+from quota import QuotaLedger, get_quota_ledger, normalize_method
+from metadata_cache import VideoMetadataCache, get_metadata_cache
+from models import PlaylistItem
+from page_index import PageIndex
+
+
+# 프로세스 안에서 한 번만 읽은 discovery 문서 (서비스 이름, 버전)별
+_discovery_documents: Dict[tuple, Dict] = {}
+_discovery_lock = threading.Lock()
+
+
+def load_discovery_document(
+    service_name: str = config.YOUTUBE_API_SERVICE_NAME,
+    version: str = config.YOUTUBE_API_VERSION
+) -> Dict:
+    """
+    YouTube API discovery 문서 로드 (네트워크 없이 로컬에서)
+    
+    1. 프로세스 메모리 캐시
+    2. 디스크 캐시 (config.DISCOVERY_CACHE_DIR) - 라이브러리 버전과 API 버전이 같을 때만 사용
+    3. google-api-python-client에 포함된 정적 문서
+    4. (정적 문서가 없을 때만) discovery 엔드포인트에서 다운로드
+    
+    Returns:
+        파싱된 discovery 문서
+    """
+    key = (service_name, version)
+    with _discovery_lock:
+        document = _discovery_documents.get(key)
+        if document is not None:
+            return document
+        
+        cache_path = config.DISCOVERY_CACHE_DIR / f"{service_name}.{version}.json"
+        library_version = GOOGLEAPICLIENT_VERSION
+        document = None
+        
+        if cache_path.exists():
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                cached_document = cached.get("document", {})
+                if (cached.get("library_version") == library_version and
+                        cached_document.get("name") == service_name and
+                        cached_document.get("version") == version):
+                    document = cached_document
+            except (OSError, json.JSONDecodeError, AttributeError):
+                document = None
+        
+        if document is None:
+            content = discovery_cache.get_static_doc(service_name, version)
+            if content is None:
+                url = V2_DISCOVERY_URI.format(api=service_name, apiVersion=version)
+                resp, content = httplib2.Http().request(url)
+                if resp.status >= 400:
+                    raise Exception(f"discovery 문서 다운로드 실패: HTTP {resp.status} ({url})")
+            document = json.loads(content)
+            
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"library_version": library_version, "document": document}, f)
+            os.replace(tmp_path, cache_path)
+        
+        _discovery_documents[key] = document
+        return document
+
+
+def build_service(credentials=None, developer_key: Optional[str] = None):
+    """
+    캐시된 discovery 문서로 YouTube 서비스 객체 생성 (네트워크 요청 없음)
+    
+    Args:
+        credentials: OAuth 인증 정보
+        developer_key: API 키 (credentials가 없을 때)
+        
+    Returns:
+        YouTube API 서비스 객체 (호출마다 별도의 HTTP 연결 사용)
+    """
+    return build_from_document(
+        load_discovery_document(),
+        credentials=credentials,
+        developerKey=developer_key
+    )
 
 
 class YouTubeAPI:
     """YouTube Data API v3 클라이언트"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        quota_ledger: Optional[QuotaLedger] = None,
+        metadata_cache: Optional[VideoMetadataCache] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         """
         YouTube API 클라이언트 초기화
         
         Args:
             api_key: YouTube API 키 (선택사항, OAuth 사용 시 불필요)
                     개인 재생목록 조회를 위해서는 OAuth 2.0 인증이 필수입니다.
+            rate_limiter: API 호출 속도 제한기 (기본값: 프로세스 공용 제한기)
+            quota_ledger: 할당량 사용 기록 (기본값: 프로세스 공용 기록)
+            metadata_cache: 영상 메타데이터 캐시 (기본값: 프로세스 공용 캐시)
+            retry_policy: 요청 재시도 정책 (기본값: 차단기를 공유하는 프로세스 공용 정책)
         """
         self.api_key = api_key or config.YOUTUBE_API_KEY
         self.service = None
         self.credentials = None
         # OAuth 2.0을 기본 인증 방식으로 사용
         self.use_oauth = True
-        # 재시도 설정
-        self.max_retries = 5  # 재시도 횟수 증가
-        self.retry_delay = 3  # 초 (지연 시간 증가)
+        # 오류 종류별 재시도 (429/5xx/네트워크 오류만, 워커 간 차단기 공유)
+        self.retry_policy = retry_policy or get_retry_policy()
+        # 모든 API 호출은 같은 토큰 버킷을 거침 (config.API_RATE_LIMIT)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # 호출 종류별 할당량 사용량을 일별로 기록
+        self.quota_ledger = quota_ledger or get_quota_ledger()
+        # 여러 재생목록/실행에 걸쳐 같은 영상의 메타데이터를 재사용
+        self.metadata_cache = metadata_cache if metadata_cache is not None else get_metadata_cache()
+        # 여러 워커가 동시에 get_service()를 호출해도 인증(OAuth 흐름, token.json 기록)은 한 번만 수행
+        self._auth_lock = threading.Lock()
         
     def authenticate(self) -> bool:
         """
@@ -101,11 +206,7 @@ class YouTubeAPI:
         
         # credentials를 사용할 때는 http를 직접 전달하지 않음
         # google-auth-httplib2가 자동으로 처리함
-        self.service = build(
-            config.YOUTUBE_API_SERVICE_NAME,
-            config.YOUTUBE_API_VERSION,
-            credentials=creds
-        )
+        self.service = build_service(credentials=creds)
         return True
 
     def _token_has_required_scopes(self, token_file) -> bool:
@@ -140,84 +241,126 @@ class YouTubeAPI:
         Returns:
             YouTube API 서비스 객체
         """
-        if not self.service:
-            # OAuth 2.0을 기본 인증 방식으로 사용
-            if require_oauth or self.use_oauth:
-                if not self.authenticate():
-                    raise Exception(
-                        "YouTube API OAuth 인증 실패. "
-                        "개인 재생목록을 조회하려면 credentials.json 파일이 필요합니다. "
-                        "OAuth 동의 화면 설정도 확인해주세요. "
-                        "자세한 내용은 README.md를 참고하세요."
-                    )
-            elif self.api_key:
-                # API 키 사용 (공개 데이터만 조회 가능, 제한적 사용)
-                print("⚠️  경고: API 키만으로는 개인 재생목록을 조회할 수 없습니다.")
-                self.service = build(
-                    config.YOUTUBE_API_SERVICE_NAME,
-                    config.YOUTUBE_API_VERSION,
-                    developerKey=self.api_key
-                )
-            else:
-                # 인증 방법이 없는 경우 OAuth 강제
-                if not self.authenticate():
-                    raise Exception(
-                        "YouTube API 인증 실패. "
-                        "credentials.json 파일이 필요합니다. "
-                        "자세한 내용은 README.md를 참고하세요."
-                    )
+        if self.service:
+            return self.service
+        
+        with self._auth_lock:
+            if not self.service:
+                # OAuth 2.0을 기본 인증 방식으로 사용
+                if require_oauth or self.use_oauth:
+                    if not self.authenticate():
+                        raise Exception(
+                            "YouTube API OAuth 인증 실패. "
+                            "개인 재생목록을 조회하려면 credentials.json 파일이 필요합니다. "
+                            "OAuth 동의 화면 설정도 확인해주세요. "
+                            "자세한 내용은 README.md를 참고하세요."
+                        )
+                elif self.api_key:
+                    # API 키 사용 (공개 데이터만 조회 가능, 제한적 사용)
+                    print("⚠️  경고: API 키만으로는 개인 재생목록을 조회할 수 없습니다.")
+                    self.service = build_service(developer_key=self.api_key)
+                else:
+                    # 인증 방법이 없는 경우 OAuth 강제
+                    if not self.authenticate():
+                        raise Exception(
+                            "YouTube API 인증 실패. "
+                            "credentials.json 파일이 필요합니다. "
+                            "자세한 내용은 README.md를 참고하세요."
+                        )
         
         return self.service
-    
+
+    def clone_for_worker(self) -> "YouTubeAPI":
+        """
+        동시 추출 워커용 클라이언트 복제
+
+        인증 정보는 공유하지만 서비스 객체는 새로 생성하므로 워커마다
+        별도의 HTTP 연결을 사용합니다. (httplib2 연결은 스레드 간 공유 불가)
+
+        Returns:
+            새 HTTP 연결을 사용하는 YouTubeAPI 인스턴스
+        """
+        # 원본 클라이언트에서 먼저 인증을 끝내 두어 워커마다 OAuth 흐름이 열리지 않게 함
+        self.get_service(require_oauth=True)
+
+        worker = YouTubeAPI(
+            api_key=self.api_key,
+            rate_limiter=self.rate_limiter,
+            quota_ledger=self.quota_ledger,
+            metadata_cache=self.metadata_cache,
+            retry_policy=self.retry_policy
+        )
+        worker.use_oauth = self.use_oauth
+        worker.credentials = self.credentials
+        if self.credentials:
+            worker.service = build_service(credentials=self.credentials)
+        else:
+            worker.service = build_service(developer_key=self.api_key)
+        return worker
+
     def _execute_with_retry(self, request_func):
         """
-        재시도 로직이 포함된 API 요청 실행
+        재시도 정책에 따라 API 요청 실행
+        
+        429/rateLimitExceeded, 5xx/backendError, 네트워크 오류만 재시도하며
+        Retry-After 응답 헤더가 있으면 그 시간만큼, 없으면 지터를 준 지수 대기 후 재시도합니다.
+        quotaExceeded와 그 밖의 오류는 바로 발생시킵니다.
         
         Args:
             request_func: 요청 객체를 생성하는 함수 (매번 새로운 요청 생성)
             
         Returns:
             API 응답
+
+        Raises:
+            QuotaBudgetExceeded: 호출 시 일일 할당량 예산을 넘는 경우
         """
-        last_exception = None
+        def on_retry(attempt: int, delay: float, error_class: ErrorClass, error: Exception) -> None:
+            detail = f"HTTP {error_class.status} {error_class.reason}" if error_class.status else error_class.reason
+            print(f"  재시도 중... ({attempt}/{self.retry_policy.max_attempts}, {delay:.1f}초 대기, {detail})")
+            # 네트워크 오류가 반복되면 SSL 연결 초기화 (서비스 객체는 재생성하지 않음)
+            if error_class.kind == NETWORK and attempt >= 2:
+                self._reset_connections()
         
-        for attempt in range(self.max_retries):
-            try:
-                request = request_func()
-                return request.execute()
-            except (HttpError, ssl.SSLError, OSError, ConnectionError, Exception) as e:
-                last_exception = e
-                # SSL 오류나 연결 오류인 경우에만 재시도
-                error_str = str(e).lower()
-                is_retryable = (
-                    'ssl' in error_str or 
-                    'connection' in error_str or 
-                    'network' in error_str or
-                    'timeout' in error_str or
-                    'record layer' in error_str or
-                    isinstance(e, (ssl.SSLError, OSError, ConnectionError))
-                )
-                
-                if is_retryable and attempt < self.max_retries - 1:
-                    # Exponential backoff with jitter
-                    wait_time = self.retry_delay * (2 ** attempt) + (time.time() % 1)
-                    print(f"  재시도 중... ({attempt + 1}/{self.max_retries}, {wait_time:.1f}초 대기)")
-                    time.sleep(wait_time)
-                    # 재시도 전에 서비스 객체 재생성 (SSL 연결 초기화)
-                    if attempt >= 2:  # 세 번째 재시도부터
-                        try:
-                            # 서비스 객체만 초기화 (인증은 유지)
-                            if self.service:
-                                self.service = None
-                        except:
-                            pass
-                else:
-                    if attempt >= self.max_retries - 1:
-                        print(f"  최대 재시도 횟수 초과")
-                    raise
-        
-        raise last_exception
+        return self.retry_policy.execute(lambda: self._execute_request(request_func()), on_retry=on_retry)
     
+    def _reset_connections(self):
+        """
+        서비스 객체의 HTTP 연결만 닫아 다음 요청에서 새 연결을 맺도록 함
+        
+        인증 정보와 서비스 객체는 그대로 두므로 재시도 중에 재인증이나
+        서비스 재생성이 일어나지 않습니다.
+        """
+        http = getattr(self.service, "_http", None)
+        # AuthorizedHttp는 내부 httplib2.Http를 .http로 감싸고 있음
+        http = getattr(http, "http", http)
+        connections = getattr(http, "connections", None)
+        if not connections:
+            return
+        for connection in list(connections.values()):
+            try:
+                connection.close()
+            except Exception:
+                pass
+        connections.clear()
+
+    def _execute_request(self, request):
+        """
+        속도 제한과 할당량 기록을 거쳐 요청 1회 실행
+
+        서버가 처리한 요청(성공 또는 HttpError)은 모두 할당량을 소모하므로 기록합니다.
+        """
+        method = normalize_method(getattr(request, "methodId", None))
+        self.quota_ledger.check(method)
+        self.rate_limiter.acquire()
+        try:
+            response = request.execute()
+        except HttpError:
+            self.quota_ledger.record(method)
+            raise
+        self.quota_ledger.record(method)
+        return response
+
     def get_all_playlists(self) -> List[Dict]:
         """
         사용자의 모든 재생목록 조회 (Watch Later 포함)
@@ -253,7 +396,8 @@ class YouTubeAPI:
                         "description": item["snippet"].get("description", ""),
                         "thumbnail": item["snippet"]["thumbnails"].get("high", {}).get("url", ""),
                         "video_count": int(item["contentDetails"]["itemCount"]),
-                        "published_at": item["snippet"]["publishedAt"]
+                        "published_at": item["snippet"]["publishedAt"],
+                        "etag": item.get("etag", "")
                     })
                 
                 next_page_token = response.get("nextPageToken")
@@ -298,7 +442,8 @@ class YouTubeAPI:
                                         "description": item["snippet"].get("description", ""),
                                         "thumbnail": item["snippet"]["thumbnails"].get("high", {}).get("url", ""),
                                         "video_count": int(item["contentDetails"]["itemCount"]),
-                                        "published_at": item["snippet"]["publishedAt"]
+                                        "published_at": item["snippet"]["publishedAt"],
+                                        "etag": item.get("etag", "")
                                     })
                                     print(f"✓ Watch Later 재생목록 추가됨 (ID: {watch_later_id}, 영상 수: {item['contentDetails']['itemCount']})")
                                 else:
@@ -340,7 +485,8 @@ class YouTubeAPI:
                                         "description": item["snippet"].get("description", ""),
                                         "thumbnail": item["snippet"]["thumbnails"].get("high", {}).get("url", ""),
                                         "video_count": int(item["contentDetails"]["itemCount"]),
-                                        "published_at": item["snippet"]["publishedAt"]
+                                        "published_at": item["snippet"]["publishedAt"],
+                                        "etag": item.get("etag", "")
                                     })
                                     print(f"✓ Watch Later 재생목록 발견 및 추가됨 (ID: {playlist_id}, 제목: {item['snippet']['title']})")
                                     found_watch_later = True
@@ -365,6 +511,123 @@ class YouTubeAPI:
         
         return playlists
     
+    # videos.list 한 번에 조회할 수 있는 최대 영상 ID 수
+    VIDEOS_PER_REQUEST = 50
+    # HTTP 배치 요청 하나에 묶을 videos.list 호출 수
+    VIDEOS_LIST_PER_BATCH = 10
+
+    def get_videos_metadata(
+        self,
+        video_ids: List[str],
+        use_batch: bool = False,
+        use_cache: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        영상 ID 목록의 메타데이터를 videos.list로 조회 (50개씩 묶어서 요청)
+        
+        Args:
+            video_ids: 영상 ID 리스트 (중복은 호출 전에 제거하는 것을 권장)
+            use_batch: True면 여러 videos.list 호출을 HTTP 배치 요청 하나로 전송
+            use_cache: True면 메타데이터 캐시에 있는 영상은 API를 호출하지 않음
+            
+        Returns:
+            영상 ID별 메타데이터 (title, description, channel_title, thumbnail, published_at)
+            비공개/삭제된 영상은 결과에 포함되지 않음
+        """
+        metadata = {}
+        if use_cache:
+            metadata = self.metadata_cache.get_many(video_ids)
+            video_ids = [video_id for video_id in video_ids if video_id not in metadata]
+            if not video_ids:
+                return metadata
+        
+        fetched = self._fetch_videos_metadata(video_ids, use_batch)
+        self.metadata_cache.put_many(fetched)
+        metadata.update(fetched)
+        return metadata
+
+    def _fetch_videos_metadata(self, video_ids: List[str], use_batch: bool) -> Dict[str, Dict]:
+        """캐시를 거치지 않고 videos.list로 메타데이터 조회"""
+        service = self.get_service(require_oauth=True)
+        chunks = [
+            video_ids[i:i + self.VIDEOS_PER_REQUEST]
+            for i in range(0, len(video_ids), self.VIDEOS_PER_REQUEST)
+        ]
+        
+        def make_request(chunk):
+            return service.videos().list(
+                part="snippet",
+                id=",".join(chunk),
+                maxResults=self.VIDEOS_PER_REQUEST
+            )
+        
+        metadata = {}
+        if not use_batch:
+            for chunk in chunks:
+                response = self._execute_with_retry(lambda: make_request(chunk))
+                metadata.update(self._parse_videos_response(response))
+            return metadata
+        
+        for i in range(0, len(chunks), self.VIDEOS_LIST_PER_BATCH):
+            group = chunks[i:i + self.VIDEOS_LIST_PER_BATCH]
+            responses = self._execute_batch(service, [make_request(chunk) for chunk in group])
+            for chunk, response in zip(group, responses):
+                if response is None:
+                    # 배치 안에서 실패한 요청은 개별 요청으로 재시도
+                    response = self._execute_with_retry(lambda: make_request(chunk))
+                metadata.update(self._parse_videos_response(response))
+        return metadata
+
+    def _execute_batch(self, service, requests: List) -> List[Optional[Dict]]:
+        """
+        여러 요청을 HTTP 배치 요청 하나로 실행
+        
+        배치 안의 요청도 각각 할당량을 소모하므로 요청 수만큼 속도 제한 토큰을 받고 기록합니다.
+        
+        Returns:
+            요청 순서대로의 응답 리스트 (실패한 요청은 None)
+        """
+        methods = [normalize_method(getattr(request, "methodId", None)) for request in requests]
+        for method in methods:
+            self.quota_ledger.check(method)
+        self.rate_limiter.acquire(len(requests))
+        
+        responses: Dict[str, Optional[Dict]] = {}
+        
+        def callback(request_id, response, exception):
+            responses[request_id] = None if exception is not None else response
+        
+        batch = service.new_batch_http_request(callback=callback)
+        for index, request in enumerate(requests):
+            batch.add(request, request_id=str(index))
+        try:
+            batch.execute()
+        finally:
+            for method in methods:
+                self.quota_ledger.record(method)
+        return [responses.get(str(index)) for index in range(len(requests))]
+
+    @staticmethod
+    def _parse_videos_response(response: Dict) -> Dict[str, Dict]:
+        """videos.list 응답을 영상 ID별 메타데이터로 변환"""
+        metadata = {}
+        for item in response.get("items", []):
+            snippet = item.get("snippet", {})
+            thumbnails = snippet.get("thumbnails", {})
+            metadata[item["id"]] = {
+                "title": snippet.get("title", ""),
+                "description": snippet.get("description", ""),
+                "channel_title": snippet.get("channelTitle", ""),
+                "thumbnail": (
+                    thumbnails.get("high", {}).get("url") or
+                    thumbnails.get("medium", {}).get("url") or
+                    thumbnails.get("default", {}).get("url") or
+                    ""
+                ),
+                "published_at": snippet.get("publishedAt", "")
+            }
+        return metadata
+
     def get_playlist_videos(self, playlist_id: str) -> Iterator[Dict]:
         """
         재생목록의 모든 영상 조회 (페이지네이션 처리)
@@ -375,57 +638,139 @@ class YouTubeAPI:
         Yields:
             영상 정보 딕셔너리
         """
+        for page in self.iter_playlist_pages(playlist_id):
+            yield from page["videos"]
+
+    def iter_playlist_pages(
+        self,
+        playlist_id: str,
+        cached_pages: Optional[PageIndex] = None,
+        start_page_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        재생목록 영상을 페이지 단위로 조회
+        
+        cached_pages에 같은 페이지 토큰의 ETag가 있으면 If-None-Match 조건부 요청을
+        보내고, 304 Not Modified 응답이면 저장된 페이지를 그때 읽어 그대로 사용합니다.
+        
+        Args:
+            playlist_id: 재생목록 ID
+            cached_pages: 페이지 토큰별 이전 페이지 ETag 인덱스 (PlaylistSnapshotStore.cached_pages)
+            start_page_token: 이 페이지 토큰부터 조회 (체크포인트에서 이어받기)
+            
+        Yields:
+            페이지 딕셔너리 (page_token, etag, next_page_token, videos, not_modified)
+        """
         # OAuth 2.0 인증 사용 (기본값)
         service = self.get_service(require_oauth=True)
-        next_page_token = None
+        page_token = start_page_token
         
         try:
             while True:
-                response = self._execute_with_retry(
-                    lambda: service.playlistItems().list(
+                cached_etag = cached_pages.etag(page_token) if cached_pages is not None else None
+                
+                def make_request(page_token=page_token, cached_etag=cached_etag):
+                    request = service.playlistItems().list(
                         part="snippet,contentDetails",
                         playlistId=playlist_id,
                         maxResults=50,
-                        pageToken=next_page_token
+                        pageToken=page_token
                     )
-                )
+                    if cached_etag:
+                        request.headers["If-None-Match"] = cached_etag
+                    return request
                 
-                for item in response.get("items", []):
-                    # 삭제된 영상 처리
-                    if "contentDetails" not in item or "videoId" not in item["contentDetails"]:
-                        continue
-                    
-                    video_id = item["contentDetails"]["videoId"]
-                    snippet = item["snippet"]
-                    
-                    # 썸네일 우선순위: high > medium > default
-                    thumbnails = snippet.get("thumbnails", {})
-                    thumbnail_url = (
-                        thumbnails.get("high", {}).get("url") or
-                        thumbnails.get("medium", {}).get("url") or
-                        thumbnails.get("default", {}).get("url") or
-                        ""
-                    )
-                    
-                    yield {
-                        "playlist_item_id": item["id"],
-                        "video_id": video_id,
-                        "title": snippet.get("title", "제목 없음"),
-                        "description": snippet.get("description", ""),
-                        "thumbnail": thumbnail_url,
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                        "position": snippet.get("position", 0),
-                        "added_at": snippet.get("publishedAt", ""),
-                        "channel_title": snippet.get("videoOwnerChannelTitle", "")
+                try:
+                    response = self._execute_with_retry(make_request)
+                except HttpError as e:
+                    if not (cached_etag and getattr(e.resp, "status", None) == 304):
+                        raise
+                    # 변경 없음: 저장된 페이지 재사용
+                    page = {**cached_pages.load(page_token), "not_modified": True}
+                else:
+                    videos = [
+                        video for video in map(self._parse_playlist_item, response.get("items", []))
+                        if video is not None
+                    ]
+                    self._apply_metadata_cache(videos)
+                    page = {
+                        "page_token": page_token,
+                        "etag": response.get("etag", ""),
+                        "next_page_token": response.get("nextPageToken"),
+                        "videos": videos,
+                        "not_modified": False
                     }
                 
-                next_page_token = response.get("nextPageToken")
-                if not next_page_token:
-                    break
+                yield page
                 
-                # API 호출 간 지연 (Rate limiting 및 SSL 안정화)
-                time.sleep(0.3)
+                page_token = page.get("next_page_token")
+                if not page_token:
+                    break
                     
         except (HttpError, ssl.SSLError, OSError, ConnectionError) as e:
             print(f"재생목록 영상 조회 중 오류 발생 (재생목록 ID: {playlist_id}): {e}")
             raise
+
+    # 비공개/삭제된 영상의 playlistItems 응답에 들어오는 자리표시 제목
+    UNAVAILABLE_TITLES = frozenset({"Private video", "Deleted video"})
+    # playlistItems 응답에서 영상 자체의 정보로 캐시할 필드
+    CACHED_ITEM_FIELDS = ("title", "description", "channel_title", "thumbnail")
+
+    def _apply_metadata_cache(self, videos: List[Dict]) -> None:
+        """
+        playlistItems 페이지의 영상 정보를 메타데이터 캐시와 맞춤
+        
+        정상 영상의 정보는 캐시에 기록하고, 비공개/삭제되어 자리표시 제목만 남은
+        영상은 캐시에 남아 있는 마지막 정보로 채웁니다.
+        """
+        unavailable = [video for video in videos if video["title"] in self.UNAVAILABLE_TITLES]
+        unavailable_ids = {video["video_id"] for video in unavailable}
+        if unavailable:
+            cached = self.metadata_cache.get_many(
+                [video["video_id"] for video in unavailable],
+                fields=self.CACHED_ITEM_FIELDS
+            )
+            for video in unavailable:
+                video.update(cached.get(video["video_id"], {}))
+        
+        self.metadata_cache.put_many({
+            video["video_id"]: {field: video[field] for field in self.CACHED_ITEM_FIELDS}
+            for video in videos
+            if video["video_id"] not in unavailable_ids
+        })
+
+    @staticmethod
+    def _parse_playlist_item(item: Dict) -> Optional[Dict]:
+        """
+        playlistItems 응답 항목을 영상 정보 딕셔너리로 변환
+        
+        Returns:
+            영상 정보 딕셔너리 (삭제된 영상이면 None)
+        """
+        # 삭제된 영상 처리
+        if "contentDetails" not in item or "videoId" not in item["contentDetails"]:
+            return None
+        
+        video_id = item["contentDetails"]["videoId"]
+        snippet = item["snippet"]
+        
+        # 썸네일 우선순위: high > medium > default
+        thumbnails = snippet.get("thumbnails", {})
+        thumbnail_url = (
+            thumbnails.get("high", {}).get("url") or
+            thumbnails.get("medium", {}).get("url") or
+            thumbnails.get("default", {}).get("url") or
+            ""
+        )
+        
+        return PlaylistItem(
+            video_id,
+            "api",
+            playlist_item_id=item["id"],
+            title=snippet.get("title", "제목 없음"),
+            description=snippet.get("description", ""),
+            thumbnail=thumbnail_url,
+            position=snippet.get("position", 0),
+            added_at=snippet.get("publishedAt", ""),
+            channel_title=snippet.get("videoOwnerChannelTitle", "")
+        )